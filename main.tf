@@ -120,6 +120,7 @@ resource "aws_s3_bucket_server_side_encryption_configuration" "wind_data_encrypt
 }
 
 # S3 Bucket Lifecycle Policy for Wind Data (7-day retention)
+# Keep in sync with S3_RETENTION_DAYS in scripts/ingestion/weather/wind/config.py
 resource "aws_s3_bucket_lifecycle_configuration" "wind_data_lifecycle" {
   bucket = aws_s3_bucket.wind_data.id
 
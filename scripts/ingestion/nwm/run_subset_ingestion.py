@@ -171,8 +171,9 @@ def ingest_usgs_data() -> int:
                         fetched_at = EXCLUDED.fetched_at;
                 """)
 
-                for reading in all_readings:
-                    conn.execute(insert_sql, {
+                # Single executemany call (batched by the driver)
+                conn.execute(insert_sql, [
+                    {
                         'site_id': reading.site_id,
                         'parameter_cd': reading.parameter_cd,
                         'datetime': reading.datetime,
@@ -182,10 +183,10 @@ def ingest_usgs_data() -> int:
                         'qualifiers': reading.qualifiers,
                         'is_provisional': reading.is_provisional,
                         'fetched_at': fetched_at
-                    })
-
-                # Refresh materialized view
-                conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY usgs_latest_readings;"))
+                    }
+                    for reading in all_readings
+                ])
+                # usgs_latest_readings is kept current by trigger (no refresh)
 
         logger.info(f"✅ USGS Ingestion Complete: {len(all_readings)} readings stored")
         return len(all_readings)
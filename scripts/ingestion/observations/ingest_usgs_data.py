@@ -75,11 +75,11 @@ def store_usgs_data(conn, readings: List[USGSInstantaneousValue]) -> int:
             fetched_at = EXCLUDED.fetched_at;
     """)
 
-    count = 0
     fetched_at = datetime.utcnow()
 
-    for reading in readings:
-        conn.execute(insert_sql, {
+    # One executemany call (batched by the driver) instead of a round trip per reading
+    rows = [
+        {
             'site_id': reading.site_id,
             'parameter_cd': reading.parameter_cd,
             'datetime': reading.datetime,
@@ -89,27 +89,12 @@ def store_usgs_data(conn, readings: List[USGSInstantaneousValue]) -> int:
             'qualifiers': reading.qualifiers,
             'is_provisional': reading.is_provisional,
             'fetched_at': fetched_at
-        })
-        count += 1
+        }
+        for reading in readings
+    ]
+    conn.execute(insert_sql, rows)
 
-    return count
-
-
-def refresh_materialized_view(conn):
-    """Refresh the usgs_latest_readings materialized view."""
-    try:
-        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY usgs_latest_readings;"))
-        return True
-    except Exception as e:
-        # Fallback to non-concurrent refresh if concurrent fails
-        # (concurrent requires unique index which we have)
-        print(f"Warning: Concurrent refresh failed, trying non-concurrent: {e}")
-        try:
-            conn.execute(text("REFRESH MATERIALIZED VIEW usgs_latest_readings;"))
-            return True
-        except Exception as e2:
-            print(f"Error refreshing materialized view: {e2}")
-            return False
+    return len(rows)
 
 
 def ingest_usgs_data(parameter_codes: List[str] = None):
@@ -201,17 +186,10 @@ def ingest_usgs_data(parameter_codes: List[str] = None):
                 print("-" * 80)
 
                 stored_count = store_usgs_data(conn, all_readings)
+                # usgs_latest_readings is kept current by trigger (no refresh)
                 print(f"Stored {stored_count} readings in usgs_instantaneous_values table")
                 print()
 
-                # Step 5: Refresh materialized view
-                print("Refreshing materialized view...")
-                if refresh_materialized_view(conn):
-                    print("Materialized view refreshed successfully")
-                else:
-                    print("Warning: Could not refresh materialized view")
-                print()
-
             # Summary
             print("=" * 80)
             print("SUMMARY")
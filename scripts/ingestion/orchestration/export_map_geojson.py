@@ -4,8 +4,9 @@ Export map_current_conditions materialized view as GeoJSON.
 This script exports the map-ready hydrology data with flowline geometry
 as a GeoJSON file for use in mapping applications.
 
-The materialized view is automatically refreshed before export to ensure
-the most recent data is included.
+The materialized view is refreshed before export to ensure the most recent
+data is included. The refresh is a no-op when nothing new was ingested since
+the last one (e.g. by the pg_cron schedule set up in init_map_view.py).
 
 Based on EPIC 8 from IMPLEMENTATION_GUIDE.md
 
@@ -43,14 +44,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 def refresh_materialized_view(engine):
-    """Refresh the map_current_conditions materialized view with latest data."""
-    logger.info("Refreshing materialized view map_current_conditions...")
+    """
+    Refresh the map_current_conditions materialized view with latest data.
+
+    Staleness is decided by refresh_map_current_conditions() from the
+    hydro/temperature ingest watermarks, not by the age of the last refresh.
 
+    Args:
+        engine: SQLAlchemy engine
+    """
     try:
         with engine.begin() as conn:
-            # Refresh the materialized view
-            conn.execute(text("REFRESH MATERIALIZED VIEW map_current_conditions"))
-            logger.info("Materialized view refreshed successfully")
+            logger.info("Refreshing materialized view map_current_conditions...")
+            # Concurrent, delta-applying refresh; skipped if nothing new was ingested
+            refreshed = conn.execute(text("SELECT refresh_map_current_conditions()")).scalar()
+            if refreshed:
+                logger.info("Materialized view refreshed successfully")
+            else:
+                logger.info("Materialized view already up to date (or being refreshed by another session)")
     except Exception as e:
         logger.error(f"Error refreshing materialized view: {e}")
         raise
@@ -9,7 +9,10 @@ Workflow:
 2. Load new NHD hydrology data from GeoJSON
 3. Extract reach centroids for temperature API
 4. Ingest NWM hydrology data (filtered by loaded NHD reaches)
-5. Ingest temperature data from Open-Meteo API
+5. Ingest temperature data from Open-Meteo API (runs concurrently with step 4)
+
+Bulk-load steps should write through src/database/bulk_copy.py (COPY FROM STDIN)
+rather than row-by-row INSERTs; insert time dominates this workflow.
 
 Usage:
     python scripts/production/reset_and_repopulate_db.py \
@@ -27,12 +30,14 @@ Options:
     --skip-confirmation: Skip the confirmation prompt (use with caution!)
     --skip-nwm: Skip NWM hydrology ingestion
     --skip-temperature: Skip temperature ingestion
+    --swap-load: Load NHD data into staging tables and swap them in atomically
 """
 
 import os
 import sys
 import argparse
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -44,25 +49,96 @@ from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from dotenv import load_dotenv
 
 
+# Child script locations (computed once at import)
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent
+LOAD_NHD_SCRIPT = SCRIPTS_DIR / "ingestion" / "spatial" / "load_nhd_data.py"
+INIT_CENTROIDS_SCRIPT = SCRIPTS_DIR / "setup" / "init_nhd_centroids.py"
+INGEST_TEMPERATURE_SCRIPT = SCRIPTS_DIR / "ingestion" / "weather" / "ingest_temperature.py"
+SUBSET_INGESTION_CANDIDATES = [
+    SCRIPTS_DIR / "ingestion" / "nwm" / "run_subset_ingestion.py",
+    SCRIPTS_DIR / "dev" / "run_subset_ingestion.py",
+    SCRIPTS_DIR / "tests" / "run_subset_ingestion.py",
+]
+
+
+def _find_subset_ingestion_script() -> Optional[Path]:
+    """Return the first existing run_subset_ingestion.py location, if any."""
+    for candidate in SUBSET_INGESTION_CANDIDATES:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+SUBSET_INGESTION_SCRIPT = _find_subset_ingestion_script()
+
+# NHD tables rebuilt by --swap-load (parents before children)
+NHD_SWAP_TABLES = ['nhd.flowlines', 'nhd.network_topology', 'nhd.flow_statistics']
+NHD_SWAP_CLEAR_EXCLUDE = {'nhd_flowlines', 'nhd_network_topology', 'nhd_flow_statistics'}
+SWAP_SUFFIX = '_new'
+
+# Shared connection reused by the clear and verification steps
+_CONN = None
+
+
 def get_db_connection():
-    """Get database connection from environment variables."""
+    """
+    Get the shared database connection, opening it on first use.
+
+    Connection parameters come from environment variables.
+    """
+    global _CONN
+    if _CONN is not None and not _CONN.closed:
+        return _CONN
+
     load_dotenv()
 
     db_url = os.getenv("DATABASE_URL")
     if db_url:
-        return psycopg2.connect(db_url)
-
-    # Fallback to individual parameters
-    return psycopg2.connect(
-        host=os.getenv("DATABASE_HOST", "localhost"),
-        port=os.getenv("DATABASE_PORT", "5432"),
-        dbname=os.getenv("DATABASE_NAME", "fnwm"),
-        user=os.getenv("DATABASE_USER", "fnwm_user"),
-        password=os.getenv("DATABASE_PASSWORD")
-    )
+        _CONN = psycopg2.connect(db_url)
+    else:
+        # Fallback to individual parameters
+        _CONN = psycopg2.connect(
+            host=os.getenv("DATABASE_HOST", "localhost"),
+            port=os.getenv("DATABASE_PORT", "5432"),
+            dbname=os.getenv("DATABASE_NAME", "fnwm"),
+            user=os.getenv("DATABASE_USER", "fnwm_user"),
+            password=os.getenv("DATABASE_PASSWORD")
+        )
+
+    return _CONN
+
+
+def close_db_connection():
+    """Close the shared database connection if it is open."""
+    global _CONN
+    if _CONN is not None and not _CONN.closed:
+        _CONN.close()
+    _CONN = None
+
+
+def enable_replica_mode(cursor) -> bool:
+    """
+    Disable trigger and FK firing for the rest of the current transaction.
+
+    SET session_replication_role needs superuser (or rds_superuser) rights,
+    so the attempt runs inside a savepoint and is quietly abandoned if the
+    role is not allowed to change it. SET LOCAL reverts on commit/rollback.
+
+    Returns:
+        bool: True if replica mode was enabled
+    """
+    cursor.execute("SAVEPOINT replica_mode")
+    try:
+        cursor.execute("SET LOCAL session_replication_role = replica")
+    except psycopg2.Error:
+        cursor.execute("ROLLBACK TO SAVEPOINT replica_mode")
+        return False
 
+    cursor.execute("RELEASE SAVEPOINT replica_mode")
+    return True
 
-def clear_all_tables(conn, skip_confirmation: bool = False):
+
+def clear_all_tables(conn, skip_confirmation: bool = False, exclude: Optional[set] = None):
     """
     Clear all tables in the database.
 
@@ -71,6 +147,7 @@ def clear_all_tables(conn, skip_confirmation: bool = False):
 
     Tables cleared (in order):
     - temperature_timeseries
+    - temperature_latest
     - nhd_reach_centroids
     - computed_scores
     - user_observations
@@ -80,13 +157,18 @@ def clear_all_tables(conn, skip_confirmation: bool = False):
     - nhd_flow_statistics
     - nhd_flowlines
     - reach_metadata
+
+    Tables named in `exclude` are left untouched (used by --swap-load, which
+    replaces the NHD tables instead of truncating them).
     """
     cursor = conn.cursor()
+    exclude = exclude or set()
 
     # Get table counts for user information
     tables_info = []
     table_names = [
         'temperature_timeseries',
+        'temperature_latest',
         'nhd_reach_centroids',
         'computed_scores',
         'user_observations',
@@ -97,18 +179,23 @@ def clear_all_tables(conn, skip_confirmation: bool = False):
         'nhd_flowlines',
         'reach_metadata'
     ]
+    table_names = [t for t in table_names if t not in exclude]
 
     print("\n" + "="*80)
     print("DATABASE RESET - CURRENT TABLE STATUS")
     print("="*80)
 
+    existing_tables = set()
     for table in table_names:
         try:
             cursor.execute(f"SELECT COUNT(*) FROM {table}")
             count = cursor.fetchone()[0]
             tables_info.append((table, count))
+            existing_tables.add(table)
             print(f"  {table:30s} : {count:>12,} rows")
         except psycopg2.Error:
+            # Clear the aborted transaction so the remaining counts still run
+            conn.rollback()
             tables_info.append((table, 0))
             print(f"  {table:30s} : (table doesn't exist)")
 
@@ -118,6 +205,8 @@ def clear_all_tables(conn, skip_confirmation: bool = False):
 
     if total_rows == 0:
         print("\nAll tables are already empty. Nothing to clear.")
+        # End the count transaction so no locks are held while child scripts run
+        conn.rollback()
         return
 
     # Confirmation prompt
@@ -135,6 +224,7 @@ def clear_all_tables(conn, skip_confirmation: bool = False):
     # Truncate tables in correct order (children before parents due to FKs)
     truncate_order = [
         'temperature_timeseries',
+        'temperature_latest',
         'nhd_reach_centroids',
         'computed_scores',
         'user_observations',
@@ -145,36 +235,37 @@ def clear_all_tables(conn, skip_confirmation: bool = False):
         'nhd_flowlines',
         'reach_metadata'
     ]
+    truncate_order = [t for t in truncate_order if t in existing_tables]
 
-    for table in truncate_order:
-        try:
-            # Use TRUNCATE CASCADE for speed and to reset sequences
-            cursor.execute(f"TRUNCATE TABLE {table} CASCADE")
+    if enable_replica_mode(cursor):
+        print("  (session_replication_role = replica: triggers and FK checks skipped)")
+
+    # One TRUNCATE for every table: a single lock/FK pass, resets sequences
+    cursor.execute(f"TRUNCATE TABLE {', '.join(truncate_order)} CASCADE")
+
+    for table in table_names:
+        if table in existing_tables:
             print(f"  * Cleared {table}")
-        except psycopg2.Error as e:
-            # Table might not exist, which is fine
-            print(f"  - Skipped {table} ({e.pgerror.split(':')[0] if e.pgerror else 'does not exist'})")
+        else:
+            print(f"  - Skipped {table} (does not exist)")
 
     conn.commit()
     print("\nAll tables cleared successfully!\n")
 
 
-def verify_nhd_data_loaded():
+def verify_nhd_data_loaded(conn):
     """Verify that NHD data was successfully loaded into the database."""
-    conn = get_db_connection()
     cursor = conn.cursor()
 
     try:
-        cursor.execute("SELECT COUNT(*) FROM nhd.flowlines")
-        flowline_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM nhd.network_topology")
-        topology_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM nhd.flow_statistics")
-        stats_count = cursor.fetchone()[0]
-
-        conn.close()
+        # One round-trip for all three counts
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM nhd.flowlines),
+                (SELECT COUNT(*) FROM nhd.network_topology),
+                (SELECT COUNT(*) FROM nhd.flow_statistics)
+        """)
+        flowline_count, topology_count, stats_count = cursor.fetchone()
 
         if flowline_count == 0:
             print("ERROR: No data found in nhd_flowlines table!")
@@ -190,19 +281,20 @@ def verify_nhd_data_loaded():
 
     except psycopg2.Error as e:
         print(f"ERROR: Error verifying NHD data: {e}")
-        conn.close()
         return False
 
+    finally:
+        # End the read transaction so no locks are held while child scripts run
+        conn.rollback()
+
 
-def verify_centroids_created():
+def verify_centroids_created(conn):
     """Verify that reach centroids were successfully created."""
-    conn = get_db_connection()
     cursor = conn.cursor()
 
     try:
         cursor.execute("SELECT COUNT(*) FROM nhd.reach_centroids")
         centroid_count = cursor.fetchone()[0]
-        conn.close()
 
         if centroid_count == 0:
             print("WARNING: No centroids found in nhd_reach_centroids table!")
@@ -214,12 +306,27 @@ def verify_centroids_created():
 
     except psycopg2.Error as e:
         print(f"WARNING: Could not verify centroids: {e}")
-        conn.close()
         return False
 
+    finally:
+        conn.rollback()
+
 
-def load_nhd_data(geojson_path: str):
-    """Load NHD data from GeoJSON file."""
+def run_script(cmd):
+    """
+    Run a child script with inherited stdin/stdout/stderr.
+
+    close_fds=False, an absolute executable path and no cwd/preexec_fn/new
+    session are the preconditions for CPython to launch via posix_spawn
+    instead of fork+exec, which avoids duplicating this process's page
+    tables. Python-created descriptors are non-inheritable (PEP 446) and
+    libpq marks its sockets close-on-exec, so nothing leaks into the child.
+    """
+    return subprocess.run(cmd, close_fds=False)
+
+
+def load_nhd_data(geojson_path: str, table_suffix: str = ""):
+    """Load NHD data from GeoJSON file (optionally into suffixed staging tables)."""
     print("="*80)
     print("STEP 1: LOADING NHD HYDROLOGY DATA")
     print("="*80)
@@ -229,11 +336,11 @@ def load_nhd_data(geojson_path: str):
         print(f"ERROR: GeoJSON file not found: {geojson_path}")
         sys.exit(1)
 
-    script_path = Path(__file__).parent / "load_nhd_data.py"
-    result = subprocess.run(
-        [sys.executable, str(script_path), geojson_path],
-        capture_output=False
-    )
+    cmd = [sys.executable, str(LOAD_NHD_SCRIPT), geojson_path]
+    if table_suffix:
+        cmd.append(f"--table-suffix={table_suffix}")
+
+    result = run_script(cmd)
 
     if result.returncode != 0:
         print("\nERROR: NHD data loading failed!")
@@ -242,6 +349,207 @@ def load_nhd_data(geojson_path: str):
     print("\nNHD data loaded successfully!\n")
 
 
+def prepare_swap_tables(conn):
+    """
+    Create empty staging copies of the NHD tables for --swap-load.
+
+    Staging tables copy everything except indexes (defaults, CHECK
+    constraints and generated-column expressions) and get only a primary
+    key (the loader upserts on nhdplusid) plus the source table's triggers.
+    Secondary indexes are built after the load by build_swap_indexes.
+    """
+    cursor = conn.cursor()
+
+    for table in NHD_SWAP_TABLES:
+        staging = table + SWAP_SUFFIX
+        cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+        cursor.execute(
+            f"CREATE TABLE {staging} (LIKE {table} INCLUDING ALL EXCLUDING INDEXES)"
+        )
+        cursor.execute(f"ALTER TABLE {staging} ADD PRIMARY KEY (nhdplusid)")
+
+        # Copy user triggers (e.g. derived-metric computation on flowlines)
+        cursor.execute("""
+            SELECT pg_get_triggerdef(oid)
+            FROM pg_trigger
+            WHERE tgrelid = %s::regclass AND NOT tgisinternal
+        """, (table,))
+        for (trigger_def,) in cursor.fetchall():
+            cursor.execute(trigger_def.replace(f" ON {table} ", f" ON {staging} ", 1))
+
+        print(f"  * Created staging table {staging}")
+
+    conn.commit()
+
+
+def build_swap_indexes(conn):
+    """
+    Build the NHD secondary indexes on the loaded staging tables.
+
+    Index definitions are read from the live tables and recreated under a
+    suffixed name; swap_nhd_tables renames them back.
+    """
+    cursor = conn.cursor()
+
+    for table in NHD_SWAP_TABLES:
+        staging = table + SWAP_SUFFIX
+        cursor.execute("""
+            SELECT c.relname, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE i.indrelid = %s::regclass AND NOT i.indisprimary
+        """, (table,))
+
+        for index_name, index_def in cursor.fetchall():
+            cursor.execute(
+                index_def
+                .replace(f" INDEX {index_name} ", f" INDEX {index_name}{SWAP_SUFFIX} ", 1)
+                .replace(f" ON {table} ", f" ON {staging} ", 1)
+            )
+
+        cursor.execute(f"ANALYZE {staging}")
+        print(f"  * Indexed and analyzed {staging}")
+
+    conn.commit()
+
+
+def check_generated_columns(cursor, generated_columns):
+    """
+    Check that generated columns survived the swap and were populated.
+
+    Raises RuntimeError if a column recorded on the old table is no longer
+    generated, or is NULL on every row of a non-empty table.
+    """
+    for table, column in generated_columns:
+        schema, table_name = table.split('.')
+        cursor.execute("""
+            SELECT is_generated
+            FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s AND column_name = %s
+        """, (schema, table_name, column))
+        row = cursor.fetchone()
+        if row is None or row[0] != 'ALWAYS':
+            raise RuntimeError(f"{table}.{column} is no longer a generated column after the swap")
+
+        cursor.execute(f"SELECT COUNT(*), COUNT({column}) FROM {table}")
+        total, populated = cursor.fetchone()
+        if total and not populated:
+            raise RuntimeError(f"{table}.{column} is NULL on every row after the swap")
+
+
+def swap_nhd_tables(conn):
+    """
+    Atomically replace the live NHD tables with the loaded staging tables.
+
+    Foreign keys to and from the NHD tables are recorded, dropped with the
+    old tables and re-created against the new ones. Views and materialized
+    views on the NHD tables (e.g. map_current_conditions) are dropped by the
+    CASCADE and re-created from their recorded definitions and indexes in
+    the same transaction; grants and comments on them are not carried over.
+    Generated columns are checked before commit, so a swap that would leave
+    them empty rolls back.
+    """
+    cursor = conn.cursor()
+
+    try:
+        # Views and materialized views (including views on those views) are
+        # dropped by the CASCADE below; record them, shallowest first, so
+        # they can be re-created on the new tables in the same transaction
+        cursor.execute("""
+            WITH RECURSIVE deps AS (
+                SELECT v.oid, 1 AS depth
+                FROM pg_depend d
+                JOIN pg_rewrite r ON r.oid = d.objid
+                JOIN pg_class v ON v.oid = r.ev_class
+                WHERE d.refobjid = ANY(%s::regclass[]) AND v.oid <> d.refobjid
+                UNION
+                SELECT v.oid, deps.depth + 1
+                FROM deps
+                JOIN pg_depend d ON d.refobjid = deps.oid
+                JOIN pg_rewrite r ON r.oid = d.objid
+                JOIN pg_class v ON v.oid = r.ev_class
+                WHERE v.oid <> d.refobjid
+            )
+            SELECT
+                c.oid::regclass::text,
+                c.relkind,
+                pg_get_viewdef(c.oid),
+                ARRAY(SELECT pg_get_indexdef(i.indexrelid)
+                      FROM pg_index i WHERE i.indrelid = c.oid)
+            FROM (SELECT oid, MAX(depth) AS depth FROM deps GROUP BY oid) d
+            JOIN pg_class c ON c.oid = d.oid
+            ORDER BY d.depth
+        """, (NHD_SWAP_TABLES,))
+        dependent_views = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE contype = 'f'
+              AND (conrelid = ANY(%s::regclass[]) OR confrelid = ANY(%s::regclass[]))
+        """, (NHD_SWAP_TABLES, NHD_SWAP_TABLES))
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT table_schema || '.' || table_name, column_name
+            FROM information_schema.columns
+            WHERE is_generated = 'ALWAYS'
+              AND table_schema || '.' || table_name = ANY(%s)
+        """, (NHD_SWAP_TABLES,))
+        generated_columns = cursor.fetchall()
+
+        renames = []
+        for table in NHD_SWAP_TABLES:
+            cursor.execute("""
+                SELECT c.relname, i.indisprimary
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE i.indrelid = %s::regclass
+            """, (table,))
+            old_indexes = cursor.fetchall()
+
+            cursor.execute("""
+                SELECT c.relname
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE i.indrelid = %s::regclass AND i.indisprimary
+            """, (table + SWAP_SUFFIX,))
+            staging_pkey = cursor.fetchone()[0]
+
+            renames.append((table, old_indexes, staging_pkey))
+
+        # Children first so only cross-table FKs are cascaded away
+        cursor.execute(f"DROP TABLE {', '.join(reversed(NHD_SWAP_TABLES))} CASCADE")
+
+        schema = NHD_SWAP_TABLES[0].split('.')[0]
+        for table, old_indexes, staging_pkey in renames:
+            table_name = table.split('.')[1]
+            cursor.execute(f"ALTER TABLE {table}{SWAP_SUFFIX} RENAME TO {table_name}")
+            for index_name, is_primary in old_indexes:
+                current = staging_pkey if is_primary else index_name + SWAP_SUFFIX
+                cursor.execute(f"ALTER INDEX {schema}.{current} RENAME TO {index_name}")
+
+        for owner, constraint_name, constraint_def in foreign_keys:
+            cursor.execute(f"ALTER TABLE {owner} ADD CONSTRAINT {constraint_name} {constraint_def}")
+
+        for view_name, relkind, definition, index_defs in dependent_views:
+            kind = "MATERIALIZED VIEW" if relkind == 'm' else "VIEW"
+            cursor.execute(f"CREATE {kind} {view_name} AS {definition.rstrip().rstrip(';')}")
+            for index_def in index_defs:
+                cursor.execute(index_def)
+            print(f"  * Re-created {kind.lower()} {view_name}")
+
+        check_generated_columns(cursor, generated_columns)
+
+        conn.commit()
+
+    except Exception:
+        conn.rollback()
+        raise
+
+    print("  * Swapped staging tables into place")
+
+
 def extract_centroids():
     """Extract reach centroids from NHD flowlines."""
     print("="*80)
@@ -249,11 +557,7 @@ def extract_centroids():
     print("="*80)
     print("Extracting lat/lon centroids from nhd.flowlines for temperature API...\n")
 
-    script_path = Path(__file__).parent.parent / "setup" / "init_nhd_centroids.py"
-    result = subprocess.run(
-        [sys.executable, str(script_path)],
-        capture_output=False
-    )
+    result = run_script([sys.executable, str(INIT_CENTROIDS_SCRIPT)])
 
     if result.returncode != 0:
         print("\nERROR: Centroid extraction failed!")
@@ -278,21 +582,12 @@ def ingest_nwm_data():
     print("Running subset ingestion (filtered by loaded NHD reaches)...")
     print("NOTE: NWM data will be filtered to match feature IDs in nhd_flowlines table.\n")
 
-    script_path = Path(__file__).parent.parent / "dev" / "run_subset_ingestion.py"
-
-    # Check if file was moved to tests directory (based on git status)
-    if not os.path.exists(script_path):
-        script_path = Path(__file__).parent.parent / "tests" / "run_subset_ingestion.py"
-
-    if not os.path.exists(script_path):
+    if SUBSET_INGESTION_SCRIPT is None:
         print(f"ERROR: run_subset_ingestion.py not found!")
-        print(f"   Looked in: scripts/dev/ and scripts/tests/")
+        print(f"   Looked in: scripts/ingestion/nwm/, scripts/dev/ and scripts/tests/")
         sys.exit(1)
 
-    result = subprocess.run(
-        [sys.executable, str(script_path)],
-        capture_output=False
-    )
+    result = run_script([sys.executable, str(SUBSET_INGESTION_SCRIPT)])
 
     if result.returncode != 0:
         print("\nWARNING: NWM ingestion completed with errors (check logs)")
@@ -313,7 +608,7 @@ def ingest_temperature(
 
     cmd = [
         sys.executable,
-        str(Path(__file__).parent / "ingest_temperature.py"),
+        str(INGEST_TEMPERATURE_SCRIPT),
         f"--forecast-days={forecast_days}",
         f"--batch-size={batch_size}",
         f"--delay={delay}"
@@ -327,7 +622,7 @@ def ingest_temperature(
 
     print(f"Forecast days: {forecast_days}, Batch size: {batch_size}, Delay: {delay}s\n")
 
-    result = subprocess.run(cmd, capture_output=False)
+    result = run_script(cmd)
 
     if result.returncode != 0:
         print("\nWARNING: Temperature ingestion completed with errors (check logs)")
@@ -352,6 +647,9 @@ Examples:
 
   # Temperature for specific number of reaches
   python reset_and_repopulate_db.py --nhd-geojson "data.geojson" --temp-reaches 50
+
+  # Rebuild NHD tables off to the side and swap them in
+  python reset_and_repopulate_db.py --nhd-geojson "data.geojson" --swap-load
         """
     )
 
@@ -399,6 +697,12 @@ Examples:
         action="store_true",
         help="Skip temperature ingestion"
     )
+    parser.add_argument(
+        "--swap-load",
+        action="store_true",
+        help="Load NHD data into staging tables, index them, then swap them in "
+             "atomically instead of truncating and reloading in place"
+    )
 
     args = parser.parse_args()
 
@@ -409,15 +713,27 @@ Examples:
     try:
         # Step 0: Clear existing data
         conn = get_db_connection()
-        clear_all_tables(conn, skip_confirmation=args.skip_confirmation)
-        conn.close()
+        clear_all_tables(
+            conn,
+            skip_confirmation=args.skip_confirmation,
+            exclude=NHD_SWAP_CLEAR_EXCLUDE if args.swap_load else None
+        )
 
         # Step 1: Load NHD data
-        load_nhd_data(args.nhd_geojson)
+        if args.swap_load:
+            print("Preparing NHD staging tables (--swap-load)...")
+            prepare_swap_tables(conn)
+            load_nhd_data(args.nhd_geojson, table_suffix=SWAP_SUFFIX)
+            print("Building indexes on NHD staging tables...")
+            build_swap_indexes(conn)
+            swap_nhd_tables(conn)
+            print()
+        else:
+            load_nhd_data(args.nhd_geojson)
 
         # Verification: Ensure NHD data was loaded successfully
         print()
-        if not verify_nhd_data_loaded():
+        if not verify_nhd_data_loaded(conn):
             print("\nERROR: NHD data verification failed!")
             print("   Cannot proceed with NWM ingestion without NHD feature IDs.")
             sys.exit(1)
@@ -428,25 +744,38 @@ Examples:
 
         # Verification: Ensure centroids were created
         print()
-        verify_centroids_created()
+        verify_centroids_created(conn)
         print()
 
-        # Step 3: Ingest NWM data (optional)
-        if not args.skip_nwm:
-            ingest_nwm_data()
-        else:
-            print("SKIPPED: NWM ingestion (--skip-nwm flag)\n")
-
-        # Step 4: Ingest temperature data (optional)
-        if not args.skip_temperature:
-            ingest_temperature(
-                reaches=args.temp_reaches,
-                forecast_days=args.temp_forecast_days,
-                batch_size=args.temp_batch_size,
-                delay=args.temp_delay
-            )
-        else:
-            print("SKIPPED: Temperature ingestion (--skip-temperature flag)\n")
+        # The shared connection is not needed past this point; close it so
+        # worker processes never inherit an open psycopg2 connection
+        close_db_connection()
+
+        # Steps 3 and 4 only depend on Steps 1-2, not on each other, so the
+        # NWM downloads and Open-Meteo requests run side by side
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = []
+
+            # Step 3: Ingest NWM data (optional)
+            if not args.skip_nwm:
+                futures.append(executor.submit(ingest_nwm_data))
+            else:
+                print("SKIPPED: NWM ingestion (--skip-nwm flag)\n")
+
+            # Step 4: Ingest temperature data (optional)
+            if not args.skip_temperature:
+                futures.append(executor.submit(
+                    ingest_temperature,
+                    reaches=args.temp_reaches,
+                    forecast_days=args.temp_forecast_days,
+                    batch_size=args.temp_batch_size,
+                    delay=args.temp_delay
+                ))
+            else:
+                print("SKIPPED: Temperature ingestion (--skip-temperature flag)\n")
+
+            for future in as_completed(futures):
+                future.result()
 
         # Success summary
         print("\n" + "="*80)
@@ -470,6 +799,8 @@ Examples:
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        close_db_connection()
 
 
 if __name__ == "__main__":
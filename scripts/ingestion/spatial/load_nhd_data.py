@@ -6,7 +6,8 @@ Reads NHDPlus v2.1 flowline GeoJSON and inserts into the database schema.
 This script:
 1. Reads GeoJSON file
 2. Parses features and properties
-3. Inserts into normalized tables (nhd_flowlines, nhd_network_topology, nhd_flow_statistics)
+3. Copies them into temp staging tables with COPY and merges into the normalized
+   tables (nhd_flowlines, nhd_network_topology, nhd_flow_statistics)
 4. Creates spatial indexes
 5. Validates data integrity
 
@@ -19,17 +20,23 @@ Example:
 
 import json
 import logging
+import math
 import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path (for src imports)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+# Add scripts/setup to path (schema helpers)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'setup'))
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 
+from init_nhd_schema import finalize_nhd_indexes
+from src.database.bulk_copy import copy_csv
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -53,6 +60,50 @@ load_dotenv()
 # but the system expects m³/s (cubic meters per second)
 CFS_TO_M3S = 35.3147  # 1 m³/s = 35.3147 CFS
 
+# Ranges of the integer column types
+SMALLINT = (-2**15, 2**15 - 1)
+INTEGER = (-2**31, 2**31 - 1)
+BIGINT = (-2**63, 2**63 - 1)
+
+# Copied columns of each table, in COPY order, mapped to their type: an
+# integer range, a VARCHAR(n) limit, or float. Values are coerced per
+# feature (see coerce_row) so that a malformed value rejects that one
+# feature instead of failing the whole COPY.
+FLOWLINE_COLUMNS = {
+    'nhdplusid': BIGINT, 'permanent_identifier': 50, 'gnis_id': 20,
+    'gnis_name': 255, 'reachcode': 14, 'lengthkm': float, 'areasqkm': float,
+    'totdasqkm': float, 'divdasqkm': float, 'streamorde': SMALLINT,
+    'streamleve': SMALLINT, 'streamcalc': SMALLINT, 'ftype': INTEGER,
+    'fcode': INTEGER, 'slope': float, 'slopelenkm': float,
+    'maxelevraw': INTEGER, 'minelevraw': INTEGER, 'maxelevsmo': INTEGER,
+    'minelevsmo': INTEGER, 'vpuid': 4, 'statusflag': 1, 'fdate': BIGINT,
+    'resolution': SMALLINT,
+}
+
+TOPOLOGY_COLUMNS = {
+    'nhdplusid': BIGINT, 'fromnode': BIGINT, 'tonode': BIGINT,
+    'hydroseq': BIGINT, 'levelpathi': BIGINT, 'terminalpa': BIGINT,
+    'uphydroseq': BIGINT, 'uplevelpat': BIGINT, 'dnhydroseq': BIGINT,
+    'dnlevelpat': BIGINT, 'dnminorhyd': BIGINT, 'dndraincou': SMALLINT,
+    'pathlength': float, 'arbolatesu': float, 'startflag': SMALLINT,
+    'terminalfl': SMALLINT, 'divergence': SMALLINT, 'mainpath': SMALLINT,
+    'innetwork': SMALLINT, 'frommeas': float, 'tomeas': float,
+}
+
+STATS_COLUMNS = {
+    'nhdplusid': BIGINT,
+    **{column: float for column in (
+        'qama', 'qbma', 'qcma', 'qdma', 'qema', 'qfma',
+        'qincrama', 'qincrbma', 'qincrcma', 'qincrdma', 'qincrema', 'qincrfma',
+        'vama', 'vbma', 'vcma', 'vdma', 'vema',
+    )},
+    'gageidma': 20, 'gageqma': float, 'gageadjma': SMALLINT,
+}
+
+# NOT NULL columns of each table (a NULL would abort the whole merge)
+FLOWLINE_REQUIRED = ('nhdplusid', 'permanent_identifier', 'reachcode', 'lengthkm', 'totdasqkm')
+TOPOLOGY_REQUIRED = ('nhdplusid', 'hydroseq', 'levelpathi', 'terminalpa')
+
 
 def convert_flow_cfs_to_m3s(value_cfs):
     """
@@ -72,6 +123,30 @@ def convert_flow_cfs_to_m3s(value_cfs):
         return None
 
 
+def format_line_coords(coords):
+    """
+    Format LineString positions as WKT, rejecting lines PostGIS would not parse.
+
+    Args:
+        coords: List of [lon, lat, ...] positions
+
+    Returns:
+        str: "lon1 lat1, lon2 lat2, ..."
+
+    Raises:
+        ValueError: If the line has fewer than 2 positions or a coordinate
+            is not a finite number
+    """
+    if len(coords) < 2:
+        raise ValueError("LineString needs at least 2 positions")
+
+    points = [(float(c[0]), float(c[1])) for c in coords]
+    if not all(math.isfinite(v) for point in points for v in point):
+        raise ValueError("Non-finite coordinate")
+
+    return ', '.join(f"{lon} {lat}" for lon, lat in points)
+
+
 def geojson_to_wkt(geometry):
     """
     Convert GeoJSON geometry to WKT format for PostGIS.
@@ -90,30 +165,216 @@ def geojson_to_wkt(geometry):
 
     if geom_type == 'LineString':
         # Format: LINESTRING(lon1 lat1, lon2 lat2, ...)
-        coords_str = ', '.join([f"{c[0]} {c[1]}" for c in coords])
-        return f"LINESTRING({coords_str})", False
+        return f"LINESTRING({format_line_coords(coords)})", False
 
     elif geom_type == 'MultiLineString':
         # Format: MULTILINESTRING((lon1 lat1, lon2 lat2, ...), (lon3 lat3, lon4 lat4, ...))
         # Each element in coords is a separate LineString
-        lines = []
-        for line_coords in coords:
-            line_str = ', '.join([f"{c[0]} {c[1]}" for c in line_coords])
-            lines.append(f"({line_str})")
+        if not coords:
+            raise ValueError("Empty MultiLineString")
+        lines = [f"({format_line_coords(line_coords)})" for line_coords in coords]
         return f"MULTILINESTRING({', '.join(lines)})", True
 
     else:
         raise ValueError(f"Unsupported geometry type: {geom_type}")
 
 
-def load_nhd_geojson(geojson_path: str, batch_size: int = 500):
+def coerce_row(values, column_types, required=()):
+    """
+    Coerce raw property values to their column types, in column order.
+
+    Args:
+        values: Dict of column name to GeoJSON property value
+        column_types: Column name to type (integer range, VARCHAR limit or float)
+        required: Columns that must not be NULL
+
+    Returns:
+        list: Row values for COPY
+
+    Raises:
+        ValueError: If a value does not fit its column type or a required
+            column is NULL
+    """
+    row = []
+    for column, column_type in column_types.items():
+        value = values.get(column)
+        if value is None or (value == '' and not isinstance(column_type, int)):
+            # Empty numbers load as NULL; empty strings stay strings
+            value = None
+        elif column_type is float:
+            value = float(value)
+        elif isinstance(column_type, tuple):
+            # Floats are rounded, as PostgreSQL casts numeric to integer
+            value = round(value) if isinstance(value, float) else int(value)
+            low, high = column_type
+            if not low <= value <= high:
+                raise ValueError(f"{column} out of range: {value}")
+        else:
+            value = str(value)
+            if len(value) > column_type:
+                raise ValueError(f"{column} longer than {column_type} characters")
+
+        if value is None and column in required:
+            raise ValueError(f"{column} is required")
+        row.append(value)
+
+    return row
+
+
+def feature_to_rows(position, feature):
+    """
+    Convert a GeoJSON feature to its flowline, topology and statistics rows.
+
+    Rows start with the feature position (the first occurrence of a
+    repeated nhdplusid wins) and follow the *_COLUMNS order; the flowline
+    row ends with the geometry as EWKT.
+
+    Args:
+        position: Position of the feature in the file
+        feature: GeoJSON feature dict
+
+    Returns:
+        tuple: (nhdplusid, flowline_row, topology_row, stats_row); the
+            topology and statistics rows are None when they cannot be
+            loaded (they are optional)
+
+    Raises:
+        KeyError: If the feature has no properties or geometry
+        ValueError: If the flowline row or geometry is invalid
+    """
+    props = feature['properties']
+
+    # Convert geometry to WKT (MultiLineStrings are merged server-side)
+    wkt, _ = geojson_to_wkt(feature['geometry'])
+
+    # Convert resolution string to integer (for NHDPlus HR)
+    resolution_str = props.get('Resolution') or props.get('resolution')
+    resolution_map = {'High': 1, 'Medium': 2, 'Low': 3}
+    resolution_val = resolution_map.get(resolution_str) if isinstance(resolution_str, str) else resolution_str
+
+    # Get nhdplusid for this feature
+    nhdplusid = props.get('COMID') or props.get('nhdplusid')
+
+    # Convert fdate string to integer format (YYYYMMDD) if needed
+    fdate_raw = props.get('FDATE') or props.get('fdate')
+    fdate_int = None
+    if fdate_raw:
+        if isinstance(fdate_raw, str):
+            # Convert 'YYYY-MM-DD' to YYYYMMDD integer
+            try:
+                fdate_int = int(fdate_raw.replace('-', ''))
+            except (ValueError, AttributeError):
+                fdate_int = None
+        else:
+            fdate_int = fdate_raw
+
+    # 1. nhd.flowlines (CRITICAL - needed for NWM joins)
+    # Note: New NHDPlus HR uses uppercase field names and COMID
+    flowline_row = coerce_row({
+        'nhdplusid': nhdplusid,
+        'permanent_identifier': props.get('permanent_identifier') or str(props.get('COMID', '')),
+        'gnis_id': props.get('GNIS_ID') or props.get('gnis_id'),
+        'gnis_name': props.get('GNIS_NAME') or props.get('gnis_name'),
+        'reachcode': props.get('REACHCODE') or props.get('reachcode'),
+        'lengthkm': props.get('LENGTHKM') or props.get('lengthkm'),
+        'areasqkm': props.get('AreaSqKM') or props.get('areasqkm'),
+        'totdasqkm': props.get('TotDASqKM') or props.get('totdasqkm'),
+        'divdasqkm': props.get('DivDASqKM') or props.get('divdasqkm'),
+        'streamorde': props.get('StreamOrde') or props.get('streamorde'),
+        'streamleve': props.get('StreamLeve') or props.get('streamleve'),
+        'streamcalc': props.get('StreamCalc') or props.get('streamcalc'),
+        'ftype': props.get('FCODE') or props.get('ftype'),  # Use FCODE for ftype
+        'fcode': props.get('FCODE') or props.get('fcode'),
+        'slope': props.get('SLOPE') or props.get('slope'),
+        'slopelenkm': props.get('SLOPELENKM') or props.get('slopelenkm'),
+        'maxelevraw': props.get('MAXELEVRAW') or props.get('maxelevraw'),
+        'minelevraw': props.get('MINELEVRAW') or props.get('minelevraw'),
+        'maxelevsmo': props.get('MAXELEVSMO') or props.get('maxelevsmo'),
+        'minelevsmo': props.get('MINELEVSMO') or props.get('minelevsmo'),
+        'vpuid': props.get('vpuid'),  # Not in new data
+        'statusflag': props.get('statusflag'),  # Not in new data
+        'fdate': fdate_int,  # Converted to integer format
+        'resolution': resolution_val,
+    }, FLOWLINE_COLUMNS, FLOWLINE_REQUIRED)
+    flowline_row = [position, *flowline_row, f"SRID=4326;{wkt}"]
+
+    # 2. Network topology (OPTIONAL - nice to have but not critical)
+    try:
+        topology_row = [position, *coerce_row({
+            'nhdplusid': nhdplusid,
+            'fromnode': props.get('FromNode') or props.get('fromnode'),
+            'tonode': props.get('ToNode') or props.get('tonode'),
+            'hydroseq': props.get('Hydroseq') or props.get('hydroseq'),
+            'levelpathi': props.get('LevelPathI') or props.get('levelpathi'),
+            'terminalpa': props.get('TerminalPa') or props.get('terminalpa'),
+            'uphydroseq': props.get('UpHydroseq') or props.get('uphydroseq'),
+            'uplevelpat': props.get('UpLevelPat') or props.get('uplevelpat'),
+            'dnhydroseq': props.get('DnHydroseq') or props.get('dnhydroseq'),
+            'dnlevelpat': props.get('DnLevelPat') or props.get('dnlevelpat'),
+            'dnminorhyd': props.get('DnMinorHyd') or props.get('dnminorhyd'),
+            'dndraincou': props.get('DnDrainCou') or props.get('dndraincou'),
+            'pathlength': props.get('Pathlength') or props.get('pathlength'),
+            'arbolatesu': props.get('ArbolateSu') or props.get('arbolatesu'),
+            'startflag': props.get('StartFlag') or props.get('startflag'),
+            'terminalfl': props.get('TerminalFl') or props.get('terminalfl'),
+            'divergence': props.get('Divergence') or props.get('divergence'),
+            'mainpath': props.get('mainpath'),
+            'innetwork': props.get('ONOFFNET') or props.get('innetwork'),
+            'frommeas': props.get('FromMeas') or props.get('frommeas'),
+            'tomeas': props.get('ToMeas') or props.get('tomeas')
+        }, TOPOLOGY_COLUMNS, TOPOLOGY_REQUIRED)]
+    except (ValueError, TypeError, OverflowError):
+        topology_row = None  # Silently skip topology errors since they're not critical
+
+    # 3. Flow statistics (OPTIONAL - nice to have but not critical)
+    # NOTE: NHDPlus flow data is in CFS, convert to m³/s for consistency with NWM data
+    try:
+        stats_row = [position, *coerce_row({
+            'nhdplusid': nhdplusid,
+            # Monthly mean flows - convert from CFS to m³/s
+            'qama': convert_flow_cfs_to_m3s(props.get('QA_01') or props.get('qama')),
+            'qbma': convert_flow_cfs_to_m3s(props.get('QA_02') or props.get('qbma')),
+            'qcma': convert_flow_cfs_to_m3s(props.get('QA_03') or props.get('qcma')),
+            'qdma': convert_flow_cfs_to_m3s(props.get('QA_04') or props.get('qdma')),
+            'qema': convert_flow_cfs_to_m3s(props.get('QA_05') or props.get('qema')),
+            'qfma': convert_flow_cfs_to_m3s(props.get('QA_06') or props.get('qfma')),
+            # Incremental flows - convert from CFS to m³/s
+            'qincrama': convert_flow_cfs_to_m3s(props.get('qincrama')),
+            'qincrbma': convert_flow_cfs_to_m3s(props.get('qincrbma')),
+            'qincrcma': convert_flow_cfs_to_m3s(props.get('qincrcma')),
+            'qincrdma': convert_flow_cfs_to_m3s(props.get('qincrdma')),
+            'qincrema': convert_flow_cfs_to_m3s(props.get('qincrema')),
+            'qincrfma': convert_flow_cfs_to_m3s(props.get('qincrfma')),
+            # Velocity stays in m/s (no conversion needed)
+            'vama': props.get('VA_01') or props.get('vama'),
+            'vbma': props.get('VA_02') or props.get('vbma'),
+            'vcma': props.get('VC_01') or props.get('vcma'),
+            'vdma': props.get('VC_02') or props.get('vdma'),
+            'vema': props.get('VE_01') or props.get('vema'),
+            # Gage info
+            'gageidma': props.get('gageidma'),
+            'gageqma': convert_flow_cfs_to_m3s(props.get('gageqma')),  # Convert gage flow too
+            'gageadjma': props.get('gageadjma')
+        }, STATS_COLUMNS)]
+    except (ValueError, TypeError, OverflowError):
+        stats_row = None  # Silently skip stats errors since they're not critical
+
+    return nhdplusid, flowline_row, topology_row, stats_row
+
+
+def load_nhd_geojson(geojson_path: str, batch_size: int = 500, table_suffix: str = ''):
     """
     Load NHD GeoJSON and insert into database.
 
     Args:
         geojson_path: Path to GeoJSON file
-        batch_size: Number of features to insert per transaction
+        batch_size: Number of features per COPY batch
+        table_suffix: Suffix appended to the nhd table names (e.g. '_new' to
+            load staging tables for reset_and_repopulate_db.py --swap-load)
     """
+    flowlines_table = f"nhd.flowlines{table_suffix}"
+    topology_table = f"nhd.network_topology{table_suffix}"
+    stats_table = f"nhd.flow_statistics{table_suffix}"
 
     start_time = datetime.now(timezone.utc)
 
@@ -122,6 +383,8 @@ def load_nhd_geojson(geojson_path: str, batch_size: int = 500):
     logger.info("=" * 80)
     logger.info(f"GeoJSON file: {geojson_path}")
     logger.info(f"Batch size: {batch_size:,}")
+    if table_suffix:
+        logger.info(f"Target tables: {flowlines_table}, {topology_table}, {stats_table}")
     logger.info("")
 
     # Validate file exists
@@ -168,8 +431,13 @@ def load_nhd_geojson(geojson_path: str, batch_size: int = 500):
             result = conn.execute(text("""
                 SELECT COUNT(*)
                 FROM information_schema.tables
-                WHERE table_name IN ('nhd_flowlines', 'nhd_network_topology', 'nhd_flow_statistics')
-            """))
+                WHERE table_schema = 'nhd'
+                  AND table_name IN (:flowlines, :topology, :stats)
+            """), {
+                'flowlines': flowlines_table.split('.')[1],
+                'topology': topology_table.split('.')[1],
+                'stats': stats_table.split('.')[1]
+            })
             table_count = result.fetchone()[0]
 
             if table_count < 3:
@@ -188,216 +456,118 @@ def load_nhd_geojson(geojson_path: str, batch_size: int = 500):
     logger.info("=" * 80)
     logger.info("")
 
-    inserted_count = 0
+    staged_count = 0
     error_count = 0
     batch_num = 0
 
-    # Process in batches (but commit each feature individually to avoid transaction failures)
-    for i in range(0, total_features, batch_size):
-        batch = features[i:i+batch_size]
-        batch_num += 1
-        batch_start_time = datetime.now()
+    flowline_columns = ', '.join(FLOWLINE_COLUMNS)
+    topology_columns = ', '.join(TOPOLOGY_COLUMNS)
+    stats_columns = ', '.join(STATS_COLUMNS)
 
-        # Process each feature individually (separate transactions)
-        for feature in batch:
-            try:
-                props = feature['properties']
-                geom = feature['geometry']
-
-                # Convert geometry to WKT
-                wkt, needs_merge = geojson_to_wkt(geom)
-
-                # Convert resolution string to integer (for NHDPlus HR)
-                resolution_str = props.get('Resolution') or props.get('resolution')
-                resolution_map = {'High': 1, 'Medium': 2, 'Low': 3}
-                resolution_val = resolution_map.get(resolution_str) if isinstance(resolution_str, str) else resolution_str
-
-                # Get nhdplusid for this feature
-                nhdplusid = props.get('COMID') or props.get('nhdplusid')
+    try:
+        # One transaction: features are copied batch by batch into temp
+        # staging tables, then merged into the nhd tables with one INSERT
+        # per table instead of three INSERT round trips per feature
+        with engine.begin() as conn:
+            # The flowlines stage takes any geometry type so that
+            # MultiLineStrings can be merged before the insert
+            conn.execute(text(f"""
+                CREATE TEMP TABLE nhd_flowlines_stage (ord INTEGER, LIKE {flowlines_table}) ON COMMIT DROP;
+                ALTER TABLE nhd_flowlines_stage ALTER COLUMN geom TYPE GEOMETRY(GEOMETRY, 4326);
+                CREATE TEMP TABLE nhd_topology_stage (ord INTEGER, LIKE {topology_table}) ON COMMIT DROP;
+                CREATE TEMP TABLE nhd_stats_stage (ord INTEGER, LIKE {stats_table}) ON COMMIT DROP;
+            """))
 
-                # Convert fdate string to integer format (YYYYMMDD) if needed
-                fdate_raw = props.get('FDATE') or props.get('fdate')
-                fdate_int = None
-                if fdate_raw:
-                    if isinstance(fdate_raw, str):
-                        # Convert 'YYYY-MM-DD' to YYYYMMDD integer
-                        try:
-                            fdate_int = int(fdate_raw.replace('-', ''))
-                        except (ValueError, AttributeError):
-                            fdate_int = None
-                    else:
-                        fdate_int = fdate_raw
-
-                # 1. Insert into nhd.flowlines (CRITICAL - needed for NWM joins)
-                # Note: New NHDPlus HR uses uppercase field names and COMID
-                # For MultiLineString, use ST_LineMerge to merge into a single LineString
-                try:
-                    with engine.begin() as conn:
-                        if needs_merge:
-                            geom_sql = "ST_LineMerge(ST_GeomFromText(:wkt, 4326))"
-                        else:
-                            geom_sql = "ST_GeomFromText(:wkt, 4326)"
-
-                        conn.execute(text(f"""
-                            INSERT INTO nhd.flowlines (
-                                nhdplusid, permanent_identifier, gnis_id, gnis_name,
-                                reachcode, lengthkm, areasqkm, totdasqkm, divdasqkm,
-                                streamorde, streamleve, streamcalc, ftype, fcode,
-                                slope, slopelenkm, maxelevraw, minelevraw,
-                                maxelevsmo, minelevsmo, vpuid, statusflag, fdate,
-                                resolution, geom
-                            ) VALUES (
-                                :nhdplusid, :permanent_identifier, :gnis_id, :gnis_name,
-                                :reachcode, :lengthkm, :areasqkm, :totdasqkm, :divdasqkm,
-                                :streamorde, :streamleve, :streamcalc, :ftype, :fcode,
-                                :slope, :slopelenkm, :maxelevraw, :minelevraw,
-                                :maxelevsmo, :minelevsmo, :vpuid, :statusflag, :fdate,
-                                :resolution, {geom_sql}
-                            )
-                            ON CONFLICT (nhdplusid) DO UPDATE SET
-                                updated_at = NOW()
-                        """), {
-                            'nhdplusid': nhdplusid,
-                            'permanent_identifier': props.get('permanent_identifier') or str(props.get('COMID', '')),
-                            'gnis_id': props.get('GNIS_ID') or props.get('gnis_id'),
-                            'gnis_name': props.get('GNIS_NAME') or props.get('gnis_name'),
-                            'reachcode': props.get('REACHCODE') or props.get('reachcode'),
-                            'lengthkm': props.get('LENGTHKM') or props.get('lengthkm'),
-                            'areasqkm': props.get('AreaSqKM') or props.get('areasqkm'),
-                            'totdasqkm': props.get('TotDASqKM') or props.get('totdasqkm'),
-                            'divdasqkm': props.get('DivDASqKM') or props.get('divdasqkm'),
-                            'streamorde': props.get('StreamOrde') or props.get('streamorde'),
-                            'streamleve': props.get('StreamLeve') or props.get('streamleve'),
-                            'streamcalc': props.get('StreamCalc') or props.get('streamcalc'),
-                            'ftype': props.get('FCODE') or props.get('ftype'),  # Use FCODE for ftype
-                            'fcode': props.get('FCODE') or props.get('fcode'),
-                            'slope': props.get('SLOPE') or props.get('slope'),
-                            'slopelenkm': props.get('SLOPELENKM') or props.get('slopelenkm'),
-                            'maxelevraw': props.get('MAXELEVRAW') or props.get('maxelevraw'),
-                            'minelevraw': props.get('MINELEVRAW') or props.get('minelevraw'),
-                            'maxelevsmo': props.get('MAXELEVSMO') or props.get('maxelevsmo'),
-                            'minelevsmo': props.get('MINELEVSMO') or props.get('minelevsmo'),
-                            'vpuid': props.get('vpuid'),  # Not in new data
-                            'statusflag': props.get('statusflag'),  # Not in new data
-                            'fdate': fdate_int,  # Converted to integer format
-                            'resolution': resolution_val,
-                            'wkt': wkt
-                        })
-                        inserted_count += 1
-                except Exception as e:
-                    # Flowline insert failed - this is critical, skip this feature entirely
-                    error_count += 1
-                    logger.warning(f"⚠️  Failed to insert flowline {nhdplusid}: {e}")
-                    continue
-
-                # 2. Insert network topology (OPTIONAL - nice to have but not critical)
-                try:
-                    with engine.begin() as conn:
-                        conn.execute(text("""
-                            INSERT INTO nhd.network_topology (
-                                nhdplusid, fromnode, tonode, hydroseq, levelpathi,
-                                terminalpa, uphydroseq, uplevelpat, dnhydroseq,
-                                dnlevelpat, dnminorhyd, dndraincou, pathlength,
-                                arbolatesu, startflag, terminalfl, divergence,
-                                mainpath, innetwork, frommeas, tomeas
-                            ) VALUES (
-                                :nhdplusid, :fromnode, :tonode, :hydroseq, :levelpathi,
-                                :terminalpa, :uphydroseq, :uplevelpat, :dnhydroseq,
-                                :dnlevelpat, :dnminorhyd, :dndraincou, :pathlength,
-                                :arbolatesu, :startflag, :terminalfl, :divergence,
-                                :mainpath, :innetwork, :frommeas, :tomeas
-                            )
-                            ON CONFLICT (nhdplusid) DO NOTHING
-                        """), {
-                            'nhdplusid': nhdplusid,
-                            'fromnode': props.get('FromNode') or props.get('fromnode'),
-                            'tonode': props.get('ToNode') or props.get('tonode'),
-                            'hydroseq': props.get('Hydroseq') or props.get('hydroseq'),
-                            'levelpathi': props.get('LevelPathI') or props.get('levelpathi'),
-                            'terminalpa': props.get('TerminalPa') or props.get('terminalpa'),
-                            'uphydroseq': props.get('UpHydroseq') or props.get('uphydroseq'),
-                            'uplevelpat': props.get('UpLevelPat') or props.get('uplevelpat'),
-                            'dnhydroseq': props.get('DnHydroseq') or props.get('dnhydroseq'),
-                            'dnlevelpat': props.get('DnLevelPat') or props.get('dnlevelpat'),
-                            'dnminorhyd': props.get('DnMinorHyd') or props.get('dnminorhyd'),
-                            'dndraincou': props.get('DnDrainCou') or props.get('dndraincou'),
-                            'pathlength': props.get('Pathlength') or props.get('pathlength'),
-                            'arbolatesu': props.get('ArbolateSu') or props.get('arbolatesu'),
-                            'startflag': props.get('StartFlag') or props.get('startflag'),
-                            'terminalfl': props.get('TerminalFl') or props.get('terminalfl'),
-                            'divergence': props.get('Divergence') or props.get('divergence'),
-                            'mainpath': props.get('mainpath'),
-                            'innetwork': props.get('ONOFFNET') or props.get('innetwork'),
-                            'frommeas': props.get('FromMeas') or props.get('frommeas'),
-                            'tomeas': props.get('ToMeas') or props.get('tomeas')
-                        })
-                except Exception as e:
-                    # Topology insert failed - log warning but continue (not critical)
-                    pass  # Silently skip topology errors since they're not critical
-
-                # 3. Insert flow statistics (OPTIONAL - nice to have but not critical)
-                # NOTE: NHDPlus flow data is in CFS, convert to m³/s for consistency with NWM data
-                try:
-                    with engine.begin() as conn:
-                        conn.execute(text("""
-                            INSERT INTO nhd.flow_statistics (
-                                nhdplusid, qama, qbma, qcma, qdma, qema, qfma,
-                                qincrama, qincrbma, qincrcma, qincrdma, qincrema, qincrfma,
-                                vama, vbma, vcma, vdma, vema,
-                                gageidma, gageqma, gageadjma
-                            ) VALUES (
-                                :nhdplusid, :qama, :qbma, :qcma, :qdma, :qema, :qfma,
-                                :qincrama, :qincrbma, :qincrcma, :qincrdma, :qincrema, :qincrfma,
-                                :vama, :vbma, :vcma, :vdma, :vema,
-                                :gageidma, :gageqma, :gageadjma
-                            )
-                            ON CONFLICT (nhdplusid) DO NOTHING
-                        """), {
-                            'nhdplusid': nhdplusid,
-                            # Monthly mean flows - convert from CFS to m³/s
-                            'qama': convert_flow_cfs_to_m3s(props.get('QA_01') or props.get('qama')),
-                            'qbma': convert_flow_cfs_to_m3s(props.get('QA_02') or props.get('qbma')),
-                            'qcma': convert_flow_cfs_to_m3s(props.get('QA_03') or props.get('qcma')),
-                            'qdma': convert_flow_cfs_to_m3s(props.get('QA_04') or props.get('qdma')),
-                            'qema': convert_flow_cfs_to_m3s(props.get('QA_05') or props.get('qema')),
-                            'qfma': convert_flow_cfs_to_m3s(props.get('QA_06') or props.get('qfma')),
-                            # Incremental flows - convert from CFS to m³/s
-                            'qincrama': convert_flow_cfs_to_m3s(props.get('qincrama')),
-                            'qincrbma': convert_flow_cfs_to_m3s(props.get('qincrbma')),
-                            'qincrcma': convert_flow_cfs_to_m3s(props.get('qincrcma')),
-                            'qincrdma': convert_flow_cfs_to_m3s(props.get('qincrdma')),
-                            'qincrema': convert_flow_cfs_to_m3s(props.get('qincrema')),
-                            'qincrfma': convert_flow_cfs_to_m3s(props.get('qincrfma')),
-                            # Velocity stays in m/s (no conversion needed)
-                            'vama': props.get('VA_01') or props.get('vama'),
-                            'vbma': props.get('VA_02') or props.get('vbma'),
-                            'vcma': props.get('VC_01') or props.get('vcma'),
-                            'vdma': props.get('VC_02') or props.get('vdma'),
-                            'vema': props.get('VE_01') or props.get('vema'),
-                            # Gage info
-                            'gageidma': props.get('gageidma'),
-                            'gageqma': convert_flow_cfs_to_m3s(props.get('gageqma')),  # Convert gage flow too
-                            'gageadjma': props.get('gageadjma')
-                        })
-                except Exception as e:
-                    # Flow statistics insert failed - log warning but continue (not critical)
-                    pass  # Silently skip stats errors since they're not critical
-
-            except Exception as e:
-                # Outer exception handler for any unexpected errors
-                error_count += 1
-                logger.warning(f"⚠️  Unexpected error processing feature {nhdplusid}: {e}")
-                continue
-
-        # Log progress
-        batch_duration = (datetime.now() - batch_start_time).total_seconds()
-        features_per_sec = len(batch) / batch_duration if batch_duration > 0 else 0
-        progress_pct = (inserted_count / total_features) * 100
-
-        logger.info(
-            f"Batch {batch_num:,}: Inserted {inserted_count:,}/{total_features:,} features "
-            f"({progress_pct:.1f}%) - {features_per_sec:.0f} features/sec"
-        )
+            for i in range(0, total_features, batch_size):
+                batch = features[i:i+batch_size]
+                batch_num += 1
+                batch_start_time = datetime.now()
+
+                flowline_rows = []
+                topology_rows = []
+                stats_rows = []
+
+                for position, feature in enumerate(batch, i + 1):
+                    try:
+                        nhdplusid, flowline_row, topology_row, stats_row = feature_to_rows(
+                            position, feature
+                        )
+                    except Exception as e:
+                        # Invalid flowline - this is critical, skip this feature entirely
+                        error_count += 1
+                        logger.warning(f"⚠️  Failed to parse feature {position}: {e}")
+                        continue
+
+                    flowline_rows.append(flowline_row)
+                    if topology_row is not None:
+                        topology_rows.append(topology_row)
+                    if stats_row is not None:
+                        stats_rows.append(stats_row)
+
+                staged_count += copy_csv(conn.connection, 'nhd_flowlines_stage',
+                                         ['ord', *FLOWLINE_COLUMNS, 'geom'], flowline_rows)
+                copy_csv(conn.connection, 'nhd_topology_stage',
+                         ['ord', *TOPOLOGY_COLUMNS], topology_rows)
+                copy_csv(conn.connection, 'nhd_stats_stage',
+                         ['ord', *STATS_COLUMNS], stats_rows)
+
+                # Log progress
+                batch_duration = (datetime.now() - batch_start_time).total_seconds()
+                features_per_sec = len(batch) / batch_duration if batch_duration > 0 else 0
+                progress_pct = (staged_count / total_features) * 100
+
+                logger.info(
+                    f"Batch {batch_num:,}: Staged {staged_count:,}/{total_features:,} features "
+                    f"({progress_pct:.1f}%) - {features_per_sec:.0f} features/sec"
+                )
+
+            # For MultiLineString, use ST_LineMerge to merge into a single
+            # LineString; lines that do not merge into one are rejected
+            conn.execute(text("""
+                UPDATE nhd_flowlines_stage SET geom = ST_LineMerge(geom)
+                WHERE GeometryType(geom) = 'MULTILINESTRING'
+            """))
+            rejected = conn.execute(text("""
+                DELETE FROM nhd_flowlines_stage
+                WHERE GeometryType(geom) <> 'LINESTRING'
+                RETURNING nhdplusid
+            """)).scalars().all()
+            for nhdplusid in rejected:
+                logger.warning(
+                    f"⚠️  Failed to insert flowline {nhdplusid}: geometry is not a single LineString"
+                )
+            error_count += len(rejected)
+
+            # DISTINCT ON keeps the first occurrence of a repeated nhdplusid
+            # (ON CONFLICT cannot update the same row twice in one statement)
+            inserted_count = conn.execute(text(f"""
+                INSERT INTO {flowlines_table} ({flowline_columns}, geom)
+                SELECT DISTINCT ON (nhdplusid) {flowline_columns}, geom
+                FROM nhd_flowlines_stage
+                ORDER BY nhdplusid, ord
+                ON CONFLICT (nhdplusid) DO UPDATE SET
+                    updated_at = NOW()
+            """)).rowcount
+
+            # Topology and statistics only for flowlines that were loaded
+            for table, stage, columns in (
+                (topology_table, 'nhd_topology_stage', topology_columns),
+                (stats_table, 'nhd_stats_stage', stats_columns),
+            ):
+                conn.execute(text(f"""
+                    INSERT INTO {table} ({columns})
+                    SELECT DISTINCT ON (nhdplusid) {columns}
+                    FROM {stage} s
+                    WHERE EXISTS (
+                        SELECT 1 FROM nhd_flowlines_stage f
+                        WHERE f.nhdplusid = s.nhdplusid
+                    )
+                    ORDER BY nhdplusid, ord
+                    ON CONFLICT (nhdplusid) DO NOTHING
+                """))
+    except Exception as e:
+        logger.error(f"❌ ERROR: Failed to load NHD data: {e}")
+        return False
 
     # Final summary
     end_time = datetime.now(timezone.utc)
@@ -414,18 +584,28 @@ def load_nhd_geojson(geojson_path: str, batch_size: int = 500):
     logger.info(f"Average speed: {inserted_count/duration:.0f} features/sec")
     logger.info("")
 
+    # Build indexes in one pass now that the data is in (staging tables for
+    # --swap-load are indexed by reset_and_repopulate_db.py instead)
+    if not table_suffix:
+        logger.info("Creating indexes...")
+        if not finalize_nhd_indexes():
+            logger.error("❌ ERROR: Index creation failed")
+            return False
+        logger.info("✅ Indexes created")
+        logger.info("")
+
     # Verify data
     logger.info("Verifying loaded data...")
     try:
         with engine.begin() as conn:
             # Count records in each table
-            result = conn.execute(text("SELECT COUNT(*) FROM nhd.flowlines"))
+            result = conn.execute(text(f"SELECT COUNT(*) FROM {flowlines_table}"))
             flowlines_count = result.fetchone()[0]
 
-            result = conn.execute(text("SELECT COUNT(*) FROM nhd.network_topology"))
+            result = conn.execute(text(f"SELECT COUNT(*) FROM {topology_table}"))
             topology_count = result.fetchone()[0]
 
-            result = conn.execute(text("SELECT COUNT(*) FROM nhd.flow_statistics"))
+            result = conn.execute(text(f"SELECT COUNT(*) FROM {stats_table}"))
             stats_count = result.fetchone()[0]
 
             logger.info(f"  nhd_flowlines: {flowlines_count:,} rows")
@@ -435,9 +615,9 @@ def load_nhd_geojson(geojson_path: str, batch_size: int = 500):
 
             # Sample query
             logger.info("Sample data (first 5 reaches):")
-            result = conn.execute(text("""
+            result = conn.execute(text(f"""
                 SELECT nhdplusid, gnis_name, streamorde, totdasqkm, size_class
-                FROM nhd.flowlines
+                FROM {flowlines_table}
                 ORDER BY nhdplusid
                 LIMIT 5
             """))
@@ -469,13 +649,20 @@ def load_nhd_geojson(geojson_path: str, batch_size: int = 500):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/production/load_nhd_data.py <path_to_geojson>")
-        print()
-        print("Example:")
-        print('  python scripts/production/load_nhd_data.py "D:\\Data\\nhdHydrologyExample.geojson"')
-        sys.exit(1)
-
-    geojson_path = sys.argv[1]
-    success = load_nhd_geojson(geojson_path)
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Load NHDPlus GeoJSON data into PostgreSQL",
+        epilog='Example:\n  python scripts/production/load_nhd_data.py "D:\\Data\\nhdHydrologyExample.geojson"',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("geojson_path", help="Path to NHDPlus GeoJSON file")
+    parser.add_argument(
+        "--table-suffix",
+        default="",
+        help="Suffix for the target nhd tables (used by reset_and_repopulate_db.py --swap-load)"
+    )
+    args = parser.parse_args()
+
+    success = load_nhd_geojson(args.geojson_path, table_suffix=args.table_suffix)
     sys.exit(0 if success else 1)
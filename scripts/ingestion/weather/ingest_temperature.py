@@ -134,11 +134,11 @@ def insert_temperature_readings(
 
     insert_query = text("""
         INSERT INTO observations.temperature_timeseries
-            (nhdplusid, valid_time, temperature_2m, apparent_temperature,
-             precipitation, cloud_cover, source, forecast_hour, ingested_at)
+            (nhdplusid, valid_time, ingested_at, temperature_2m, apparent_temperature,
+             precipitation, forecast_hour, cloud_cover, source)
         VALUES
-            (:nhdplusid, :valid_time, :temperature_2m, :apparent_temperature,
-             :precipitation, :cloud_cover, :source, :forecast_hour, :ingested_at)
+            (:nhdplusid, :valid_time, :ingested_at, :temperature_2m, :apparent_temperature,
+             :precipitation, :forecast_hour, :cloud_cover, :source)
         ON CONFLICT (nhdplusid, valid_time, source, forecast_hour)
         DO UPDATE SET
             temperature_2m = EXCLUDED.temperature_2m,
@@ -150,21 +150,26 @@ def insert_temperature_readings(
 
     ingested_at = datetime.now(timezone.utc)
 
+    # One executemany call (batched by the driver) instead of a round trip per reading
+    rows = [
+        {
+            'nhdplusid': reading.nhdplusid,
+            'valid_time': reading.valid_time,
+            'ingested_at': ingested_at,
+            'temperature_2m': reading.temperature_2m,
+            'apparent_temperature': reading.apparent_temperature,
+            'precipitation': reading.precipitation,
+            'forecast_hour': reading.forecast_hour,
+            'cloud_cover': reading.cloud_cover,
+            'source': reading.source,
+        }
+        for reading in readings
+    ]
+
     with engine.begin() as conn:
-        for reading in readings:
-            conn.execute(insert_query, {
-                'nhdplusid': reading.nhdplusid,
-                'valid_time': reading.valid_time,
-                'temperature_2m': reading.temperature_2m,
-                'apparent_temperature': reading.apparent_temperature,
-                'precipitation': reading.precipitation,
-                'cloud_cover': reading.cloud_cover,
-                'source': reading.source,
-                'forecast_hour': reading.forecast_hour,
-                'ingested_at': ingested_at,
-            })
-
-    return len(readings)
+        conn.execute(insert_query, rows)
+
+    return len(rows)
 
 
 def run_ingestion(
@@ -5,6 +5,7 @@ Configuration for HRRR Wind Data Pipeline
 Centralized configuration for URLs, paths, timeouts, and constants.
 """
 
+import os
 from pathlib import Path
 
 # Script and base directories
@@ -15,6 +16,10 @@ BASE_DIR = SCRIPT_DIR.parent.parent.parent
 RAW_GRIB_DIR = BASE_DIR / "data" / "satellite" / "wind" / "rawGrib"
 PROCESSED_DIR = BASE_DIR / "data" / "satellite" / "wind" / "processed"
 
+# Resolved once at import (resolve() stats every path component)
+RAW_GRIB_DIR_STR = str(RAW_GRIB_DIR.resolve())
+PROCESSED_DIR_STR = str(PROCESSED_DIR.resolve())
+
 # NOAA HRRR configuration
 HRRR_BASE_URL = "https://nomads.ncep.noaa.gov/pub/data/nccf/com/hrrr/prod/"
 HRRR_FILE_PATTERN = "hrrr.t{hour:02d}z.wrfsfcf00.grib2"
@@ -26,18 +31,45 @@ BAND_DESCRIPTIONS = {
     78: "v-component of wind (m/s) at 10m height"
 }
 
+# GRIB processing parallelism
+# Each file is an independent GDAL translate; "thread" also works since
+# the heavy lifting happens outside the interpreter
+GRIB_PROCESS_WORKERS = os.cpu_count() or 1
+GRIB_EXECUTOR = os.getenv("WIND_GRIB_EXECUTOR", "process")  # "process" or "thread"
+
+# GDAL internal threads per translate when called directly;
+# process_all_grib_files divides the cores among its workers instead
+GDAL_NUM_THREADS = os.getenv("WIND_GDAL_NUM_THREADS", "ALL_CPUS")
+
 # Network timeouts (seconds)
 DIRECTORY_LISTING_TIMEOUT = 30
-DOWNLOAD_TIMEOUT = 300
+DOWNLOAD_CONNECT_TIMEOUT = 30
+DOWNLOAD_TIMEOUT = 300  # Max stall between reads, not the whole transfer
+
+# Seconds a parsed directory listing is reused within a run
+DIRECTORY_LISTING_CACHE_TTL = 60
 
 # Download configuration
-DOWNLOAD_CHUNK_SIZE = 8192
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+DOWNLOAD_PROGRESS_UPDATES = 20  # Max progress lines per file
+ETAG_SUFFIX = ".etag"  # Sidecar file holding the ETag of a downloaded GRIB
+PARTIAL_SUFFIX = ".part"  # In-progress download, renamed into place when complete
+DOWNLOAD_MAX_CONNECTIONS = 8  # Concurrent connections to NOMADS
 DEFAULT_FORECAST_HOURS = [3, 7, 12, 16]
 
 # S3 configuration
 S3_BUCKET_NAME = "fnwm-wind-data"
 S3_REGION = "us-east-2"
 S3_PREFIX_TEMPLATE = "hrrr/{year}/{month:02d}/{day:02d}"
+S3_RAW_PREFIX_TEMPLATE = "hrrr/raw/{year}/{month:02d}/{day:02d}"
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+S3_MAX_CONCURRENCY = 4
+
+# Multipart settings for uploading local files (parts are read from disk in parallel)
+S3_UPLOAD_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_UPLOAD_CHUNKSIZE = 16 * 1024 * 1024
+S3_UPLOAD_MAX_CONCURRENCY = 16
+S3_UPLOAD_WORKERS = 8  # Files uploaded in parallel by upload_directory
 S3_RETENTION_DAYS = 7
 
 # S3 metadata
@@ -6,16 +6,39 @@ Downloads HRRR wrfsfcf00.grib2 files from NOAA NOMADS server.
 Supports fetching data for specific hours or the file closest to current time.
 """
 
+import argparse
+import asyncio
 import requests
+import aiohttp
+import aiofiles
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import BotoCoreError, ClientError
 from datetime import datetime
 import re
 import os
-from pathlib import Path
+import sys
+import time
 from urllib.parse import urljoin
 
 import config
 import utils
 
+# Directory listing rows: (filename, date, time, size)
+_LISTING_RE = re.compile(r'<a href="([^"]+)">.*?(\d{2}-\w{3}-\d{4})\s+(\d{2}:\d{2})\s+(\S+)')
+
+# Keep-alive session for the synchronous NOMADS requests (directory listings
+# and --s3-only streaming) so repeated GETs reuse one TCP/TLS connection
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=config.DOWNLOAD_MAX_CONNECTIONS))
+
+# Parsed directory listings keyed by URL: (monotonic fetch time, files)
+_LISTING_CACHE = {}
+
+_HOUR_PREFIX = 'hrrr.t'
+_HOUR_SUFFIX = 'z.wrfsfcf00.grib2'
+_HOUR_FILENAME_LEN = len(_HOUR_PREFIX) + 2 + len(_HOUR_SUFFIX)
+
 
 def get_hrrr_url(date=None):
     """
@@ -34,39 +57,52 @@ def get_hrrr_url(date=None):
     return f"{config.HRRR_BASE_URL}hrrr.{date_str}/conus/"
 
 
-def parse_directory_listing(url):
+def parse_directory_listing(url, refresh=False):
     """
     Parse NOAA directory listing to extract GRIB file information.
 
+    Successful results are cached per URL for config.DIRECTORY_LISTING_CACHE_TTL
+    seconds so repeated lookups within a run reuse the same listing.
+
     Args:
         url: URL to the directory listing
+        refresh: If True, ignore any cached listing and fetch it again
 
     Returns:
         list: List of dictionaries containing file information
     """
+    cached = _LISTING_CACHE.get(url)
+    if (not refresh and cached is not None
+            and time.monotonic() - cached[0] < config.DIRECTORY_LISTING_CACHE_TTL):
+        # Copies, since callers annotate the dictionaries
+        return [dict(file_info) for file_info in cached[1]]
+
     try:
-        response = requests.get(url, timeout=config.DIRECTORY_LISTING_TIMEOUT)
+        response = _HTTP_SESSION.get(url, timeout=config.DIRECTORY_LISTING_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error fetching directory listing: {e}")
         return []
 
     # Parse HTML to find file links (filename, date, time, size)
-    pattern = r'<a href="([^"]+)">.*?(\d{2}-\w{3}-\d{4})\s+(\d{2}:\d{2})\s+(\S+)'
-    matches = re.findall(pattern, response.text)
+    matches = _LISTING_RE.findall(response.text)
 
     files = []
-    for filename, date, time, size in matches:
-        if filename.endswith('.grib2') and not filename.endswith('.idx'):
+    for filename, date, time_str, size in matches:
+        # '.grib2.idx' index files fail the suffix check
+        if filename.endswith('.grib2'):
             files.append({
                 'filename': filename,
                 'date': date,
-                'time': time,
+                'time': time_str,
                 'size': size,
                 'url': urljoin(url, filename)
             })
 
-    return files
+    if files:
+        _LISTING_CACHE[url] = (time.monotonic(), files)
+
+    return [dict(file_info) for file_info in files]
 
 
 def extract_hour_from_filename(filename):
@@ -79,63 +115,309 @@ def extract_hour_from_filename(filename):
     Returns:
         int: Hour (0-23), or None if not found
     """
-    pattern = r'hrrr\.t(\d{2})z\.wrfsfcf00\.grib2'
-    match = re.match(pattern, filename)
-    return int(match.group(1)) if match else None
+    if (len(filename) == _HOUR_FILENAME_LEN
+            and filename.startswith(_HOUR_PREFIX)
+            and filename.endswith(_HOUR_SUFFIX)):
+        hour = filename[len(_HOUR_PREFIX):len(_HOUR_PREFIX) + 2]
+        if hour.isdigit():
+            return int(hour)
+    return None
 
 
-def download_file(url, destination_path, filename):
+def create_download_session():
     """
-    Download a file from URL to destination with progress tracking.
+    Create an aiohttp session for downloading GRIB files.
+
+    A single connection pool is shared by all downloads in a run so that
+    concurrent transfers multiplex on one event loop.
+
+    Only stalls time out: there is no cap on the whole transfer, so large
+    files on slow links are not cancelled mid-stream.
+
+    Returns:
+        aiohttp.ClientSession: Session with connection limit and timeouts from config
+    """
+    connector = aiohttp.TCPConnector(limit=config.DOWNLOAD_MAX_CONNECTIONS)
+    timeout = aiohttp.ClientTimeout(
+        total=None,
+        sock_connect=config.DOWNLOAD_CONNECT_TIMEOUT,
+        sock_read=config.DOWNLOAD_TIMEOUT
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+def read_cached_etag(filepath):
+    """
+    Read the ETag recorded for a previously downloaded file.
+
+    Args:
+        filepath: Path to the downloaded file
+
+    Returns:
+        str: Cached ETag, or None if no sidecar file exists
+    """
+    try:
+        with open(filepath + config.ETAG_SUFFIX) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def write_cached_etag(filepath, etag):
+    """
+    Record the ETag of a downloaded file in a sidecar file.
 
     Args:
+        filepath: Path to the downloaded file
+        etag: ETag header value (ignored if None)
+    """
+    if etag:
+        with open(filepath + config.ETAG_SUFFIX, 'w') as f:
+            f.write(etag)
+
+
+async def fetch_file(session, url, destination_path, filename, local_size=None, partial_size=None):
+    """
+    Download a file, skipping or resuming based on a HEAD request.
+
+    The body is written to a `.part` file that is renamed into place once
+    complete. A complete local copy is kept when its size matches the remote
+    Content-Length and its cached ETag (if any) matches the remote ETag; if
+    the HEAD request fails, the complete copy is kept as-is. A `.part` file
+    is resumed with a Range request guarded by If-Range on its cached ETag,
+    so a file republished upstream is sent in full (200) and restarted. If
+    the server rejects the Range (416), a `.part` of the full remote size is
+    renamed into place and any other is deleted and downloaded again.
+    Partial files are kept on other errors so the next run can resume them.
+
+    Args:
+        session: aiohttp.ClientSession to issue the requests with
         url: URL to download from
         destination_path: Directory to save file
         filename: Name of the file
+        local_size: Size of the existing complete copy (0 if absent), or
+            None to stat the file here
+        partial_size: Size of the existing `.part` file (0 if absent), or
+            None to stat the file here
 
     Returns:
-        bool: True if successful, False otherwise
+        str: Results key for the outcome ('success', 'failed' or 'skipped')
     """
     filepath = os.path.join(destination_path, filename)
+    part_path = filepath + config.PARTIAL_SUFFIX
 
-    # Check if file already exists
-    if os.path.exists(filepath):
-        print(f"File already exists: {filename}")
-        return True
+    if local_size is None:
+        local_size = os.path.getsize(filepath) if os.path.exists(filepath) else 0
+    if partial_size is None:
+        partial_size = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    cached_etag = read_cached_etag(filepath) if local_size or partial_size else None
 
     try:
-        print(f"Downloading {filename}...")
-        response = requests.get(url, stream=True, timeout=config.DOWNLOAD_TIMEOUT)
-        response.raise_for_status()
-
-        # Get file size for progress tracking
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
-
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=config.DOWNLOAD_CHUNK_SIZE):
-                if chunk:
-                    f.write(chunk)
+        try:
+            async with session.head(url) as head:
+                head.raise_for_status()
+                expected_size = int(head.headers.get('content-length', 0))
+                etag = head.headers.get('etag')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Offline fallback: a complete copy is good enough without HEAD
+            if local_size:
+                print(f"File already exists: {filename} (could not check upstream: {e})")
+                return 'skipped'
+            expected_size, etag = 0, None
+
+        # Keep the complete copy unless it changed upstream or differs in size
+        if local_size:
+            if ((etag and cached_etag and etag != cached_etag)
+                    or (expected_size and local_size != expected_size)):
+                os.remove(filepath)
+            else:
+                print(f"File already exists: {filename}")
+                write_cached_etag(filepath, etag)
+                return 'skipped'
+
+        # Resume only with a strong validator for If-Range; otherwise restart
+        resume = (partial_size and cached_etag and not cached_etag.startswith('W/')
+                  and (not etag or etag == cached_etag)
+                  and (not expected_size or partial_size < expected_size))
+
+        if resume:
+            headers = {'Range': f'bytes={partial_size}-', 'If-Range': cached_etag}
+            print(f"Resuming {filename} from {utils.format_file_size(partial_size)}...")
+        else:
+            headers = {}
+            print(f"Downloading {filename}...")
+
+        async with session.get(url, headers=headers) as response:
+            # 416: the Range starts at or past the end of the remote file, so
+            # the .part is already complete (same size) or stale; either way
+            # the Range must not be sent again
+            if resume and response.status == 416:
+                total = response.headers.get('content-range', '').rpartition('/')[2]
+                remote_size = int(total) if total.isdigit() else expected_size
+                if remote_size and partial_size == remote_size:
+                    os.replace(part_path, filepath)
+                    print(f"✓ Completed from partial download: {filename}")
+                    return 'success'
+
+                response.release()
+                os.remove(part_path)
+                print(f"Partial download of {filename} does not match upstream, restarting")
+                return await fetch_file(session, url, destination_path, filename,
+                                        local_size=0, partial_size=0)
+
+            response.raise_for_status()
+
+            # 206 appends to the partial file; 200 means the server sent
+            # everything (no Range support, or If-Range did not match)
+            if response.status == 206:
+                mode = 'ab'
+                downloaded = partial_size
+            else:
+                mode = 'wb'
+                downloaded = 0
+
+            # Record the validator of the bytes being written before the body,
+            # so an interrupted .part file can be resumed safely
+            write_cached_etag(filepath, response.headers.get('etag') or etag)
+
+            # Get file size for progress tracking (only shown on a terminal)
+            total_size = downloaded + int(response.headers.get('content-length', 0))
+            show_progress = total_size > 0 and sys.stdout.isatty()
+            total_str = utils.format_file_size(total_size)
+            report_interval = max(total_size // config.DOWNLOAD_PROGRESS_UPDATES,
+                                  config.DOWNLOAD_CHUNK_SIZE)
+            last_report = downloaded
+
+            async with aiofiles.open(part_path, mode) as f:
+                async for chunk in response.content.iter_chunked(config.DOWNLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
                     downloaded += len(chunk)
 
-                    # Print progress
-                    if total_size > 0:
+                    # Print progress (throttled)
+                    if show_progress and downloaded - last_report >= report_interval:
+                        last_report = downloaded
                         percent = (downloaded / total_size) * 100
                         downloaded_str = utils.format_file_size(downloaded)
-                        total_str = utils.format_file_size(total_size)
                         print(f"\rProgress: {percent:.1f}% ({downloaded_str} / {total_str})", end='')
 
+        os.replace(part_path, filepath)
         print(f"\n✓ Downloaded: {filename}")
-        return True
+        return 'success'
 
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"\n✗ Error downloading {filename}: {e}")
-        # Clean up partial download
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        if os.path.exists(part_path):
+            print(f"  Partial download kept for resume: {filename}{config.PARTIAL_SUFFIX}")
+        return 'failed'
+
+
+async def download_file_async(session, url, destination_path, filename):
+    """
+    Download a file from URL to destination with progress tracking.
+
+    Args:
+        session: aiohttp.ClientSession to issue the request with
+        url: URL to download from
+        destination_path: Directory to save file
+        filename: Name of the file
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    outcome = await fetch_file(session, url, destination_path, filename)
+    return outcome != 'failed'
+
+
+def upload_to_s3(response, bucket, key, extra_metadata=None):
+    """
+    Stream an HTTP response body straight into an S3 object.
+
+    Args:
+        response: Streaming requests.Response (opened with stream=True)
+        bucket: Destination S3 bucket name
+        key: Destination S3 object key
+        extra_metadata: Metadata merged over config.S3_METADATA
+    """
+    metadata = {**config.S3_METADATA, **(extra_metadata or {})}
+    transfer_config = TransferConfig(
+        multipart_chunksize=config.S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=config.S3_MAX_CONCURRENCY
+    )
+
+    response.raw.decode_content = True
+    s3_client = boto3.client('s3', region_name=config.S3_REGION)
+    s3_client.upload_fileobj(
+        response.raw,
+        bucket,
+        key,
+        ExtraArgs={'Metadata': metadata},
+        Config=transfer_config
+    )
+
+
+def stream_file_to_s3(url, filename):
+    """
+    Download a file from URL directly into S3 without touching local disk.
+
+    Args:
+        url: URL to download from
+        filename: Name of the file (used as the object name)
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    now = datetime.utcnow()
+    s3_prefix = config.S3_RAW_PREFIX_TEMPLATE.format(year=now.year, month=now.month, day=now.day)
+    s3_key = f"{s3_prefix}/{filename}"
+
+    try:
+        print(f"Streaming {filename} to s3://{config.S3_BUCKET_NAME}/{s3_key}...")
+        with _HTTP_SESSION.get(url, stream=True, timeout=config.DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            upload_to_s3(
+                response,
+                config.S3_BUCKET_NAME,
+                s3_key,
+                extra_metadata={
+                    'bands': 'all',
+                    'upload_time': now.isoformat(),
+                    'original_filename': filename
+                }
+            )
+
+        print(f"✓ Uploaded: {s3_key}")
+        return True
+
+    except (requests.RequestException, BotoCoreError, ClientError) as e:
+        print(f"✗ Error streaming {filename} to S3: {e}")
         return False
 
 
+def download_file(url, destination_path, filename, s3_only=False):
+    """
+    Download a single file from URL to destination.
+
+    Synchronous wrapper around download_file_async.
+
+    Args:
+        url: URL to download from
+        destination_path: Directory to save file
+        filename: Name of the file
+        s3_only: If True, stream the file to S3 instead of writing it locally
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if s3_only:
+        return stream_file_to_s3(url, filename)
+
+    async def _download():
+        async with create_download_session() as session:
+            return await download_file_async(session, url, destination_path, filename)
+
+    return asyncio.run(_download())
+
+
 def find_files_for_hours(files, hours):
     """
     Find GRIB files for specified hours, with fallback to nearest available.
@@ -172,9 +454,9 @@ def find_files_for_hours(files, hours):
     return target_files
 
 
-def download_files(files, output_dir):
+async def download_files_async(files, output_dir):
     """
-    Download a list of files to output directory.
+    Download a list of files to output directory concurrently.
 
     Args:
         files: List of file info dictionaries
@@ -185,24 +467,61 @@ def download_files(files, output_dir):
     """
     results = utils.init_results_dict()
 
-    for file_info in files:
-        filepath = os.path.join(output_dir, file_info['filename'])
-
-        if os.path.exists(filepath):
-            print(f"\nSkipping {file_info['filename']} (already exists)")
-            results['skipped'] += 1
-        else:
-            print()  # New line for better formatting
-            success = download_file(file_info['url'], output_dir, file_info['filename'])
-            if success:
-                results['success'] += 1
-            else:
-                results['failed'] += 1
+    if not files:
+        return results
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # One directory read instead of a stat() per file (complete and .part)
+    wanted = {file_info['filename'] for file_info in files}
+    wanted |= {name + config.PARTIAL_SUFFIX for name in wanted}
+    with os.scandir(output_dir) as entries:
+        local_sizes = {
+            entry.name: entry.stat().st_size
+            for entry in entries
+            if entry.name in wanted and entry.is_file()
+        }
+
+    print()  # New line for better formatting
+    async with create_download_session() as session:
+        outcomes = await asyncio.gather(*[
+            fetch_file(session, file_info['url'], output_dir, file_info['filename'],
+                       local_size=local_sizes.get(file_info['filename'], 0),
+                       partial_size=local_sizes.get(file_info['filename'] + config.PARTIAL_SUFFIX, 0))
+            for file_info in files
+        ])
+
+    for outcome in outcomes:
+        results[outcome] += 1
 
     return results
 
 
-def fetch_hrrr_data(hours=None, output_dir=None, date=None):
+def download_files(files, output_dir, s3_only=False):
+    """
+    Download a list of files to output directory.
+
+    Synchronous wrapper around download_files_async.
+
+    Args:
+        files: List of file info dictionaries
+        output_dir: Destination directory
+        s3_only: If True, stream files to S3 instead of writing them locally
+
+    Returns:
+        dict: Summary of download results
+    """
+    if s3_only:
+        results = utils.init_results_dict()
+        for file_info in files:
+            success = stream_file_to_s3(file_info['url'], file_info['filename'])
+            results['success' if success else 'failed'] += 1
+        return results
+
+    return asyncio.run(download_files_async(files, output_dir))
+
+
+def fetch_hrrr_data(hours=None, output_dir=None, date=None, s3_only=False):
     """
     Fetch HRRR wrfsfcf00.grib2 files for specified hours.
 
@@ -210,15 +529,13 @@ def fetch_hrrr_data(hours=None, output_dir=None, date=None):
         hours: List of hours (0-23) to download data for (default from config)
         output_dir: Directory to save downloaded files (default from config)
         date: datetime object or None (uses today's date if None)
+        s3_only: If True, stream files to S3 instead of saving them locally
 
     Returns:
         dict: Summary of download results
     """
     hours = hours or config.DEFAULT_FORECAST_HOURS
-    output_dir = output_dir or str(config.RAW_GRIB_DIR.resolve())
-
-    # Ensure output directory exists
-    utils.ensure_directory(output_dir)
+    output_dir = output_dir or config.RAW_GRIB_DIR_STR
 
     # Get and parse directory listing
     url = get_hrrr_url(date)
@@ -241,7 +558,7 @@ def fetch_hrrr_data(hours=None, output_dir=None, date=None):
         print(f"  - {f['filename']} ({f['size']})")
 
     # Download files
-    results = download_files(target_files, output_dir)
+    results = download_files(target_files, output_dir, s3_only=s3_only)
     results['total'] = len(target_files)
 
     # Print summary
@@ -250,23 +567,21 @@ def fetch_hrrr_data(hours=None, output_dir=None, date=None):
     return results
 
 
-def fetch_current_time_hrrr(output_dir=None, date=None):
+def fetch_current_time_hrrr(output_dir=None, date=None, s3_only=False):
     """
     Fetch the HRRR wrfsfcf00.grib2 file closest to the current time.
 
     Args:
         output_dir: Directory to save downloaded file (default from config)
         date: datetime object or None (uses current time in EST if None)
+        s3_only: If True, stream the file to S3 instead of saving it locally
 
     Returns:
         dict: Summary of download results
     """
-    output_dir = output_dir or str(config.RAW_GRIB_DIR.resolve())
+    output_dir = output_dir or config.RAW_GRIB_DIR_STR
     date = date or utils.get_current_time_est()
 
-    # Ensure output directory exists
-    utils.ensure_directory(output_dir)
-
     # Get and parse directory listing
     url = get_hrrr_url(date)
     print(f"Fetching data from: {url}")
@@ -305,7 +620,7 @@ def fetch_current_time_hrrr(output_dir=None, date=None):
     print(f"  - Current hour: {current_hour:02d}, difference: {abs(closest_hour - current_hour)} hours")
 
     # Download file
-    results = download_files([closest_file], output_dir)
+    results = download_files([closest_file], output_dir, s3_only=s3_only)
     results['total'] = 1
 
     # Print summary
@@ -315,8 +630,16 @@ def fetch_current_time_hrrr(output_dir=None, date=None):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download HRRR wrfsfcf00.grib2 files")
+    parser.add_argument(
+        "--s3-only",
+        action="store_true",
+        help="Stream raw GRIB files straight to S3 without saving them locally"
+    )
+    args = parser.parse_args()
+
     print("HRRR Data Fetcher")
     print("=" * 60)
 
     # Default: Fetch closest file to current time
-    results = fetch_current_time_hrrr()
+    results = fetch_current_time_hrrr(s3_only=args.s3_only)
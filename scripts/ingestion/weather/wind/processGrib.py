@@ -2,60 +2,90 @@
 """
 GRIB File Processor
 
-Extracts wind component bands (u and v) from HRRR GRIB2 files using gdal_translate.
+Extracts wind component bands (u and v) from HRRR GRIB2 files using GDAL
+(the osgeo Python API, or gdal_translate when the bindings are missing).
 Default bands are 77 (u-component) and 78 (v-component) at 10m height.
 """
 
+import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from fnmatch import fnmatch
 from pathlib import Path
 
 import config
 import utils
 
+try:
+    from osgeo import gdal
+    gdal.UseExceptions()
+except ImportError:
+    gdal = None
 
-def process_grib_file(input_file, output_dir, bands=None):
+
+def _translate_in_process(input_path, output_file, bands, num_threads, verbose=False):
     """
-    Process a single GRIB file using gdal_translate to extract specific bands.
+    Extract bands with the GDAL Python API (no subprocess per file).
 
     Args:
-        input_file: Path to input GRIB2 file
-        output_dir: Directory to save processed files
-        bands: List of band numbers to extract (default from config)
+        input_path: Path to input GRIB2 file
+        output_file: Path of the processed output file
+        bands: List of band numbers to extract
+        num_threads: GDAL_NUM_THREADS value
+        verbose: Print a line for each processed file
 
     Returns:
         bool: True if successful, False otherwise
     """
-    bands = bands or config.WIND_BANDS
+    try:
+        gdal.SetConfigOption('GDAL_NUM_THREADS', str(num_threads))
+        dataset = gdal.Translate(str(output_file), str(input_path),
+                                 format='GRIB', bandList=list(bands))
+        dataset = None  # Close to flush the output file
 
-    input_path = Path(input_file)
-    output_path = utils.ensure_directory(output_dir)
+        if verbose:
+            print(f"✓ Processed: {input_path.name} -> {output_file.name}")
+        return True
 
-    # Generate output filename
-    output_filename = input_path.stem + config.PROCESSED_SUFFIX
-    output_file = output_path / output_filename
+    except RuntimeError as e:
+        print(f"✗ Error processing {input_path.name}:")
+        print(f"  {e}")
+        # Clean up partial output file
+        output_file.unlink(missing_ok=True)
+        return False
 
-    # Check if output file already exists
-    if output_file.exists():
-        print(f"Skipping {input_path.name} (already processed)")
-        return True
 
+def _translate_subprocess(input_path, output_file, bands, num_threads, verbose=False):
+    """
+    Extract bands by running the gdal_translate command-line tool.
+
+    Used when the osgeo Python bindings are not installed.
+
+    Args:
+        input_path: Path to input GRIB2 file
+        output_file: Path of the processed output file
+        bands: List of band numbers to extract
+        num_threads: GDAL_NUM_THREADS value
+        verbose: Print a line for each processed file
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
     # Build gdal_translate command
-    cmd = ["gdal_translate", "-of", "GRIB"]
+    cmd = ["gdal_translate", "--config", "GDAL_NUM_THREADS", str(num_threads), "-of", "GRIB"]
     for band in bands:
         cmd.extend(["-b", str(band)])
-    cmd.extend([str(input_file), str(output_file)])
+    cmd.extend([str(input_path), str(output_file)])
 
     try:
-        print(f"Processing {input_path.name}...")
-        print(f"  Extracting bands: {', '.join(str(b) for b in bands)}")
-
         # Run gdal_translate
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
 
-        print(f"✓ Processed: {input_path.name} -> {output_filename}")
+        if verbose:
+            print(f"✓ Processed: {input_path.name} -> {output_file.name}")
 
         # Print GDAL warnings if any
-        if result.stderr:
+        if verbose and result.stderr:
             stderr_lines = result.stderr.strip()
             # Filter out common GDAL progress messages
             if stderr_lines and not all(line.startswith('Input file size') for line in stderr_lines.split('\n')):
@@ -79,7 +109,49 @@ def process_grib_file(input_file, output_dir, bands=None):
         return False
 
 
-def process_all_grib_files(input_dir, output_dir, bands=None, pattern=None):
+def process_grib_file(input_file, output_dir, bands=None, num_threads=None, verbose=False):
+    """
+    Process a single GRIB file with GDAL to extract specific bands.
+
+    Uses the in-process GDAL Python API when available and falls back to
+    the gdal_translate command-line tool otherwise.
+
+    Args:
+        input_file: Path to input GRIB2 file
+        output_dir: Directory to save processed files
+        bands: List of band numbers to extract (default from config)
+        num_threads: GDAL_NUM_THREADS value (default from config)
+        verbose: Print progress for the file (errors are always printed)
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    bands = bands or config.WIND_BANDS
+    num_threads = num_threads or config.GDAL_NUM_THREADS
+
+    input_path = Path(input_file)
+    output_path = utils.ensure_directory(output_dir)
+
+    # Generate output filename
+    output_filename = input_path.stem + config.PROCESSED_SUFFIX
+    output_file = output_path / output_filename
+
+    # Check if output file already exists
+    if output_file.exists():
+        if verbose:
+            print(f"Skipping {input_path.name} (already processed)")
+        return True
+
+    if verbose:
+        print(f"Processing {input_path.name}...")
+        print(f"  Extracting bands: {', '.join(str(b) for b in bands)}")
+
+    if gdal is not None:
+        return _translate_in_process(input_path, output_file, bands, num_threads, verbose)
+    return _translate_subprocess(input_path, output_file, bands, num_threads, verbose)
+
+
+def process_all_grib_files(input_dir, output_dir, bands=None, pattern=None, verbose=False):
     """
     Process all GRIB files in a directory.
 
@@ -88,6 +160,8 @@ def process_all_grib_files(input_dir, output_dir, bands=None, pattern=None):
         output_dir: Directory to save processed files
         bands: List of band numbers to extract (default from config)
         pattern: File pattern to match (default from config)
+        verbose: Print a line per file; otherwise only the summary
+            (per-file output from parallel workers serializes on stdout)
 
     Returns:
         dict: Summary of processing results
@@ -98,8 +172,16 @@ def process_all_grib_files(input_dir, output_dir, bands=None, pattern=None):
     input_path = Path(input_dir)
     output_path = Path(output_dir)
 
-    # Find all GRIB files
-    grib_files = sorted(input_path.glob(pattern))
+    # Find all GRIB files (flat directory: scandir + fnmatch, Path built only for matches)
+    try:
+        with os.scandir(input_path) as entries:
+            grib_files = sorted(
+                (Path(entry.path) for entry in entries
+                 if entry.is_file() and fnmatch(entry.name, pattern)),
+                key=lambda p: p.name
+            )
+    except FileNotFoundError:
+        grib_files = []
 
     if not grib_files:
         print(f"No GRIB files found in {input_dir}")
@@ -108,22 +190,39 @@ def process_all_grib_files(input_dir, output_dir, bands=None, pattern=None):
     print(f"Found {len(grib_files)} GRIB files to process")
     print(f"Output directory: {output_dir}\n")
 
-    # Process each file
+    # Filter out already-processed files before dispatching work
+    # (one directory scan instead of an exists() stat per file)
     results = utils.init_results_dict()
+    todo = []
 
-    for grib_file in grib_files:
-        # Check if already processed
-        output_filename = grib_file.stem + config.PROCESSED_SUFFIX
-        output_file = output_path / output_filename
+    try:
+        with os.scandir(output_path) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing = set()
 
-        if output_file.exists():
-            print(f"Skipping {grib_file.name} (already processed)")
+    for grib_file in grib_files:
+        if grib_file.stem + config.PROCESSED_SUFFIX in existing:
+            if verbose:
+                print(f"Skipping {grib_file.name} (already processed)")
             results['skipped'] += 1
         else:
-            success = process_grib_file(grib_file, output_dir, bands)
-            results['success' if success else 'failed'] += 1
-
-        print()  # Blank line between files
+            todo.append(grib_file)
+
+    # Process remaining files in parallel (one gdal_translate per worker)
+    if todo:
+        executor_class = ThreadPoolExecutor if config.GRIB_EXECUTOR == "thread" else ProcessPoolExecutor
+        max_workers = min(config.GRIB_PROCESS_WORKERS, len(todo))
+        # Split cores between workers to avoid oversubscription
+        num_threads = max(1, (os.cpu_count() or 1) // max_workers)
+
+        with executor_class(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(process_grib_file, grib_file, output_dir, bands, num_threads, verbose)
+                for grib_file in todo
+            ]
+            for future in as_completed(futures):
+                results['success' if future.result() else 'failed'] += 1
 
     # Add total and print summary
     results['total'] = len(grib_files)
@@ -138,6 +237,6 @@ if __name__ == "__main__":
 
     # Process all GRIB files using config defaults
     results = process_all_grib_files(
-        input_dir=str(config.RAW_GRIB_DIR.resolve()),
-        output_dir=str(config.PROCESSED_DIR.resolve())
+        input_dir=config.RAW_GRIB_DIR_STR,
+        output_dir=config.PROCESSED_DIR_STR
     )
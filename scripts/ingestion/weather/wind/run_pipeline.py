@@ -69,7 +69,7 @@ def main():
 
     try:
         fetch_results = dataFetcher.fetch_current_time_hrrr(
-            output_dir=str(config.RAW_GRIB_DIR.resolve()),
+            output_dir=config.RAW_GRIB_DIR_STR,
             date=current_time
         )
 
@@ -85,8 +85,8 @@ def main():
 
     try:
         process_results = processGrib.process_all_grib_files(
-            input_dir=str(config.RAW_GRIB_DIR.resolve()),
-            output_dir=str(config.PROCESSED_DIR.resolve())
+            input_dir=config.RAW_GRIB_DIR_STR,
+            output_dir=config.PROCESSED_DIR_STR
         )
 
         if not check_step_results(process_results, "GRIB processing"):
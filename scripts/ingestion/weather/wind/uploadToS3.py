@@ -6,9 +6,15 @@ Uploads processed HRRR wind GRIB files to AWS S3 bucket.
 Supports uploading with metadata and optional cleanup of local files.
 """
 
+import argparse
+import os
 import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from fnmatch import fnmatch
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import logging
 from botocore.exceptions import ClientError
 
@@ -19,6 +25,17 @@ import utils
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Maximum keys accepted by a single delete_objects request
+DELETE_BATCH_SIZE = 1000
+
+
+def _is_missing_bucket(error):
+    """Check whether an S3 error means the bucket does not exist."""
+    if isinstance(error, ClientError):
+        return error.response['Error']['Code'] in ('NoSuchBucket', '404')
+    # upload_file wraps the ClientError in S3UploadFailedError
+    return 'NoSuchBucket' in str(error)
+
 
 class S3Uploader:
     """Handle S3 uploads and management for wind data."""
@@ -39,10 +56,18 @@ class S3Uploader:
         session = boto3.Session(profile_name=profile) if profile else boto3.Session()
         self.s3_client = session.client('s3', region_name=self.region)
 
+        # Concurrent multipart uploads for large GRIB files
+        self.transfer_config = TransferConfig(
+            multipart_threshold=config.S3_UPLOAD_MULTIPART_THRESHOLD,
+            multipart_chunksize=config.S3_UPLOAD_CHUNKSIZE,
+            max_concurrency=config.S3_UPLOAD_MAX_CONCURRENCY,
+            use_threads=True
+        )
+
         logger.info(f"Initialized S3 uploader for bucket: {self.bucket_name}")
 
     def check_bucket_exists(self):
-        """Check if the S3 bucket exists."""
+        """Check if the S3 bucket exists (diagnostics only; uploads detect a missing bucket)."""
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
             logger.info(f"✓ Bucket exists: {self.bucket_name}")
@@ -55,88 +80,115 @@ class S3Uploader:
                 logger.error(f"✗ Error checking bucket: {e}")
             return False
 
-    def upload_file(self, file_path, s3_key=None, metadata=None):
-        """Upload a single file to S3."""
+    def upload_file(self, file_path, s3_key=None, metadata=None, file_size=None, verbose=False):
+        """Upload a single file to S3 (file_size skips the stat when already known)."""
         file_path = Path(file_path)
 
-        if not file_path.exists():
-            logger.error(f"✗ File not found: {file_path}")
-            return False
+        if file_size is None:
+            try:
+                file_size = file_path.stat().st_size
+            except FileNotFoundError:
+                logger.error(f"✗ File not found: {file_path}")
+                return False
 
         s3_key = s3_key or file_path.name
 
         try:
             extra_args = {'Metadata': metadata} if metadata else {}
-            file_size_str = utils.format_file_size(file_path.stat().st_size)
+            file_size_str = utils.format_file_size(file_size)
 
-            logger.info(f"Uploading {file_path.name} ({file_size_str})...")
+            if verbose:
+                logger.info(f"Uploading {file_path.name} ({file_size_str})...")
 
             self.s3_client.upload_file(
                 str(file_path),
                 self.bucket_name,
                 s3_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=self.transfer_config
             )
 
-            logger.info(f"✓ Uploaded: {s3_key}")
+            if verbose:
+                logger.info(f"✓ Uploaded: {s3_key}")
             return True
 
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
+            # A missing bucket fails every upload, so let the caller stop early
+            if _is_missing_bucket(e):
+                raise
             logger.error(f"✗ Error uploading {file_path.name}: {e}")
             return False
 
-    def upload_directory(self, directory, s3_prefix='', pattern=None, metadata=None):
-        """Upload all files matching a pattern from a directory to S3."""
+    def upload_directory(self, directory, s3_prefix='', pattern=None, metadata=None, verbose=False):
+        """Upload all files matching a pattern from a directory to S3 (verbose logs each file)."""
         directory = Path(directory)
         pattern = pattern or config.PROCESSED_FILE_PATTERN
 
-        if not directory.exists():
+        # Find all matching files and their sizes in a single directory scan
+        try:
+            with os.scandir(directory) as entries:
+                files = sorted(
+                    (Path(entry.path), entry.stat().st_size)
+                    for entry in entries
+                    if entry.is_file() and fnmatch(entry.name, pattern)
+                )
+        except FileNotFoundError:
             logger.error(f"✗ Directory not found: {directory}")
             return {**utils.init_results_dict(), 'total': 0}
 
-        # Find all matching files
-        files = sorted(directory.glob(pattern))
-
         if not files:
             logger.warning(f"No files matching '{pattern}' found in {directory}")
             return {**utils.init_results_dict(), 'total': 0}
 
-        logger.info(f"\nFound {len(files)} files to upload:")
-        for f in files:
-            logger.info(f"  - {f.name}")
+        logger.info(f"\nFound {len(files)} files to upload")
+        if verbose:
+            for f, _ in files:
+                logger.info(f"  - {f.name}")
 
-        # Upload each file
+        # Upload files concurrently (network-bound, boto3 releases the GIL)
         results = utils.init_results_dict()
 
-        for file_path in files:
-            s3_key = f"{s3_prefix}/{file_path.name}" if s3_prefix else file_path.name
-
-            # Add timestamp to metadata
-            upload_metadata = metadata.copy() if metadata else {}
-            upload_metadata.update({
-                'upload_time': datetime.utcnow().isoformat(),
-                'original_filename': file_path.name
-            })
-
-            success = self.upload_file(file_path, s3_key, upload_metadata)
-            results['success' if success else 'failed'] += 1
+        # Metadata shared by every file in this batch, built once
+        base_metadata = {
+            **(metadata or {}),
+            'upload_time': datetime.now(timezone.utc).isoformat()
+        }
+
+        with ThreadPoolExecutor(max_workers=config.S3_UPLOAD_WORKERS) as executor:
+            futures = []
+            for file_path, file_size in files:
+                s3_key = f"{s3_prefix}/{file_path.name}" if s3_prefix else file_path.name
+
+                futures.append(executor.submit(
+                    self.upload_file,
+                    file_path,
+                    s3_key,
+                    {**base_metadata, 'original_filename': file_path.name},
+                    file_size,
+                    verbose
+                ))
+
+            for future in as_completed(futures):
+                results['success' if future.result() else 'failed'] += 1
 
         results['total'] = len(files)
         utils.print_summary("Upload Summary", results, separator_width=60)
 
         return results
 
-    def list_bucket_objects(self, prefix='', max_keys=100):
-        """List objects in the S3 bucket."""
+    def list_bucket_objects(self, prefix='', max_keys=None):
+        """List objects in the S3 bucket (max_keys=None lists all of them)."""
         try:
-            response = self.s3_client.list_objects_v2(
+            # Paginate with full 1000-key pages so nothing is silently truncated
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(
                 Bucket=self.bucket_name,
                 Prefix=prefix,
-                MaxKeys=max_keys
+                PaginationConfig={'PageSize': 1000, 'MaxItems': max_keys}
             )
+            objects = [obj['Key'] for page in pages for obj in page.get('Contents', [])]
 
-            if 'Contents' in response:
-                objects = [obj['Key'] for obj in response['Contents']]
+            if objects:
                 logger.info(f"\nFound {len(objects)} objects in bucket:")
                 for obj in objects:
                     logger.info(f"  - {obj}")
@@ -153,36 +205,40 @@ class S3Uploader:
         """Delete objects older than specified number of days."""
         days_old = days_old or config.S3_RETENTION_DAYS
 
-        try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
-
-            if 'Contents' not in response:
-                logger.info("No objects to delete")
-                return 0
+        # Cutoff computed once; LastModified is timezone-aware UTC
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
 
-            # Filter objects by age
-            cutoff_date = datetime.utcnow().timestamp() - (days_old * 86400)
+        try:
+            # Paginate so prefixes with more than 1000 objects are fully scanned
+            paginator = self.s3_client.get_paginator('list_objects_v2')
             old_objects = [
                 {'Key': obj['Key']}
-                for obj in response['Contents']
-                if obj['LastModified'].timestamp() < cutoff_date
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+                for obj in page.get('Contents', [])
+                if obj['LastModified'] < cutoff_date
             ]
 
             if not old_objects:
                 logger.info(f"No objects older than {days_old} days found")
                 return 0
 
-            # Delete old objects
+            # Delete old objects (delete_objects accepts at most 1000 keys per request)
             logger.info(f"\nDeleting {len(old_objects)} old objects...")
-            delete_response = self.s3_client.delete_objects(
-                Bucket=self.bucket_name,
-                Delete={'Objects': old_objects}
-            )
+            batches = [
+                old_objects[i:i + DELETE_BATCH_SIZE]
+                for i in range(0, len(old_objects), DELETE_BATCH_SIZE)
+            ]
+
+            with ThreadPoolExecutor(max_workers=config.S3_UPLOAD_WORKERS) as executor:
+                responses = executor.map(
+                    lambda batch: self.s3_client.delete_objects(
+                        Bucket=self.bucket_name,
+                        Delete={'Objects': batch}
+                    ),
+                    batches
+                )
+                deleted_count = sum(len(r.get('Deleted', [])) for r in responses)
 
-            deleted_count = len(delete_response.get('Deleted', []))
             logger.info(f"✓ Deleted {deleted_count} objects")
             return deleted_count
 
@@ -194,17 +250,18 @@ class S3Uploader:
         """Delete all files in a local directory."""
         directory = Path(directory)
 
-        if not directory.exists():
+        try:
+            # DirEntry.is_file() uses the type from the directory listing (no stat)
+            with os.scandir(directory) as entries:
+                files = [entry for entry in entries if entry.is_file()]
+        except FileNotFoundError:
             logger.info(f"ℹ Directory does not exist: {directory}")
             return True
-
-        if not directory.is_dir():
+        except NotADirectoryError:
             logger.error(f"✗ Path is not a directory: {directory}")
             return False
 
         try:
-            files = [f for f in directory.iterdir() if f.is_file()]
-
             if not files:
                 logger.info(f"ℹ No files to delete in: {directory}")
                 return True
@@ -226,23 +283,29 @@ class S3Uploader:
             return False
 
     @staticmethod
-    def _delete_file(file_path):
-        """Helper to delete a single file."""
+    def _delete_file(entry):
+        """Helper to delete a single file from a scandir entry."""
         try:
-            file_path.unlink()
+            os.unlink(entry.path)
             return True
         except Exception as e:
-            logger.error(f"  ✗ Failed to delete {file_path.name}: {e}")
+            logger.error(f"  ✗ Failed to delete {entry.name}: {e}")
             return False
 
 
-def main():
-    """Main function to upload HRRR GRIB files to S3."""
+def main(delete_old=False):
+    """
+    Main function to upload HRRR GRIB files to S3.
+
+    Args:
+        delete_old: Also scan and delete expired objects client-side. Normally
+            not needed: the bucket lifecycle rule in main.tf expires them.
+    """
     logger.info("S3 Wind Data Upload")
     logger.info("=" * 60)
 
     # Generate S3 prefix with current date
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     s3_prefix = config.S3_PREFIX_TEMPLATE.format(
         year=now.year,
         month=now.month,
@@ -258,20 +321,22 @@ def main():
         # Initialize uploader
         uploader = S3Uploader()
 
-        # Check if bucket exists
-        if not uploader.check_bucket_exists():
+        # Step 1: Upload processed GRIB files (no HEAD preflight; a missing
+        # bucket surfaces from the uploads themselves)
+        logger.info("\nStep 1: Uploading processed GRIB files to S3...")
+        try:
+            results = uploader.upload_directory(
+                directory=str(config.PROCESSED_DIR),
+                s3_prefix=s3_prefix,
+                metadata=config.S3_METADATA
+            )
+        except (ClientError, S3UploadFailedError) as e:
+            if not _is_missing_bucket(e):
+                raise
             logger.error("\n✗ Bucket does not exist. Please run Terraform to create it:")
             logger.error("  terraform apply")
             return
 
-        # Step 1: Upload processed GRIB files
-        logger.info("\nStep 1: Uploading processed GRIB files to S3...")
-        results = uploader.upload_directory(
-            directory=str(config.PROCESSED_DIR),
-            s3_prefix=s3_prefix,
-            metadata=config.S3_METADATA
-        )
-
         if results['failed'] > 0:
             logger.warning(f"\n⚠ {results['failed']} files failed to upload")
 
@@ -281,16 +346,18 @@ def main():
 
         # Step 2: List uploaded objects
         logger.info("\nStep 2: Verifying uploaded files...")
-        uploader.list_bucket_objects(prefix=s3_prefix, max_keys=50)
+        uploader.list_bucket_objects(prefix=s3_prefix)
 
         # Step 3: Cleanup local files
         logger.info("\nStep 3: Cleaning up local files...")
         uploader.cleanup_local_directory(config.RAW_GRIB_DIR)
         uploader.cleanup_local_directory(config.PROCESSED_DIR)
 
-        # Step 4: Delete old S3 objects
-        logger.info("\nStep 4: Cleaning up old S3 objects...")
-        uploader.delete_old_objects(prefix='hrrr/')
+        # Step 4: Old S3 objects expire server-side via the lifecycle rule;
+        # the list+delete scan only runs when explicitly requested
+        if delete_old:
+            logger.info("\nStep 4: Cleaning up old S3 objects...")
+            uploader.delete_old_objects(prefix='hrrr/')
 
         logger.info("\n" + "=" * 60)
         logger.info("Upload process complete!")
@@ -304,4 +371,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Upload processed HRRR wind GRIB files to S3")
+    parser.add_argument(
+        "--delete-old",
+        action="store_true",
+        help="Also delete objects older than the retention period (normally handled by the S3 lifecycle rule)"
+    )
+    args = parser.parse_args()
+
+    main(delete_old=args.delete_old)
@@ -7,10 +7,17 @@ Common helper functions used across multiple modules.
 
 from pathlib import Path
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Union
 from zoneinfo import ZoneInfo
 import config
 
+# Time zones resolved once at import
+_UTC = ZoneInfo("UTC")
+_LOCAL_TZ = ZoneInfo(config.TIMEZONE)
+
+# (unit, divisor) indexed by size.bit_length() // 10
+_SIZE_UNITS = (('B', 1), ('KB', 1 << 10), ('MB', 1 << 20), ('GB', 1 << 30))
+
 
 def ensure_directory(directory: Path) -> Path:
     """
@@ -53,12 +60,10 @@ def get_current_time_est() -> datetime:
     Returns:
         datetime: Current time in EST (timezone-naive)
     """
-    utc_now = datetime.now(ZoneInfo("UTC"))
-    est_now = utc_now.astimezone(ZoneInfo(config.TIMEZONE))
-    return est_now.replace(tzinfo=None)
+    return datetime.now(_UTC).astimezone(_LOCAL_TZ).replace(tzinfo=None)
 
 
-def format_file_size(size_bytes: int) -> str:
+def format_file_size(size_bytes: Union[int, float]) -> str:
     """
     Format file size in human-readable format.
 
@@ -68,14 +73,12 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         str: Formatted size (e.g., "12.3 MB")
     """
-    if size_bytes < 1024:
+    index = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if index == 0:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 ** 2:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 ** 3:
-        return f"{size_bytes / 1024 ** 2:.1f} MB"
-    else:
-        return f"{size_bytes / 1024 ** 3:.1f} GB"
+
+    unit, divisor = _SIZE_UNITS[index]
+    return f"{size_bytes / divisor:.1f} {unit}"
 
 
 def find_nearest_hour(target_hour: int, available_hours: list, prefer_future: bool = True) -> int:
@@ -96,24 +99,16 @@ def find_nearest_hour(target_hour: int, available_hours: list, prefer_future: bo
     if target_hour in available_hours:
         return target_hour
 
-    # Calculate distances
-    distances = []
-    for hour in available_hours:
+    def sort_key(hour):
         diff = abs(hour - target_hour)
         # Consider wrapping around midnight
         wrapped_diff = min(diff, 24 - diff)
+        # Prefer future hours if specified (0 = higher priority)
+        priority = 0 if prefer_future and hour >= target_hour else 1
+        return wrapped_diff, priority, hour
 
-        # Prefer future hours if specified
-        if prefer_future and hour >= target_hour:
-            priority = 0  # Higher priority
-        else:
-            priority = 1  # Lower priority
-
-        distances.append((wrapped_diff, priority, hour))
-
-    # Sort by distance, then priority
-    distances.sort()
-    return distances[0][2]
+    # Single pass by distance, then priority (no intermediate list or sort)
+    return min(available_hours, key=sort_key)
 
 
 def init_results_dict() -> Dict[str, int]:
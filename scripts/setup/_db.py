@@ -0,0 +1,115 @@
+"""
+Shared database engine, transaction settings and SQL file loader for the
+setup scripts.
+
+Builds the connection URL once with sqlalchemy.URL.create (so passwords with
+special characters need no escaping) and caches the engine per process, so
+scripts that call each other (e.g. load_nhd_data.py -> init_nhd_schema.py)
+reuse one warmed connection instead of reconnecting for every step.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import URL, create_engine
+from sqlalchemy.pool import NullPool
+
+
+def get_database_url():
+    """
+    Resolve the database URL from the environment.
+
+    Uses DATABASE_URL when set, otherwise builds one from DATABASE_USER,
+    DATABASE_PASSWORD, DATABASE_HOST, DATABASE_PORT and DATABASE_NAME.
+
+    Returns:
+        str | URL | None: Connection URL, or None if nothing is configured
+    """
+    load_dotenv()
+
+    database_url = os.getenv('DATABASE_URL')
+    if database_url:
+        return database_url
+
+    if not os.getenv('DATABASE_HOST'):
+        return None
+
+    port = os.getenv('DATABASE_PORT')
+    return URL.create(
+        "postgresql",
+        username=os.getenv('DATABASE_USER'),
+        password=os.getenv('DATABASE_PASSWORD'),
+        host=os.getenv('DATABASE_HOST'),
+        port=int(port) if port else None,
+        database=os.getenv('DATABASE_NAME'),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_engine(one_shot=False):
+    """
+    Get the (cached) engine for the configured database.
+
+    The pooled engine is sized by POOL_SIZE / POOL_MAX_OVERFLOW (default
+    5 / 10), pings connections before use and recycles them after 30 min.
+
+    Args:
+        one_shot: Don't pool connections (each checkout opens a new one)
+
+    Returns:
+        Engine | None: SQLAlchemy engine, or None if no database is configured
+    """
+    url = get_database_url()
+    if url is None:
+        return None
+
+    if one_shot:
+        return create_engine(url, poolclass=NullPool)
+    return create_engine(
+        url,
+        pool_size=int(os.getenv('POOL_SIZE', 5)),
+        max_overflow=int(os.getenv('POOL_MAX_OVERFLOW', 10)),
+        pool_timeout=30,
+        # Recycle before server/load-balancer idle timeouts drop the socket
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        # Reuse the most recently returned (still warm) connection first
+        pool_use_lifo=True,
+    )
+
+
+def tune_setup_transaction(conn, bulk=False):
+    """
+    Apply setup-friendly settings to the current transaction (SET LOCAL).
+
+    The setup scripts only create recreatable objects, so the commit doesn't
+    need to wait for the WAL fsync (synchronous_commit = off; a crash can
+    lose the last commit but never corrupts anything).
+
+    Args:
+        conn: Open SQLAlchemy connection (inside a transaction)
+        bulk: Also raise sort/index-build memory for bulk loads and index builds
+    """
+    conn.exec_driver_sql("SET LOCAL synchronous_commit = off")
+    if bulk:
+        conn.exec_driver_sql("SET LOCAL work_mem = '256MB'")
+        conn.exec_driver_sql("SET LOCAL maintenance_work_mem = '1GB'")
+
+
+@lru_cache(maxsize=None)
+def load_sql(name):
+    """
+    Read a SQL script from scripts/setup (cached per process).
+
+    Args:
+        name: File name, e.g. 'create_map_current_conditions_view.sql'
+
+    Returns:
+        str: Script contents
+
+    Raises:
+        FileNotFoundError: If the script does not exist
+    """
+    return (Path(__file__).parent / name).read_text(encoding='utf-8')
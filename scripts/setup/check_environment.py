@@ -5,7 +5,9 @@ Verifies that all required packages are available.
 Run this before ingestion to ensure environment is correct.
 """
 
+import importlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 print("=" * 60)
 print("FNWM Environment Check")
@@ -25,26 +27,37 @@ packages_to_check = [
     'dotenv'
 ]
 
+# Distribution names shown for modules whose import name differs
+display_names = {
+    'dotenv': 'python-dotenv'
+}
+
+
+def probe(package_name):
+    """Import a package and return (name, version, error)."""
+    try:
+        pkg = importlib.import_module(package_name)
+        return package_name, getattr(pkg, '__version__', 'unknown'), None
+    except ImportError as e:
+        return package_name, None, e
+
+
 print("\n" + "=" * 60)
 print("Package Versions:")
 print("=" * 60)
 
+# Import concurrently (heavy imports are mostly file I/O and C extension init);
+# map() keeps the results in list order
+with ThreadPoolExecutor(max_workers=len(packages_to_check)) as executor:
+    results = list(executor.map(probe, packages_to_check))
+
 all_ok = True
 
-for package_name in packages_to_check:
-    try:
-        if package_name == 'dotenv':
-            import importlib
-            pkg = importlib.import_module('dotenv')
-            module_name = 'python-dotenv'
-        else:
-            import importlib
-            pkg = importlib.import_module(package_name)
-            module_name = package_name
-
-        version = getattr(pkg, '__version__', 'unknown')
+for package_name, version, error in results:
+    if error is None:
+        module_name = display_names.get(package_name, package_name)
         print(f"✅ {module_name:20} {version}")
-    except ImportError as e:
+    else:
         print(f"❌ {package_name:20} NOT FOUND")
         all_ok = False
 
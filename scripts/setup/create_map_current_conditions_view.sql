@@ -151,38 +151,101 @@ LEFT JOIN LATERAL (
     WHERE nfs.nhdplusid = f.nhdplusid
 ) fs ON true
 
--- Join to temperature data (latest reading)
-LEFT JOIN LATERAL (
+-- Join to temperature data (latest reading, kept per reach in temperature_latest)
+LEFT JOIN (
     SELECT
-        tt.temperature_2m as air_temp_c,
-        tt.apparent_temperature as apparent_temp_c,
-        tt.precipitation as precipitation_mm,
-        tt.cloud_cover as cloud_cover_pct,
-        tt.valid_time as temp_valid_time
-    FROM temperature_timeseries tt
-    WHERE tt.nhdplusid = f.nhdplusid
-    ORDER BY tt.valid_time DESC
-    LIMIT 1
-) temp ON true
+        tl.nhdplusid,
+        tl.temperature_2m as air_temp_c,
+        tl.apparent_temperature as apparent_temp_c,
+        tl.precipitation as precipitation_mm,
+        tl.cloud_cover as cloud_cover_pct,
+        tl.valid_time as temp_valid_time
+    FROM temperature_latest tl
+) temp ON temp.nhdplusid = f.nhdplusid
 
 WHERE latest.valid_time IS NOT NULL;  -- Only include reaches with hydrology data
 
 -- Create indexes for efficient querying
 CREATE INDEX idx_map_current_geom ON map_current_conditions USING GIST (geom);
-CREATE INDEX idx_map_current_feature ON map_current_conditions (feature_id);
+-- Unique (one row per flowline): required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_map_current_feature ON map_current_conditions (feature_id);
 CREATE INDEX idx_map_current_bdi ON map_current_conditions (bdi_category);
 CREATE INDEX idx_map_current_drainage ON map_current_conditions (drainage_area_sqkm);
 CREATE INDEX idx_map_current_flow ON map_current_conditions (streamflow);
 
+-- Refresh watermarks (newest ingested_at values covered by the last refresh)
+-- and staleness metadata; consumers check refreshed_at before refreshing
+CREATE TABLE IF NOT EXISTS map_refresh_state (
+    view_name TEXT PRIMARY KEY,
+    hydro_ingested_at TIMESTAMPTZ,
+    temp_ingested_at TIMESTAMPTZ,
+    refreshed_at TIMESTAMPTZ DEFAULT NOW(),
+    row_count BIGINT
+);
+ALTER TABLE map_refresh_state ADD COLUMN IF NOT EXISTS row_count BIGINT;
+ALTER TABLE map_refresh_state ALTER COLUMN temp_ingested_at TYPE TIMESTAMPTZ;
+
+-- The view was just populated from current data
+INSERT INTO map_refresh_state (view_name, hydro_ingested_at, temp_ingested_at, refreshed_at, row_count)
+SELECT
+    'map_current_conditions',
+    (SELECT MAX(ingested_at) FROM hydro_timeseries WHERE source = 'analysis_assim'),
+    (SELECT MAX(ingested_at) FROM temperature_latest),
+    NOW(),
+    (SELECT COUNT(*) FROM map_current_conditions)
+ON CONFLICT (view_name) DO UPDATE
+    SET hydro_ingested_at = EXCLUDED.hydro_ingested_at,
+        temp_ingested_at = EXCLUDED.temp_ingested_at,
+        refreshed_at = EXCLUDED.refreshed_at,
+        row_count = EXCLUDED.row_count;
+
 -- Refresh function for easy updates
-CREATE OR REPLACE FUNCTION refresh_map_current_conditions()
-RETURNS void AS $$
+-- Skips the refresh when nothing was ingested since the last one (unless forced),
+-- or when another session is already refreshing (instead of queueing behind it).
+-- CONCURRENTLY diffs the new result against the view and writes only changed
+-- rows, so WAL and index maintenance scale with the delta, and readers are
+-- not blocked.
+DROP FUNCTION IF EXISTS refresh_map_current_conditions();
+DROP FUNCTION IF EXISTS refresh_map_current_conditions(BOOLEAN);
+CREATE FUNCTION refresh_map_current_conditions(force BOOLEAN DEFAULT false)
+RETURNS BOOLEAN AS $$
+DECLARE
+    hydro_ts TIMESTAMPTZ;
+    temp_ts TIMESTAMPTZ;
+    state map_refresh_state%ROWTYPE;
 BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('refresh_map_current_conditions')) THEN
+        RETURN false;
+    END IF;
+
+    SELECT MAX(ingested_at) INTO hydro_ts FROM hydro_timeseries WHERE source = 'analysis_assim';
+    SELECT MAX(ingested_at) INTO temp_ts FROM temperature_latest;
+
+    SELECT * INTO state FROM map_refresh_state WHERE view_name = 'map_current_conditions';
+
+    IF NOT force AND FOUND
+       AND hydro_ts IS NOT DISTINCT FROM state.hydro_ingested_at
+       AND temp_ts IS NOT DISTINCT FROM state.temp_ingested_at THEN
+        RETURN false;
+    END IF;
+
     REFRESH MATERIALIZED VIEW CONCURRENTLY map_current_conditions;
+
+    INSERT INTO map_refresh_state (view_name, hydro_ingested_at, temp_ingested_at, refreshed_at, row_count)
+    VALUES ('map_current_conditions', hydro_ts, temp_ts, NOW(), (SELECT COUNT(*) FROM map_current_conditions))
+    ON CONFLICT (view_name) DO UPDATE
+        SET hydro_ingested_at = EXCLUDED.hydro_ingested_at,
+            temp_ingested_at = EXCLUDED.temp_ingested_at,
+            refreshed_at = EXCLUDED.refreshed_at,
+            row_count = EXCLUDED.row_count;
+
+    RETURN true;
 END;
 $$ LANGUAGE plpgsql;
 
 COMMENT ON MATERIALIZED VIEW map_current_conditions IS
 'Map-ready view combining NHD flowline geometry with latest hydrology metrics.
 Enables fast GeoJSON export and map rendering.
-Refresh after new data ingestion using: SELECT refresh_map_current_conditions();';
+Refresh after new data ingestion using: SELECT refresh_map_current_conditions();
+(returns false when no new data was ingested; pass true to force after deletes)
+Last refresh time and row count: map_refresh_state';
@@ -1,39 +1,79 @@
 -- Create table to store reach centroids for temperature API queries
--- Extracts lat/lon from PostGIS spatial geometries in nhd_flowlines
+-- Copies the lat/lon midpoints cached on nhd_flowlines
 
-CREATE TABLE IF NOT EXISTS nhd_reach_centroids (
-    nhdplusid BIGINT PRIMARY KEY,
-    permanent_identifier VARCHAR(50) NOT NULL,
-    latitude DOUBLE PRECISION NOT NULL,
-    longitude DOUBLE PRECISION NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+-- Build the centroids into an unlogged staging table, then swap it in.
+-- CTAS into an UNLOGGED table writes no per-row WAL and has no indexes or
+-- conflict checks to maintain while it fills; constraints and indexes are
+-- built once afterwards.
+-- The midpoint along each LineString (ST_LineInterpolatePoint(geom, 0.5)) is
+-- cached in the nhd_flowlines.centroid_lat/centroid_lon generated columns,
+-- so this is a plain column copy.
+-- The table (not a view) is kept because temperature_timeseries references it.
+BEGIN;
 
-    -- Foreign key to nhd_flowlines
-    CONSTRAINT fk_nhd_flowlines
-        FOREIGN KEY (nhdplusid)
-        REFERENCES nhd_flowlines(nhdplusid)
-        ON DELETE CASCADE
-);
+DROP TABLE IF EXISTS nhd_reach_centroids_new;
 
--- Create index for spatial queries
-CREATE INDEX IF NOT EXISTS idx_nhd_centroids_latlon
-    ON nhd_reach_centroids(latitude, longitude);
-
--- Populate table with centroids from nhd_flowlines
--- Uses ST_Centroid to extract center point from LineString geometries
--- ST_Y extracts latitude, ST_X extracts longitude
-INSERT INTO nhd_reach_centroids (nhdplusid, permanent_identifier, latitude, longitude)
+CREATE UNLOGGED TABLE nhd_reach_centroids_new AS
 SELECT
     nhdplusid,
     permanent_identifier,
-    ST_Y(ST_Centroid(geom)) AS latitude,
-    ST_X(ST_Centroid(geom)) AS longitude
+    centroid_lat AS latitude,
+    centroid_lon AS longitude,
+    CURRENT_TIMESTAMP::timestamp AS created_at
 FROM nhd_flowlines
-WHERE geom IS NOT NULL
-ON CONFLICT (nhdplusid) DO UPDATE
-    SET permanent_identifier = EXCLUDED.permanent_identifier,
-        latitude = EXCLUDED.latitude,
-        longitude = EXCLUDED.longitude;
+WHERE centroid_lat IS NOT NULL
+-- Geohash order keeps neighbouring reaches on the same heap pages
+ORDER BY ST_GeoHash(ST_SetSRID(ST_MakePoint(centroid_lon, centroid_lat), 4326), 8);
+
+ALTER TABLE nhd_reach_centroids_new SET LOGGED;
+
+-- CASCADE drops temperature_timeseries.fk_temperature_reach; re-added below
+DROP TABLE IF EXISTS nhd_reach_centroids CASCADE;
+ALTER TABLE nhd_reach_centroids_new RENAME TO nhd_reach_centroids;
+
+ALTER TABLE nhd_reach_centroids
+    ALTER COLUMN permanent_identifier SET NOT NULL,
+    ALTER COLUMN latitude SET NOT NULL,
+    ALTER COLUMN longitude SET NOT NULL,
+    ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP,
+    ADD PRIMARY KEY (nhdplusid),
+
+    -- Reject invalid coordinates on write
+    ADD CONSTRAINT chk_latlon
+        CHECK (latitude BETWEEN -90 AND 90 AND longitude BETWEEN -180 AND 180),
+
+    -- Foreign key to nhd_flowlines
+    ADD CONSTRAINT fk_nhd_flowlines
+        FOREIGN KEY (nhdplusid)
+        REFERENCES nhd_flowlines(nhdplusid)
+        ON DELETE CASCADE;
+
+-- Covering index for spatial queries: the temperature fetcher reads
+-- (nhdplusid, latitude, longitude) with an index-only scan
+CREATE INDEX idx_nhd_centroids_latlon
+    ON nhd_reach_centroids(latitude, longitude)
+    INCLUDE (nhdplusid, permanent_identifier);
+
+-- Record the geohash order so a later plain CLUSTER keeps it
+CREATE INDEX idx_centroids_geohash
+    ON nhd_reach_centroids(ST_GeoHash(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326), 8));
+ALTER TABLE nhd_reach_centroids CLUSTER ON idx_centroids_geohash;
+
+DO $$
+BEGIN
+    IF to_regclass('temperature_timeseries') IS NOT NULL THEN
+        ALTER TABLE temperature_timeseries
+            ADD CONSTRAINT fk_temperature_reach
+            FOREIGN KEY (nhdplusid)
+            REFERENCES nhd_reach_centroids(nhdplusid)
+            ON DELETE CASCADE;
+    END IF;
+END $$;
+
+COMMIT;
+
+-- VACUUM sets the visibility map so index-only scans skip the heap
+VACUUM (ANALYZE) nhd_reach_centroids;
 
 -- Verify results
 SELECT
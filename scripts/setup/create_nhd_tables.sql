@@ -50,10 +50,35 @@ CREATE TABLE IF NOT EXISTS nhd_flowlines (
     maxelevsmo INTEGER,                      -- Smoothed maximum elevation (centimeters)
     minelevsmo INTEGER,                      -- Smoothed minimum elevation (centimeters)
 
-    -- Derived Metrics (computed on insert/update)
-    gradient_class VARCHAR(20),              -- pool/run/riffle/cascade
-    size_class VARCHAR(20),                  -- headwater/creek/small_river/river/large_river
-    elev_drop_m_per_km DOUBLE PRECISION,     -- Elevation drop (meters per kilometer)
+    -- Derived Metrics (generated columns, computed as each row is written)
+    -- pool/run/riffle/cascade
+    gradient_class VARCHAR(20) GENERATED ALWAYS AS (
+        CASE
+            WHEN slope IS NULL THEN NULL
+            WHEN slope < 0.001 THEN 'pool'
+            WHEN slope < 0.01 THEN 'run'
+            WHEN slope < 0.05 THEN 'riffle'
+            ELSE 'cascade'
+        END
+    ) STORED,
+    -- headwater/creek/small_river/river/large_river
+    size_class VARCHAR(20) GENERATED ALWAYS AS (
+        CASE
+            WHEN totdasqkm IS NULL THEN NULL
+            WHEN totdasqkm < 10 THEN 'headwater'
+            WHEN totdasqkm < 100 THEN 'creek'
+            WHEN totdasqkm < 1000 THEN 'small_river'
+            WHEN totdasqkm < 10000 THEN 'river'
+            ELSE 'large_river'
+        END
+    ) STORED,
+    -- Elevation drop (meters per kilometer; elevations are in centimeters)
+    elev_drop_m_per_km DOUBLE PRECISION GENERATED ALWAYS AS (
+        CASE
+            WHEN maxelevraw IS NOT NULL AND minelevraw IS NOT NULL AND lengthkm > 0
+            THEN ((maxelevraw - minelevraw) / 100.0) / lengthkm
+        END
+    ) STORED,
 
     -- Administrative Metadata
     vpuid VARCHAR(4),                        -- Vector Processing Unit ID
@@ -64,6 +89,12 @@ CREATE TABLE IF NOT EXISTS nhd_flowlines (
     -- Spatial Geometry (PostGIS LineString)
     geom GEOMETRY(LINESTRING, 4326) NOT NULL,
 
+    -- Midpoint along the line, cached for centroid consumers. Computed once
+    -- per row on write (generated columns cannot share a subexpression);
+    -- readers copy the columns and never touch the geometry.
+    centroid_lat DOUBLE PRECISION GENERATED ALWAYS AS (ST_Y(ST_LineInterpolatePoint(geom, 0.5))) STORED,
+    centroid_lon DOUBLE PRECISION GENERATED ALWAYS AS (ST_X(ST_LineInterpolatePoint(geom, 0.5))) STORED,
+
     -- Audit Timestamps
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
@@ -254,49 +285,23 @@ END $$;
 
 
 -- =====================================================================
--- TRIGGER: Auto-compute derived metrics on insert/update
+-- TRIGGER: Keep updated_at current on update
 -- =====================================================================
-CREATE OR REPLACE FUNCTION compute_nhd_derived_metrics()
+-- Derived metrics are generated columns (see nhd_flowlines), so inserts run
+-- no trigger at all
+CREATE OR REPLACE FUNCTION set_nhd_updated_at()
 RETURNS TRIGGER AS $$
 BEGIN
-    -- Compute gradient class
-    NEW.gradient_class := CASE
-        WHEN NEW.slope IS NULL THEN NULL
-        WHEN NEW.slope < 0.001 THEN 'pool'
-        WHEN NEW.slope < 0.01 THEN 'run'
-        WHEN NEW.slope < 0.05 THEN 'riffle'
-        ELSE 'cascade'
-    END;
-
-    -- Compute size class based on drainage area
-    NEW.size_class := CASE
-        WHEN NEW.totdasqkm IS NULL THEN NULL
-        WHEN NEW.totdasqkm < 10 THEN 'headwater'
-        WHEN NEW.totdasqkm < 100 THEN 'creek'
-        WHEN NEW.totdasqkm < 1000 THEN 'small_river'
-        WHEN NEW.totdasqkm < 10000 THEN 'river'
-        ELSE 'large_river'
-    END;
-
-    -- Compute elevation drop (meters per kilometer)
-    IF NEW.maxelevraw IS NOT NULL AND NEW.minelevraw IS NOT NULL
-       AND NEW.lengthkm IS NOT NULL AND NEW.lengthkm > 0 THEN
-        -- Convert cm to m, then divide by length
-        NEW.elev_drop_m_per_km := ((NEW.maxelevraw - NEW.minelevraw) / 100.0) / NEW.lengthkm;
-    END IF;
-
-    -- Update timestamp
     NEW.updated_at := NOW();
-
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
 
-DROP TRIGGER IF EXISTS trigger_compute_nhd_metrics ON nhd_flowlines;
-CREATE TRIGGER trigger_compute_nhd_metrics
-    BEFORE INSERT OR UPDATE ON nhd_flowlines
+DROP TRIGGER IF EXISTS trigger_nhd_updated_at ON nhd_flowlines;
+CREATE TRIGGER trigger_nhd_updated_at
+    BEFORE UPDATE ON nhd_flowlines
     FOR EACH ROW
-    EXECUTE FUNCTION compute_nhd_derived_metrics();
+    EXECUTE FUNCTION set_nhd_updated_at();
 
 
 -- =====================================================================
@@ -2,16 +2,21 @@
 -- Stores air temperature data from Open-Meteo API for stream reach centroids
 -- Supports both current conditions and forecasts
 
+-- Columns are ordered by descending alignment (8-byte, then 2-byte, then
+-- varlena) so rows carry no alignment padding. This is the canonical column
+-- order for loaders: COPY temperature_timeseries (nhdplusid, valid_time,
+-- ingested_at, temperature_2m, apparent_temperature, precipitation,
+-- forecast_hour, cloud_cover, source).
 CREATE TABLE IF NOT EXISTS temperature_timeseries (
     nhdplusid BIGINT NOT NULL,
-    valid_time TIMESTAMP NOT NULL,
+    valid_time TIMESTAMPTZ NOT NULL,
+    ingested_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     temperature_2m DOUBLE PRECISION,  -- Air temperature at 2m (°C)
     apparent_temperature DOUBLE PRECISION,  -- "Feels like" temperature (°C)
     precipitation DOUBLE PRECISION,  -- Precipitation (mm)
+    forecast_hour SMALLINT,  -- NULL or 0 for current, >0 for forecast
     cloud_cover SMALLINT,  -- Cloud cover (%)
     source VARCHAR(50) NOT NULL DEFAULT 'open-meteo',
-    forecast_hour SMALLINT,  -- NULL or 0 for current, >0 for forecast
-    ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
     -- Foreign key to nhd_reach_centroids
     CONSTRAINT fk_temperature_reach
@@ -20,23 +25,69 @@ CREATE TABLE IF NOT EXISTS temperature_timeseries (
         ON DELETE CASCADE,
 
     -- Prevent duplicate entries for same reach/time/source/forecast_hour
+    -- (includes valid_time, as required for a partitioned table)
     CONSTRAINT unique_temperature_reading
         UNIQUE (nhdplusid, valid_time, source, forecast_hour)
-);
+) PARTITION BY RANGE (valid_time);
+
+-- Monthly partitions (temperature_timeseries_YYYY_MM) are created for a
+-- rolling window by create_temperature_partitions(), defined and scheduled
+-- (via pg_cron, when installed) by init_temperature_tables.py.
+-- Readings outside the window land in the default partition.
+CREATE TABLE IF NOT EXISTS temperature_timeseries_default
+    PARTITION OF temperature_timeseries DEFAULT;
 
 -- Create indexes for efficient queries
 CREATE INDEX IF NOT EXISTS idx_temp_reach_time
     ON temperature_timeseries(nhdplusid, valid_time);
 
+-- Indexes are declared on the parent and propagate to every partition
+-- BRIN for the append-ordered valid_time column: far smaller than a btree
+-- and cheap to maintain on insert, still prunes time-range scans
 CREATE INDEX IF NOT EXISTS idx_temp_valid_time
-    ON temperature_timeseries(valid_time);
+    ON temperature_timeseries USING BRIN (valid_time)
+    WITH (pages_per_range = 32);
+
+-- No index on source: it is effectively single-valued ('open-meteo')
+
+-- Latest reading per reach, maintained by trigger (joined by map_current_conditions)
+CREATE TABLE IF NOT EXISTS temperature_latest (
+    nhdplusid BIGINT PRIMARY KEY,
+    valid_time TIMESTAMPTZ NOT NULL,
+    ingested_at TIMESTAMPTZ,
+    temperature_2m DOUBLE PRECISION,
+    apparent_temperature DOUBLE PRECISION,
+    precipitation DOUBLE PRECISION,
+    cloud_cover SMALLINT
+);
 
-CREATE INDEX IF NOT EXISTS idx_temp_source
-    ON temperature_timeseries(source);
+CREATE OR REPLACE FUNCTION update_temperature_latest()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO temperature_latest (
+        nhdplusid, valid_time, temperature_2m, apparent_temperature,
+        precipitation, cloud_cover, ingested_at
+    ) VALUES (
+        NEW.nhdplusid, NEW.valid_time, NEW.temperature_2m, NEW.apparent_temperature,
+        NEW.precipitation, NEW.cloud_cover, NEW.ingested_at
+    )
+    ON CONFLICT (nhdplusid) DO UPDATE
+        SET valid_time = EXCLUDED.valid_time,
+            temperature_2m = EXCLUDED.temperature_2m,
+            apparent_temperature = EXCLUDED.apparent_temperature,
+            precipitation = EXCLUDED.precipitation,
+            cloud_cover = EXCLUDED.cloud_cover,
+            ingested_at = EXCLUDED.ingested_at
+        WHERE EXCLUDED.valid_time >= temperature_latest.valid_time;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
 
--- Create hypertable for time-series optimization (if TimescaleDB is enabled)
--- Uncomment if using TimescaleDB:
--- SELECT create_hypertable('temperature_timeseries', 'valid_time', if_not_exists => TRUE);
+DROP TRIGGER IF EXISTS trigger_temperature_latest ON temperature_timeseries;
+CREATE TRIGGER trigger_temperature_latest
+    AFTER INSERT OR UPDATE ON temperature_timeseries
+    FOR EACH ROW
+    EXECUTE FUNCTION update_temperature_latest();
 
 -- Verification query
 SELECT
@@ -82,27 +82,76 @@ COMMENT ON COLUMN usgs_instantaneous_values.is_provisional IS 'TRUE if data is p
 COMMENT ON COLUMN usgs_instantaneous_values.fetched_at IS 'Timestamp when data was fetched from USGS API';
 
 -- =====================================================================
--- MATERIALIZED VIEW: Latest USGS Readings
--- For quick access to most recent values at each site
+-- TABLE: Latest USGS Readings
+-- Most recent value for each parameter at each site. Kept current by a
+-- trigger on usgs_instantaneous_values, so only the changed
+-- (site, parameter) rows are written on ingest and no refresh is needed.
+-- (Replaces the earlier materialized view of the same name.)
 -- =====================================================================
-CREATE MATERIALIZED VIEW IF NOT EXISTS usgs_latest_readings AS
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_matviews
+        WHERE schemaname = current_schema() AND matviewname = 'usgs_latest_readings'
+    ) THEN
+        DROP MATERIALIZED VIEW usgs_latest_readings;
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS usgs_latest_readings (
+    site_id VARCHAR(50) NOT NULL,
+    parameter_cd VARCHAR(10) NOT NULL,
+    parameter_name VARCHAR(255),
+    value DOUBLE PRECISION,
+    unit VARCHAR(50),
+    measured_at TIMESTAMPTZ NOT NULL,
+    is_provisional BOOLEAN,
+    fetched_at TIMESTAMPTZ,
+    PRIMARY KEY (site_id, parameter_cd)
+);
+
+CREATE OR REPLACE FUNCTION update_usgs_latest_readings()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO usgs_latest_readings (
+        site_id, parameter_cd, parameter_name, value, unit,
+        measured_at, is_provisional, fetched_at
+    ) VALUES (
+        NEW.site_id, NEW.parameter_cd, NEW.parameter_name, NEW.value, NEW.unit,
+        NEW.datetime, NEW.is_provisional, NEW.fetched_at
+    )
+    ON CONFLICT (site_id, parameter_cd) DO UPDATE
+        SET parameter_name = EXCLUDED.parameter_name,
+            value = EXCLUDED.value,
+            unit = EXCLUDED.unit,
+            measured_at = EXCLUDED.measured_at,
+            is_provisional = EXCLUDED.is_provisional,
+            fetched_at = EXCLUDED.fetched_at
+        WHERE EXCLUDED.measured_at >= usgs_latest_readings.measured_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Ingest upserts (INSERT ... ON CONFLICT DO UPDATE) fire the UPDATE trigger
+DROP TRIGGER IF EXISTS trigger_usgs_latest_readings ON usgs_instantaneous_values;
+CREATE TRIGGER trigger_usgs_latest_readings
+    AFTER INSERT OR UPDATE ON usgs_instantaneous_values
+    FOR EACH ROW
+    EXECUTE FUNCTION update_usgs_latest_readings();
+
+-- Readings stored before the trigger existed
+INSERT INTO usgs_latest_readings (
+    site_id, parameter_cd, parameter_name, value, unit,
+    measured_at, is_provisional, fetched_at
+)
 SELECT DISTINCT ON (site_id, parameter_cd)
-    site_id,
-    parameter_cd,
-    parameter_name,
-    value,
-    unit,
-    datetime as measured_at,
-    is_provisional,
-    fetched_at
+    site_id, parameter_cd, parameter_name, value, unit,
+    datetime, is_provisional, fetched_at
 FROM usgs_instantaneous_values
-ORDER BY site_id, parameter_cd, datetime DESC;
-
--- Index on materialized view
-CREATE UNIQUE INDEX IF NOT EXISTS idx_usgs_latest_site_param
-    ON usgs_latest_readings (site_id, parameter_cd);
+ORDER BY site_id, parameter_cd, datetime DESC
+ON CONFLICT (site_id, parameter_cd) DO NOTHING;
 
-COMMENT ON MATERIALIZED VIEW usgs_latest_readings IS 'Latest reading for each parameter at each USGS site. Refresh with: REFRESH MATERIALIZED VIEW CONCURRENTLY usgs_latest_readings;';
+COMMENT ON TABLE usgs_latest_readings IS 'Latest reading for each parameter at each USGS site (maintained by trigger on usgs_instantaneous_values).';
 
 -- =====================================================================
 -- SUMMARY
@@ -118,8 +167,8 @@ BEGIN
     RAISE NOTICE '  - 15-minute interval data';
     RAISE NOTICE '  - Primary key: (site_id, parameter_cd, datetime)';
     RAISE NOTICE '';
-    RAISE NOTICE 'Materialized View: usgs_latest_readings';
+    RAISE NOTICE 'Table: usgs_latest_readings';
     RAISE NOTICE '  - Quick access to latest values';
-    RAISE NOTICE '  - Refresh with: REFRESH MATERIALIZED VIEW CONCURRENTLY usgs_latest_readings';
+    RAISE NOTICE '  - Kept current by trigger (no refresh needed)';
     RAISE NOTICE '=====================================================';
 END $$;
@@ -57,9 +57,8 @@ CREATE TABLE IF NOT EXISTS "USGS_Flowsites" (
 CREATE INDEX IF NOT EXISTS idx_usgs_flowsites_geom
     ON "USGS_Flowsites" USING GIST (geom);
 
--- Site ID index (for lookups)
-CREATE INDEX IF NOT EXISTS idx_usgs_flowsites_siteid
-    ON "USGS_Flowsites" ("siteId");
+-- Site ID lookups use the UNIQUE constraint's index; drop the old duplicate
+DROP INDEX IF EXISTS idx_usgs_flowsites_siteid;
 
 -- State index (for filtering by state)
 CREATE INDEX IF NOT EXISTS idx_usgs_flowsites_state
@@ -14,7 +14,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from _db import get_engine
 
 # Configure stdout for UTF-8 on Windows
 if sys.platform == 'win32':
@@ -31,10 +32,10 @@ def init_database():
     # Load environment variables
     load_dotenv()
 
-    database_url = os.getenv('DATABASE_URL')
+    engine = get_engine()
 
-    if not database_url:
-        print("❌ ERROR: DATABASE_URL not found in .env file")
+    if engine is None:
+        print("❌ ERROR: Database connection not configured (DATABASE_URL or DATABASE_* in .env)")
         return False
 
     print("=" * 60)
@@ -46,9 +47,6 @@ def init_database():
     print()
 
     try:
-        # Create engine
-        engine = create_engine(database_url)
-
         with engine.begin() as conn:
             print("✅ Connected to database")
             print()
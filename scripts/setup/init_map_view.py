@@ -7,7 +7,8 @@ the latest hydrology metrics for efficient GeoJSON export and map rendering.
 Based on EPIC 8 from IMPLEMENTATION_GUIDE.md
 
 Usage:
-    python scripts/setup/init_map_view.py
+    python scripts/setup/init_map_view.py            # (re)create the view
+    python scripts/setup/init_map_view.py --refresh  # refresh an existing view
 """
 
 import sys
@@ -18,8 +19,9 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from dotenv import load_dotenv
-import os
-from sqlalchemy import create_engine, text
+import json
+from sqlalchemy import text
+from _db import get_engine, load_sql, tune_setup_transaction
 import logging
 
 # Configure logging
@@ -29,41 +31,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# pg_cron schedule for refresh_map_current_conditions() (no-op when nothing new)
+MAP_REFRESH_SCHEDULE = '*/5 * * * *'
+
+def refresh_map_view(force=False):
+    """
+    Refresh map_current_conditions in place.
+
+    Uses refresh_map_current_conditions(), which skips the refresh when no
+    hydrology/temperature rows were ingested since the last one and otherwise
+    runs REFRESH MATERIALIZED VIEW CONCURRENTLY (only changed rows written).
+
+    Args:
+        force: Refresh even if the ingest watermarks are unchanged
+            (e.g. after rows were deleted)
+
+    Returns:
+        bool: True if the view was refreshed, False if it was already current
+            or another session is refreshing it
+    """
+    load_dotenv()
+    engine = get_engine()
+
+    if engine is None:
+        logger.error("DATABASE_URL (or DATABASE_HOST etc.) not set in environment")
+        sys.exit(1)
+
+    with engine.begin() as conn:
+        tune_setup_transaction(conn, bulk=True)
+        refreshed = conn.execute(
+            text("SELECT refresh_map_current_conditions(:force)"),
+            {'force': force}
+        ).scalar()
+
+    if refreshed:
+        logger.info("✅ map_current_conditions refreshed")
+    else:
+        logger.info("map_current_conditions already up to date (or being refreshed by another session)")
+
+    return refreshed
+
+
 def init_map_view():
     """Create the map_current_conditions materialized view."""
 
     # Load environment
     load_dotenv()
-    database_url = os.getenv('DATABASE_URL')
+    engine = get_engine()
 
-    if not database_url:
-        logger.error("DATABASE_URL not set in environment")
+    if engine is None:
+        logger.error("DATABASE_URL (or DATABASE_HOST etc.) not set in environment")
         sys.exit(1)
 
     # Read SQL file
-    sql_file = project_root / 'scripts' / 'setup' / 'create_map_current_conditions_view.sql'
-
-    if not sql_file.exists():
-        logger.error(f"SQL file not found: {sql_file}")
+    sql_name = 'create_map_current_conditions_view.sql'
+    try:
+        sql_content = load_sql(sql_name)
+    except FileNotFoundError:
+        logger.error(f"SQL file not found: {sql_name}")
         sys.exit(1)
 
-    logger.info(f"Reading SQL from {sql_file}")
-    with open(sql_file, 'r') as f:
-        sql_content = f.read()
-
     # Connect to database
     logger.info("Connecting to database...")
-    engine = create_engine(database_url)
-
     try:
         with engine.begin() as conn:
+            tune_setup_transaction(conn, bulk=True)
             logger.info("Creating materialized view...")
 
-            # Execute the entire SQL as one block (handles multi-statement DDL)
-            conn.execute(text(sql_content))
+            # Execute the entire SQL as one block (handles multi-statement DDL).
+            # Sent to the driver as-is: one round trip, and no bind-parameter
+            # parsing of colons in casts or function bodies.
+            conn.exec_driver_sql(sql_content)
 
             logger.info("Materialized view created successfully!")
 
+            # Periodic refresh, so consumers read a fresh view instead of
+            # each triggering its own refresh
+            has_pg_cron = conn.execute(text(
+                "SELECT 1 FROM pg_extension WHERE extname = 'pg_cron'"
+            )).scalar()
+            if has_pg_cron:
+                conn.execute(text("""
+                    SELECT cron.schedule(
+                        'refresh-map-current-conditions',
+                        :schedule,
+                        'SELECT refresh_map_current_conditions()'
+                    )
+                """), {'schedule': MAP_REFRESH_SCHEDULE})
+                logger.info(f"Scheduled refresh via pg_cron ({MAP_REFRESH_SCHEDULE})")
+
             # Check row count
             result = conn.execute(text("""
                 SELECT COUNT(*) as count
@@ -73,43 +129,32 @@ def init_map_view():
             row_count = result.scalar()
             logger.info(f"✅ View populated with {row_count:,} reaches")
 
-            # Show sample data
-            result = conn.execute(text("""
-                SELECT
-                    feature_id,
-                    gnis_name,
-                    streamflow,
-                    velocity,
-                    bdi,
-                    bdi_category,
-                    flow_percentile,
-                    flow_percentile_category,
-                    air_temp_c,
-                    air_temp_f,
-                    water_temp_estimate_c,
-                    water_temp_estimate_f,
-                    confidence
-                FROM derived.map_current_conditions
-                LIMIT 5
-            """))
+            # Show sample data (serialized server-side; NULLs become JSON null)
+            sample = conn.execute(text("""
+                SELECT jsonb_agg(to_jsonb(t)) AS sample
+                FROM (
+                    SELECT
+                        feature_id,
+                        gnis_name,
+                        streamflow,
+                        velocity,
+                        bdi,
+                        bdi_category,
+                        flow_percentile,
+                        flow_percentile_category,
+                        air_temp_c,
+                        air_temp_f,
+                        water_temp_estimate_c,
+                        water_temp_estimate_f,
+                        confidence
+                    FROM derived.map_current_conditions
+                    LIMIT 5
+                ) t
+            """)).scalar()
 
             logger.info("\nSample data:")
             logger.info("-" * 80)
-            for row in result:
-                bdi_str = f"{row.bdi:.2f}" if row.bdi is not None else "N/A"
-                percentile_str = f"{row.flow_percentile:.1f}" if row.flow_percentile is not None else "N/A"
-                air_temp_str = f"{row.air_temp_f:.1f}°F" if row.air_temp_f is not None else "N/A"
-                water_temp_str = f"{row.water_temp_estimate_f:.1f}°F" if row.water_temp_estimate_f is not None else "N/A"
-
-                logger.info(
-                    f"Feature {row.feature_id} ({row.gnis_name or 'Unnamed'}): "
-                    f"Flow={row.streamflow:.3f} m³/s, "
-                    f"Velocity={row.velocity:.3f} m/s, "
-                    f"BDI={bdi_str} ({row.bdi_category or 'N/A'}), "
-                    f"Percentile={percentile_str} ({row.flow_percentile_category or 'N/A'}), "
-                    f"AirTemp={air_temp_str}, WaterTemp={water_temp_str}, "
-                    f"Confidence={row.confidence}"
-                )
+            logger.info(json.dumps(sample, indent=2, default=str))
 
     except Exception as e:
         logger.error(f"Error creating materialized view: {e}")
@@ -120,7 +165,19 @@ def init_map_view():
     logger.info("=" * 80)
     logger.info("\nNext steps:")
     logger.info("1. Export as GeoJSON: python scripts/production/export_map_geojson.py")
-    logger.info("2. Refresh after data updates: SELECT refresh_map_current_conditions();")
+    logger.info("2. Refresh after data updates: python scripts/setup/init_map_view.py --refresh")
 
 if __name__ == "__main__":
-    init_map_view()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Create or refresh the map_current_conditions view")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Refresh the existing view instead of recreating it")
+    parser.add_argument("--force", action="store_true",
+                        help="With --refresh, refresh even if no new data was ingested")
+    args = parser.parse_args()
+
+    if args.refresh:
+        refresh_map_view(force=args.force)
+    else:
+        init_map_view()
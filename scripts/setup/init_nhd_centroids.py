@@ -2,17 +2,18 @@
 """
 Initialize NHD Reach Centroids Table
 
-Extracts lat/lon centroids from nhd.flowlines PostGIS geometries
-for use with temperature APIs (Open-Meteo).
+Copies the lat/lon midpoints cached on nhd.flowlines (centroid_lat,
+centroid_lon) into nhd.reach_centroids for use with temperature APIs
+(Open-Meteo).
 
 Usage:
     python scripts/setup/init_nhd_centroids.py
 """
 
-import os
 import sys
 from pathlib import Path
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from _db import get_engine, tune_setup_transaction
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -22,156 +23,158 @@ sys.path.insert(0, str(project_root))
 # Load environment variables
 load_dotenv()
 
+# Swap the freshly built staging table in for nhd.reach_centroids
+CENTROIDS_SWAP_SQL = """
+    -- Make it durable (one sequential WAL write of the whole table)
+    ALTER TABLE nhd.reach_centroids_new SET LOGGED;
+
+    DROP TABLE IF EXISTS nhd.reach_centroids CASCADE;
+    ALTER TABLE nhd.reach_centroids_new RENAME TO reach_centroids;
+
+    ALTER TABLE nhd.reach_centroids
+        ALTER COLUMN permanent_identifier SET NOT NULL,
+        ALTER COLUMN latitude SET NOT NULL,
+        ALTER COLUMN longitude SET NOT NULL,
+        ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP,
+        ADD PRIMARY KEY (nhdplusid),
+        -- Invalid coordinates are rejected on write, so no scan is needed to check
+        ADD CONSTRAINT chk_latlon
+            CHECK (latitude BETWEEN -90 AND 90 AND longitude BETWEEN -180 AND 180),
+        ADD CONSTRAINT fk_nhd_flowlines
+            FOREIGN KEY (nhdplusid)
+            REFERENCES nhd.flowlines(nhdplusid)
+            ON DELETE CASCADE;
+
+    -- Covering index: the temperature fetcher reads (nhdplusid, lat, lon)
+    -- straight from the index (index-only scan, no heap visits)
+    CREATE INDEX idx_nhd_centroids_latlon
+        ON nhd.reach_centroids(latitude, longitude)
+        INCLUDE (nhdplusid, permanent_identifier);
+
+    -- Records the geohash order so a later plain CLUSTER keeps it
+    CREATE INDEX idx_centroids_geohash
+        ON nhd.reach_centroids(ST_GeoHash(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326), 8));
+    ALTER TABLE nhd.reach_centroids CLUSTER ON idx_centroids_geohash;
+"""
+
 def init_centroids():
     """Create and populate nhd_reach_centroids table."""
 
-    # Build database URL
-    db_url = (
-        f"postgresql://{os.getenv('DATABASE_USER')}:{os.getenv('DATABASE_PASSWORD')}"
-        f"@{os.getenv('DATABASE_HOST')}:{os.getenv('DATABASE_PORT')}/{os.getenv('DATABASE_NAME')}"
-    )
+    engine = get_engine()
 
-    engine = create_engine(db_url)
+    if engine is None:
+        print("ERROR: Database connection not configured (DATABASE_URL or DATABASE_* in .env)")
+        return False
 
     print("Initializing NHD reach centroids...")
     print("=" * 60)
 
-    # Read SQL script
-    sql_path = project_root / "scripts" / "setup" / "create_nhd_centroids.sql"
-
-    if not sql_path.exists():
-        print(f"ERROR: SQL script not found at {sql_path}")
-        return False
-
-    with open(sql_path, 'r') as f:
-        sql_script = f.read()
-
     # Execute SQL in steps
     with engine.begin() as conn:
         try:
-            # Step 1: Create table
-            print("\n[1/4] Creating nhd_reach_centroids table...")
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS nhd_reach_centroids (
-                    nhdplusid BIGINT PRIMARY KEY,
-                    permanent_identifier VARCHAR(50) NOT NULL,
-                    latitude DOUBLE PRECISION NOT NULL,
-                    longitude DOUBLE PRECISION NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    CONSTRAINT fk_nhd_flowlines
-                        FOREIGN KEY (nhdplusid)
-                        REFERENCES nhd.flowlines(nhdplusid)
-                        ON DELETE CASCADE
-                )
-            """))
-            print("  Table created successfully")
-
-            # Step 2: Create spatial index
-            print("\n[2/4] Creating spatial index...")
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_nhd_centroids_latlon
-                    ON nhd_reach_centroids(latitude, longitude)
-            """))
-            print("  Index created successfully")
-
-            # Step 3: Populate with centroids
-            print("\n[3/4] Extracting centroids from nhd.flowlines...")
+            tune_setup_transaction(conn, bulk=True)
+
+            # Step 1: Build the new centroids in an unlogged staging table
+            # CTAS into an UNLOGGED table writes no per-row WAL and has no
+            # indexes or conflict checks to maintain while it fills
+            # The line midpoints are already cached on nhd.flowlines
+            # (centroid_lat/centroid_lon generated columns), so no geometry work here
+            # Rows are written in geohash order so neighbouring reaches share
+            # heap pages (same result as CLUSTER, without a second rewrite)
+            print("\n[1/4] Extracting centroids from nhd.flowlines...")
+            conn.execute(text("DROP TABLE IF EXISTS nhd.reach_centroids_new"))
             result = conn.execute(text("""
-                INSERT INTO nhd.reach_centroids (nhdplusid, permanent_identifier, latitude, longitude)
+                CREATE UNLOGGED TABLE nhd.reach_centroids_new AS
                 SELECT
                     nhdplusid,
                     permanent_identifier,
-                    ST_Y(ST_Centroid(geom)) AS latitude,
-                    ST_X(ST_Centroid(geom)) AS longitude
+                    centroid_lat AS latitude,
+                    centroid_lon AS longitude,
+                    CURRENT_TIMESTAMP::timestamp AS created_at
                 FROM nhd.flowlines
-                WHERE geom IS NOT NULL
-                ON CONFLICT (nhdplusid) DO UPDATE
-                    SET permanent_identifier = EXCLUDED.permanent_identifier,
-                        latitude = EXCLUDED.latitude,
-                        longitude = EXCLUDED.longitude
+                WHERE centroid_lat IS NOT NULL
+                ORDER BY ST_GeoHash(ST_SetSRID(ST_MakePoint(centroid_lon, centroid_lat), 4326), 8)
             """))
             rows_inserted = result.rowcount
-            print(f"  Inserted/updated {rows_inserted} centroids")
-
-            # Step 4: Verify results
+            print(f"  Computed {rows_inserted} centroids")
+
+            # temperature_timeseries references this table; remember where so
+            # the foreign key can be re-pointed after the swap (top-level
+            # constraint only; partitions inherit it)
+            temperature_table = conn.execute(text("""
+                SELECT conrelid::regclass::text
+                FROM pg_constraint
+                WHERE conname = 'fk_temperature_reach'
+                  AND conparentid = 0
+            """)).scalar()
+
+            # Steps 2-3: Swap the table in, then build constraints and indexes
+            # once over the full table. Sent as one batch (single round trip).
+            print("\n[2/4] Swapping in the new centroids table...")
+            print("\n[3/4] Creating constraints and spatial indexes...")
+            swap_sql = CENTROIDS_SWAP_SQL
+            if temperature_table:
+                swap_sql += f"""
+                    ALTER TABLE {temperature_table}
+                        ADD CONSTRAINT fk_temperature_reach
+                        FOREIGN KEY (nhdplusid)
+                        REFERENCES nhd.reach_centroids(nhdplusid)
+                        ON DELETE CASCADE;
+                """
+            conn.exec_driver_sql(swap_sql)
+            print("  Table swapped; constraints and indexes created successfully")
+
+            # Step 4: Verify results (one scan for all the stats, plus samples)
+            # Coordinate ranges are enforced by the chk_latlon constraint
             print("\n[4/4] Verifying coordinate ranges...")
-            result = conn.execute(text("""
-                SELECT
-                    COUNT(*) as total_centroids,
-                    ROUND(MIN(latitude)::numeric, 2) as min_lat,
-                    ROUND(MAX(latitude)::numeric, 2) as max_lat,
-                    ROUND(MIN(longitude)::numeric, 2) as min_lon,
-                    ROUND(MAX(longitude)::numeric, 2) as max_lon
+            stats = conn.execute(text("""
+                SELECT jsonb_build_object(
+                    'total', COUNT(*),
+                    'min_lat', ROUND(MIN(latitude)::numeric, 2),
+                    'max_lat', ROUND(MAX(latitude)::numeric, 2),
+                    'min_lon', ROUND(MIN(longitude)::numeric, 2),
+                    'max_lon', ROUND(MAX(longitude)::numeric, 2),
+                    'sample', (
+                        SELECT jsonb_agg(s)
+                        FROM (
+                            SELECT
+                                nhdplusid,
+                                permanent_identifier,
+                                ROUND(latitude::numeric, 4) AS lat,
+                                ROUND(longitude::numeric, 4) AS lon
+                            FROM nhd.reach_centroids
+                            ORDER BY nhdplusid
+                            LIMIT 5
+                        ) s
+                    )
+                )
                 FROM nhd.reach_centroids
-            """))
+            """)).scalar()
 
-            stats = result.fetchone()
-            print(f"\n  Total centroids: {stats.total_centroids}")
-            print(f"  Latitude range: {stats.min_lat} to {stats.max_lat}")
-            print(f"  Longitude range: {stats.min_lon} to {stats.max_lon}")
+            print(f"\n  Total centroids: {stats['total']}")
+            print(f"  Latitude range: {stats['min_lat']} to {stats['max_lat']}")
+            print(f"  Longitude range: {stats['min_lon']} to {stats['max_lon']}")
 
-            print("\n" + "=" * 60)
-            print("SUCCESS: NHD centroids table initialized")
-            print("=" * 60)
-
-            return True
+            print("\n  Sample centroids:")
+            for row in stats['sample'] or []:
+                print(f"    {row['nhdplusid']} ({row['permanent_identifier']}): ({row['lat']}, {row['lon']})")
 
         except Exception as e:
             print(f"\nERROR: Failed to initialize centroids table")
             print(f"  {type(e).__name__}: {e}")
             return False
 
-def verify_centroids():
-    """Verify centroid data quality."""
-
-    db_url = (
-        f"postgresql://{os.getenv('DATABASE_USER')}:{os.getenv('DATABASE_PASSWORD')}"
-        f"@{os.getenv('DATABASE_HOST')}:{os.getenv('DATABASE_PORT')}/{os.getenv('DATABASE_NAME')}"
-    )
-
-    engine = create_engine(db_url)
+    # VACUUM can't run inside a transaction. Setting the visibility map
+    # lets index-only scans on the covering index skip the heap entirely.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM (ANALYZE) nhd.reach_centroids")
 
-    print("\nVerifying centroid data...")
-    print("-" * 60)
+    print("\n" + "=" * 60)
+    print("SUCCESS: NHD centroids table initialized")
+    print("=" * 60)
 
-    with engine.begin() as conn:
-        # Get sample centroids
-        result = conn.execute(text("""
-            SELECT
-                nhdplusid,
-                permanent_identifier,
-                ROUND(latitude::numeric, 4) as lat,
-                ROUND(longitude::numeric, 4) as lon
-            FROM nhd.reach_centroids
-            ORDER BY nhdplusid
-            LIMIT 5
-        """))
-
-        print("\nSample centroids:")
-        for row in result:
-            print(f"  {row.nhdplusid} ({row.permanent_identifier}): ({row.lat}, {row.lon})")
-
-        # Check for invalid coordinates
-        result = conn.execute(text("""
-            SELECT COUNT(*) as invalid_count
-            FROM nhd.reach_centroids
-            WHERE latitude < -90 OR latitude > 90
-               OR longitude < -180 OR longitude > 180
-        """))
-
-        invalid_count = result.scalar()
-        if invalid_count > 0:
-            print(f"\nWARNING: Found {invalid_count} invalid coordinates")
-        else:
-            print("\nAll coordinates are valid")
-
-    print("-" * 60)
+    return True
 
 if __name__ == "__main__":
     success = init_centroids()
-
-    if success:
-        verify_centroids()
-        sys.exit(0)
-    else:
-        sys.exit(1)
+    sys.exit(0 if success else 1)
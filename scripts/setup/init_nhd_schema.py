@@ -22,27 +22,317 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+
+from _db import get_engine, tune_setup_transaction
+
+# Full NHD DDL, sent as one simple-query batch (exec_driver_sql) so the
+# server parses and runs it in a single round trip
+NHD_SCHEMA_SQL = """-- 1. Core spatial and attribute data
+CREATE TABLE IF NOT EXISTS nhd_flowlines (
+    nhdplusid BIGINT PRIMARY KEY,
+    permanent_identifier VARCHAR(50) NOT NULL,
+
+    gnis_id VARCHAR(20),
+    gnis_name VARCHAR(255),
+    reachcode VARCHAR(14) NOT NULL,
+
+    lengthkm DOUBLE PRECISION NOT NULL,
+    areasqkm DOUBLE PRECISION,
+    totdasqkm DOUBLE PRECISION NOT NULL,
+    divdasqkm DOUBLE PRECISION,
+
+    streamorde SMALLINT,
+    streamleve SMALLINT,
+    streamcalc SMALLINT,
+    ftype SMALLINT,
+    fcode SMALLINT,
+
+    slope DOUBLE PRECISION,
+    slopelenkm DOUBLE PRECISION,
+    maxelevraw INTEGER,
+    minelevraw INTEGER,
+    maxelevsmo INTEGER,
+    minelevsmo INTEGER,
+
+    -- Derived metrics: generated columns, computed inline as each row is
+    -- written (no per-row PL/pgSQL trigger call during bulk loads)
+    gradient_class VARCHAR(20) GENERATED ALWAYS AS (
+        CASE
+            WHEN slope IS NULL THEN NULL
+            WHEN slope < 0.001 THEN 'pool'
+            WHEN slope < 0.01 THEN 'run'
+            WHEN slope < 0.05 THEN 'riffle'
+            ELSE 'cascade'
+        END
+    ) STORED,
+    size_class VARCHAR(20) GENERATED ALWAYS AS (
+        CASE
+            WHEN totdasqkm IS NULL THEN NULL
+            WHEN totdasqkm < 10 THEN 'headwater'
+            WHEN totdasqkm < 100 THEN 'creek'
+            WHEN totdasqkm < 1000 THEN 'small_river'
+            WHEN totdasqkm < 10000 THEN 'river'
+            ELSE 'large_river'
+        END
+    ) STORED,
+    elev_drop_m_per_km DOUBLE PRECISION GENERATED ALWAYS AS (
+        CASE
+            WHEN maxelevraw IS NOT NULL AND minelevraw IS NOT NULL AND lengthkm > 0
+            THEN ((maxelevraw - minelevraw) / 100.0) / lengthkm
+        END
+    ) STORED,
+
+    vpuid VARCHAR(4),
+    statusflag CHAR(1),
+    fdate BIGINT,
+    resolution SMALLINT,
+
+    geom GEOMETRY(LINESTRING, 4326) NOT NULL,
+
+    -- Midpoint along the line, cached for centroid consumers. Computed once
+    -- per row on write (generated columns cannot share a subexpression);
+    -- readers copy the columns and never touch the geometry.
+    centroid_lat DOUBLE PRECISION GENERATED ALWAYS AS (ST_Y(ST_LineInterpolatePoint(geom, 0.5))) STORED,
+    centroid_lon DOUBLE PRECISION GENERATED ALWAYS AS (ST_X(ST_LineInterpolatePoint(geom, 0.5))) STORED,
+
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Tables created before the centroid columns existed (computed for the
+-- existing rows as they are added)
+ALTER TABLE nhd_flowlines
+    ADD COLUMN IF NOT EXISTS centroid_lat DOUBLE PRECISION
+        GENERATED ALWAYS AS (ST_Y(ST_LineInterpolatePoint(geom, 0.5))) STORED,
+    ADD COLUMN IF NOT EXISTS centroid_lon DOUBLE PRECISION
+        GENERATED ALWAYS AS (ST_X(ST_LineInterpolatePoint(geom, 0.5))) STORED;
+
+-- 2. Stream network connections
+CREATE TABLE IF NOT EXISTS nhd_network_topology (
+    nhdplusid BIGINT PRIMARY KEY REFERENCES nhd.flowlines(nhdplusid) ON DELETE CASCADE,
+
+    fromnode BIGINT,
+    tonode BIGINT,
+
+    hydroseq BIGINT NOT NULL,
+    levelpathi BIGINT NOT NULL,
+    terminalpa BIGINT NOT NULL,
+
+    uphydroseq BIGINT,
+    uplevelpat BIGINT,
+
+    dnhydroseq BIGINT,
+    dnlevelpat BIGINT,
+    dnminorhyd BIGINT,
+    dndraincou SMALLINT,
+
+    pathlength DOUBLE PRECISION,
+    arbolatesu DOUBLE PRECISION,
+
+    startflag SMALLINT,
+    terminalfl SMALLINT,
+    divergence SMALLINT,
+    mainpath SMALLINT,
+    innetwork SMALLINT,
+
+    frommeas DOUBLE PRECISION,
+    tomeas DOUBLE PRECISION
+);
+
+-- 3. Mean annual flow estimates
+CREATE TABLE IF NOT EXISTS nhd_flow_statistics (
+    nhdplusid BIGINT PRIMARY KEY REFERENCES nhd.flowlines(nhdplusid) ON DELETE CASCADE,
+
+    qama DOUBLE PRECISION,
+    qbma DOUBLE PRECISION,
+    qcma DOUBLE PRECISION,
+    qdma DOUBLE PRECISION,
+    qema DOUBLE PRECISION,
+    qfma DOUBLE PRECISION,
+
+    qincrama DOUBLE PRECISION,
+    qincrbma DOUBLE PRECISION,
+    qincrcma DOUBLE PRECISION,
+    qincrdma DOUBLE PRECISION,
+    qincrema DOUBLE PRECISION,
+    qincrfma DOUBLE PRECISION,
+
+    vama DOUBLE PRECISION,
+    vbma DOUBLE PRECISION,
+    vcma DOUBLE PRECISION,
+    vdma DOUBLE PRECISION,
+    vema DOUBLE PRECISION,
+
+    gageidma VARCHAR(20),
+    gageqma DOUBLE PRECISION,
+    gageadjma SMALLINT
+);
+
+-- 4. Triggers
+-- updated_at on UPDATE only; inserts take the column default
+CREATE OR REPLACE FUNCTION set_nhd_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at := NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Legacy derived-metrics trigger, only for tables created before the
+-- metrics became generated columns
+CREATE OR REPLACE FUNCTION compute_nhd_derived_metrics()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.gradient_class := CASE
+        WHEN NEW.slope IS NULL THEN NULL
+        WHEN NEW.slope < 0.001 THEN 'pool'
+        WHEN NEW.slope < 0.01 THEN 'run'
+        WHEN NEW.slope < 0.05 THEN 'riffle'
+        ELSE 'cascade'
+    END;
+
+    NEW.size_class := CASE
+        WHEN NEW.totdasqkm IS NULL THEN NULL
+        WHEN NEW.totdasqkm < 10 THEN 'headwater'
+        WHEN NEW.totdasqkm < 100 THEN 'creek'
+        WHEN NEW.totdasqkm < 1000 THEN 'small_river'
+        WHEN NEW.totdasqkm < 10000 THEN 'river'
+        ELSE 'large_river'
+    END;
+
+    IF NEW.maxelevraw IS NOT NULL AND NEW.minelevraw IS NOT NULL
+       AND NEW.lengthkm IS NOT NULL AND NEW.lengthkm > 0 THEN
+        NEW.elev_drop_m_per_km := ((NEW.maxelevraw - NEW.minelevraw) / 100.0) / NEW.lengthkm;
+    END IF;
+
+    NEW.updated_at := NOW();
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_compute_nhd_metrics ON nhd_flowlines;
+DROP TRIGGER IF EXISTS trigger_nhd_updated_at ON nhd_flowlines;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'nhd_flowlines'
+          AND column_name = 'gradient_class'
+          AND is_generated = 'NEVER'
+    ) THEN
+        CREATE TRIGGER trigger_compute_nhd_metrics
+        BEFORE INSERT OR UPDATE ON nhd_flowlines
+        FOR EACH ROW
+        EXECUTE FUNCTION compute_nhd_derived_metrics();
+    ELSE
+        CREATE TRIGGER trigger_nhd_updated_at
+        BEFORE UPDATE ON nhd_flowlines
+        FOR EACH ROW
+        EXECUTE FUNCTION set_nhd_updated_at();
+    END IF;
+END $$;
+"""
+
+# Secondary indexes on the NHD tables. They are built after the bulk load
+# (finalize_nhd_indexes) so inserts don't pay per-row index maintenance.
+# The geometry index is added separately since its method depends on PostGIS.
+NHD_INDEX_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_nhd_gnis_name ON nhd_flowlines (gnis_name) WHERE gnis_name IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_nhd_streamorde ON nhd_flowlines (streamorde)",
+    "CREATE INDEX IF NOT EXISTS idx_nhd_totdasqkm ON nhd_flowlines (totdasqkm)",
+    "CREATE INDEX IF NOT EXISTS idx_nhd_reachcode ON nhd_flowlines (reachcode)",
+    "CREATE INDEX IF NOT EXISTS idx_nhd_centroid_ll ON nhd_flowlines (centroid_lat, centroid_lon)",
+    "CREATE INDEX IF NOT EXISTS idx_topo_hydroseq ON nhd_network_topology (hydroseq)",
+    "CREATE INDEX IF NOT EXISTS idx_topo_levelpathi ON nhd_network_topology (levelpathi)",
+    "CREATE INDEX IF NOT EXISTS idx_topo_dnhydroseq ON nhd_network_topology (dnhydroseq) WHERE dnhydroseq IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_topo_uphydroseq ON nhd_network_topology (uphydroseq) WHERE uphydroseq IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_flow_stats_qama ON nhd_flow_statistics (qama) WHERE qama > 0",
+    "CREATE INDEX IF NOT EXISTS idx_flow_stats_qema ON nhd_flow_statistics (qema) WHERE qema > 0",
+]
+
+# Sort memory for the index builds (session-local, reset at commit)
+INDEX_MAINTENANCE_WORK_MEM = '1GB'
+
+
+def create_nhd_indexes(conn):
+    """
+    Create the NHD indexes and refresh planner statistics.
+
+    Args:
+        conn: Open SQLAlchemy connection (inside a transaction)
+
+    Returns:
+        str: Index method used for the geometry index
+    """
+    conn.execute(text(f"SET LOCAL maintenance_work_mem = '{INDEX_MAINTENANCE_WORK_MEM}';"))
+
+    # SP-GiST handles the heavily overlapping bboxes of a stream network
+    # better than GiST (smaller, faster && lookups); GiST on PostGIS < 3
+    print("   Creating indexes...")
+    postgis_lib_version = conn.execute(text("SELECT postgis_lib_version();")).scalar()
+    geom_index_method = 'SPGIST' if int(postgis_lib_version.split('.')[0]) >= 3 else 'GIST'
+    conn.execute(text(f"""
+        CREATE INDEX IF NOT EXISTS idx_nhd_geom
+        ON nhd_flowlines USING {geom_index_method} (geom);
+    """))
+
+    conn.exec_driver_sql(";\n".join(NHD_INDEX_STATEMENTS + [
+        "ANALYZE nhd_flowlines",
+        "ANALYZE nhd_network_topology",
+        "ANALYZE nhd_flow_statistics",
+    ]))
+    print(f"   ✅ Indexes created (geometry: {geom_index_method})")
+
+    return geom_index_method
+
+
+def finalize_nhd_indexes():
+    """Build the NHD indexes once the tables have been bulk loaded"""
+
+    load_dotenv()
+
+    engine = get_engine()
+
+    if engine is None:
+        print("❌ ERROR: DATABASE_URL (or DATABASE_HOST etc.) not found in .env file")
+        return False
+
+    print("Building NHD indexes...")
+
+    try:
+        with engine.begin() as conn:
+            tune_setup_transaction(conn)
+            create_nhd_indexes(conn)
+
+        return True
+
+    except Exception as e:
+        print(f"❌ NHD index creation failed!")
+        print(f"Error: {e}")
+        return False
 
-# Configure stdout for UTF-8 on Windows
-if sys.platform == 'win32':
-    import codecs
-    if sys.stdout.encoding != 'utf-8':
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    if sys.stderr.encoding != 'utf-8':
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
+def init_nhd_schema(create_indexes=False):
+    """
+    Initialize NHD database schema
 
-def init_nhd_schema():
-    """Initialize NHD database schema"""
+    Args:
+        create_indexes: Also build the secondary indexes now. Leave False
+            when the tables are about to be bulk loaded; load_nhd_data.py
+            calls finalize_nhd_indexes() afterwards.
+    """
 
     # Load environment variables
     load_dotenv()
 
-    database_url = os.getenv('DATABASE_URL')
+    engine = get_engine()
 
-    if not database_url:
-        print("❌ ERROR: DATABASE_URL not found in .env file")
+    if engine is None:
+        print("❌ ERROR: DATABASE_URL (or DATABASE_HOST etc.) not found in .env file")
         return False
 
     print("=" * 60)
@@ -54,10 +344,8 @@ def init_nhd_schema():
     print()
 
     try:
-        # Create engine
-        engine = create_engine(database_url)
-
         with engine.begin() as conn:
+            tune_setup_transaction(conn)
             print("✅ Connected to database")
             print()
 
@@ -96,227 +384,17 @@ def init_nhd_schema():
             print("Creating NHD database schema...")
             print("-" * 60)
 
-            # 1. Create nhd_flowlines table
-            print("Creating table: nhd_flowlines...")
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS nhd_flowlines (
-                    nhdplusid BIGINT PRIMARY KEY,
-                    permanent_identifier VARCHAR(50) NOT NULL,
-
-                    gnis_id VARCHAR(20),
-                    gnis_name VARCHAR(255),
-                    reachcode VARCHAR(14) NOT NULL,
-
-                    lengthkm DOUBLE PRECISION NOT NULL,
-                    areasqkm DOUBLE PRECISION,
-                    totdasqkm DOUBLE PRECISION NOT NULL,
-                    divdasqkm DOUBLE PRECISION,
-
-                    streamorde SMALLINT,
-                    streamleve SMALLINT,
-                    streamcalc SMALLINT,
-                    ftype SMALLINT,
-                    fcode SMALLINT,
-
-                    slope DOUBLE PRECISION,
-                    slopelenkm DOUBLE PRECISION,
-                    maxelevraw INTEGER,
-                    minelevraw INTEGER,
-                    maxelevsmo INTEGER,
-                    minelevsmo INTEGER,
-
-                    gradient_class VARCHAR(20),
-                    size_class VARCHAR(20),
-                    elev_drop_m_per_km DOUBLE PRECISION,
-
-                    vpuid VARCHAR(4),
-                    statusflag CHAR(1),
-                    fdate BIGINT,
-                    resolution SMALLINT,
-
-                    geom GEOMETRY(LINESTRING, 4326) NOT NULL,
-
-                    created_at TIMESTAMPTZ DEFAULT NOW(),
-                    updated_at TIMESTAMPTZ DEFAULT NOW()
-                );
-            """))
-            print("   ✅ nhd_flowlines created")
-
-            # Create indexes for nhd_flowlines
-            print("   Creating indexes...")
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_nhd_geom
-                ON nhd_flowlines USING GIST (geom);
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_nhd_gnis_name
-                ON nhd_flowlines (gnis_name) WHERE gnis_name IS NOT NULL;
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_nhd_streamorde
-                ON nhd_flowlines (streamorde);
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_nhd_totdasqkm
-                ON nhd_flowlines (totdasqkm);
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_nhd_reachcode
-                ON nhd_flowlines (reachcode);
-            """))
-            print("   ✅ Indexes created")
+            # 1-4. Tables and triggers in one batch
+            print("Creating tables: nhd_flowlines, nhd_network_topology, nhd_flow_statistics...")
+            print("Creating updated_at trigger...")
+            conn.exec_driver_sql(NHD_SCHEMA_SQL)
+            print("   ✅ Tables and trigger created")
             print()
 
-            # 2. Create nhd_network_topology table
-            print("Creating table: nhd_network_topology...")
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS nhd_network_topology (
-                    nhdplusid BIGINT PRIMARY KEY REFERENCES nhd.flowlines(nhdplusid) ON DELETE CASCADE,
-
-                    fromnode BIGINT,
-                    tonode BIGINT,
-
-                    hydroseq BIGINT NOT NULL,
-                    levelpathi BIGINT NOT NULL,
-                    terminalpa BIGINT NOT NULL,
-
-                    uphydroseq BIGINT,
-                    uplevelpat BIGINT,
-
-                    dnhydroseq BIGINT,
-                    dnlevelpat BIGINT,
-                    dnminorhyd BIGINT,
-                    dndraincou SMALLINT,
-
-                    pathlength DOUBLE PRECISION,
-                    arbolatesu DOUBLE PRECISION,
-
-                    startflag SMALLINT,
-                    terminalfl SMALLINT,
-                    divergence SMALLINT,
-                    mainpath SMALLINT,
-                    innetwork SMALLINT,
-
-                    frommeas DOUBLE PRECISION,
-                    tomeas DOUBLE PRECISION
-                );
-            """))
-            print("   ✅ nhd_network_topology created")
-
-            # Create indexes
-            print("   Creating indexes...")
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_topo_hydroseq
-                ON nhd_network_topology (hydroseq);
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_topo_levelpathi
-                ON nhd_network_topology (levelpathi);
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_topo_dnhydroseq
-                ON nhd_network_topology (dnhydroseq) WHERE dnhydroseq IS NOT NULL;
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_topo_uphydroseq
-                ON nhd_network_topology (uphydroseq) WHERE uphydroseq IS NOT NULL;
-            """))
-            print("   ✅ Indexes created")
-            print()
-
-            # 3. Create nhd_flow_statistics table
-            print("Creating table: nhd_flow_statistics...")
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS nhd_flow_statistics (
-                    nhdplusid BIGINT PRIMARY KEY REFERENCES nhd.flowlines(nhdplusid) ON DELETE CASCADE,
-
-                    qama DOUBLE PRECISION,
-                    qbma DOUBLE PRECISION,
-                    qcma DOUBLE PRECISION,
-                    qdma DOUBLE PRECISION,
-                    qema DOUBLE PRECISION,
-                    qfma DOUBLE PRECISION,
-
-                    qincrama DOUBLE PRECISION,
-                    qincrbma DOUBLE PRECISION,
-                    qincrcma DOUBLE PRECISION,
-                    qincrdma DOUBLE PRECISION,
-                    qincrema DOUBLE PRECISION,
-                    qincrfma DOUBLE PRECISION,
-
-                    vama DOUBLE PRECISION,
-                    vbma DOUBLE PRECISION,
-                    vcma DOUBLE PRECISION,
-                    vdma DOUBLE PRECISION,
-                    vema DOUBLE PRECISION,
-
-                    gageidma VARCHAR(20),
-                    gageqma DOUBLE PRECISION,
-                    gageadjma SMALLINT
-                );
-            """))
-            print("   ✅ nhd_flow_statistics created")
-
-            # Create indexes
-            print("   Creating indexes...")
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_flow_stats_qama
-                ON nhd_flow_statistics (qama) WHERE qama > 0;
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_flow_stats_qema
-                ON nhd_flow_statistics (qema) WHERE qema > 0;
-            """))
-            print("   ✅ Indexes created")
-            print()
-
-            # 4. Create trigger function for derived metrics
-            print("Creating trigger for derived metrics...")
-            conn.execute(text("""
-                CREATE OR REPLACE FUNCTION compute_nhd_derived_metrics()
-                RETURNS TRIGGER AS $$
-                BEGIN
-                    NEW.gradient_class := CASE
-                        WHEN NEW.slope IS NULL THEN NULL
-                        WHEN NEW.slope < 0.001 THEN 'pool'
-                        WHEN NEW.slope < 0.01 THEN 'run'
-                        WHEN NEW.slope < 0.05 THEN 'riffle'
-                        ELSE 'cascade'
-                    END;
-
-                    NEW.size_class := CASE
-                        WHEN NEW.totdasqkm IS NULL THEN NULL
-                        WHEN NEW.totdasqkm < 10 THEN 'headwater'
-                        WHEN NEW.totdasqkm < 100 THEN 'creek'
-                        WHEN NEW.totdasqkm < 1000 THEN 'small_river'
-                        WHEN NEW.totdasqkm < 10000 THEN 'river'
-                        ELSE 'large_river'
-                    END;
-
-                    IF NEW.maxelevraw IS NOT NULL AND NEW.minelevraw IS NOT NULL
-                       AND NEW.lengthkm IS NOT NULL AND NEW.lengthkm > 0 THEN
-                        NEW.elev_drop_m_per_km := ((NEW.maxelevraw - NEW.minelevraw) / 100.0) / NEW.lengthkm;
-                    END IF;
-
-                    NEW.updated_at := NOW();
-
-                    RETURN NEW;
-                END;
-                $$ LANGUAGE plpgsql;
-            """))
-
-            conn.execute(text("""
-                DROP TRIGGER IF EXISTS trigger_compute_nhd_metrics ON nhd_flowlines;
-            """))
-
-            conn.execute(text("""
-                CREATE TRIGGER trigger_compute_nhd_metrics
-                BEFORE INSERT OR UPDATE ON nhd_flowlines
-                FOR EACH ROW
-                EXECUTE FUNCTION compute_nhd_derived_metrics();
-            """))
-            print("   ✅ Trigger created")
-            print()
+            # 5. Secondary indexes (normally deferred until after the bulk load)
+            if create_indexes:
+                create_nhd_indexes(conn)
+                print()
 
             # Summary
             print("-" * 60)
@@ -345,7 +423,7 @@ def init_nhd_schema():
             print("=" * 60)
             print("Next Steps:")
             print("=" * 60)
-            print("1. Load NHD data:")
+            print("1. Load NHD data (also builds the indexes):")
             print("   python scripts/production/load_nhd_data.py \"D:\\Path\\To\\nhdHydrologyExample.geojson\"")
             print()
             print("2. Verify data loaded:")
@@ -368,5 +446,24 @@ def init_nhd_schema():
 
 
 if __name__ == "__main__":
-    success = init_nhd_schema()
+    import argparse
+
+    # Configure stdout for UTF-8 on Windows (only when run as a script, since
+    # load_nhd_data.py imports this module and wraps stdout itself)
+    if sys.platform == 'win32':
+        import codecs
+        if sys.stdout.encoding != 'utf-8':
+            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+        if sys.stderr.encoding != 'utf-8':
+            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+
+    parser = argparse.ArgumentParser(description="Initialize the NHD database schema")
+    parser.add_argument(
+        "--create-indexes",
+        action="store_true",
+        help="Build the secondary indexes now instead of after the NHD load"
+    )
+    args = parser.parse_args()
+
+    success = init_nhd_schema(create_indexes=args.create_indexes)
     sys.exit(0 if success else 1)
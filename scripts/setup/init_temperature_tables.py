@@ -4,14 +4,19 @@ Initialize Temperature Tables
 
 Creates the temperature_timeseries table in the database.
 
+The table is range-partitioned by month on valid_time so queries over a time
+window only scan the matching partitions. Monthly partitions are created for
+a rolling window around the current month by create_temperature_partitions(),
+which is scheduled monthly with pg_cron when that extension is installed.
+
 Usage:
     python scripts/setup/init_temperature_tables.py
 """
 
-import os
 import sys
 from pathlib import Path
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from _db import get_engine, tune_setup_transaction
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -21,57 +26,186 @@ sys.path.insert(0, str(project_root))
 # Load environment variables
 load_dotenv()
 
+# Rolling partition window: PARTITION_MONTHS_BACK + current + PARTITION_MONTHS_AHEAD
+PARTITION_MONTHS_BACK = 22
+PARTITION_MONTHS_AHEAD = 1
 
-def init_temperature_tables():
-    """Create temperature tables in database."""
-
-    # Build database URL
-    db_url = (
-        f"postgresql://{os.getenv('DATABASE_USER')}:{os.getenv('DATABASE_PASSWORD')}"
-        f"@{os.getenv('DATABASE_HOST')}:{os.getenv('DATABASE_PORT')}"
-        f"/{os.getenv('DATABASE_NAME')}"
+# Creates any missing monthly (UTC) partitions in the window. Looks the parent
+# up by name so it works whichever schema the table lives in.
+CREATE_PARTITIONS_FUNCTION_SQL = f"""
+    CREATE OR REPLACE FUNCTION create_temperature_partitions(
+        months_back INTEGER DEFAULT {PARTITION_MONTHS_BACK},
+        months_ahead INTEGER DEFAULT {PARTITION_MONTHS_AHEAD}
     )
+    RETURNS INTEGER AS $$
+    DECLARE
+        parent_schema TEXT;
+        partition_name TEXT;
+        month_start DATE;
+        created INTEGER := 0;
+    BEGIN
+        SELECT n.nspname INTO parent_schema
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relname = 'temperature_timeseries' AND c.relkind = 'p';
 
-    engine = create_engine(db_url)
+        IF parent_schema IS NULL THEN
+            RAISE NOTICE 'temperature_timeseries is not partitioned; nothing to do';
+            RETURN 0;
+        END IF;
 
-    print("Initializing temperature tables...")
-    print("=" * 60)
+        FOR i IN -months_back..months_ahead LOOP
+            month_start := (date_trunc('month', NOW() AT TIME ZONE 'UTC') + make_interval(months => i))::date;
+            partition_name := 'temperature_timeseries_' || to_char(month_start, 'YYYY_MM');
+
+            IF to_regclass(quote_ident(parent_schema) || '.' || quote_ident(partition_name)) IS NULL THEN
+                EXECUTE 'CREATE TABLE ' || quote_ident(parent_schema) || '.' || quote_ident(partition_name)
+                    || ' PARTITION OF ' || quote_ident(parent_schema) || '.temperature_timeseries'
+                    || ' FOR VALUES FROM (' || quote_literal(month_start::timestamp AT TIME ZONE 'UTC')
+                    || ') TO (' || quote_literal((month_start + INTERVAL '1 month') AT TIME ZONE 'UTC') || ')';
+                created := created + 1;
+            END IF;
+        END LOOP;
+
+        RETURN created;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+# Latest reading per reach, kept current by a trigger on temperature_timeseries
+# so the map view joins one row per reach instead of searching the time series
+TEMPERATURE_LATEST_SQL = """
+    CREATE TABLE IF NOT EXISTS temperature_latest (
+        nhdplusid BIGINT PRIMARY KEY,
+        valid_time TIMESTAMPTZ NOT NULL,
+        ingested_at TIMESTAMPTZ,
+        temperature_2m DOUBLE PRECISION,
+        apparent_temperature DOUBLE PRECISION,
+        precipitation DOUBLE PRECISION,
+        cloud_cover SMALLINT
+    );
 
-    # Read SQL script
-    sql_path = project_root / "scripts" / "setup" / "create_temperature_tables.sql"
+    CREATE OR REPLACE FUNCTION update_temperature_latest()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO temperature_latest (
+            nhdplusid, valid_time, temperature_2m, apparent_temperature,
+            precipitation, cloud_cover, ingested_at
+        ) VALUES (
+            NEW.nhdplusid, NEW.valid_time, NEW.temperature_2m, NEW.apparent_temperature,
+            NEW.precipitation, NEW.cloud_cover, NEW.ingested_at
+        )
+        ON CONFLICT (nhdplusid) DO UPDATE
+            SET valid_time = EXCLUDED.valid_time,
+                temperature_2m = EXCLUDED.temperature_2m,
+                apparent_temperature = EXCLUDED.apparent_temperature,
+                precipitation = EXCLUDED.precipitation,
+                cloud_cover = EXCLUDED.cloud_cover,
+                ingested_at = EXCLUDED.ingested_at
+            WHERE EXCLUDED.valid_time >= temperature_latest.valid_time;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
 
-    if not sql_path.exists():
-        print(f"ERROR: SQL script not found at {sql_path}")
+    -- INSERT ... ON CONFLICT DO UPDATE in the ingester fires the UPDATE trigger
+    DROP TRIGGER IF EXISTS trigger_temperature_latest ON temperature_timeseries;
+    CREATE TRIGGER trigger_temperature_latest
+        AFTER INSERT OR UPDATE ON temperature_timeseries
+        FOR EACH ROW
+        EXECUTE FUNCTION update_temperature_latest();
+
+    -- Rows ingested before the trigger existed
+    INSERT INTO temperature_latest (
+        nhdplusid, valid_time, temperature_2m, apparent_temperature,
+        precipitation, cloud_cover, ingested_at
+    )
+    SELECT DISTINCT ON (nhdplusid)
+        nhdplusid, valid_time, temperature_2m, apparent_temperature,
+        precipitation, cloud_cover, ingested_at
+    FROM temperature_timeseries
+    ORDER BY nhdplusid, valid_time DESC
+    ON CONFLICT (nhdplusid) DO NOTHING;
+"""
+
+def init_temperature_tables():
+    """Create temperature tables in database."""
+
+    engine = get_engine()
+
+    if engine is None:
+        print("ERROR: Database connection not configured (DATABASE_URL or DATABASE_* in .env)")
         return False
 
-    with open(sql_path, 'r') as f:
-        sql_script = f.read()
+    print("Initializing temperature tables...")
+    print("=" * 60)
 
     # Execute SQL
     with engine.begin() as conn:
         try:
+            tune_setup_transaction(conn, bulk=True)
+
             # Execute table creation
+            # Columns are ordered by descending alignment (8-byte, then 2-byte,
+            # then varlena) so rows carry no padding; loaders should COPY /
+            # INSERT with the column list in this order.
             print("\n[1/3] Creating temperature_timeseries table...")
             conn.execute(text("""
                 CREATE TABLE IF NOT EXISTS temperature_timeseries (
                     nhdplusid BIGINT NOT NULL,
-                    valid_time TIMESTAMP NOT NULL,
+                    valid_time TIMESTAMPTZ NOT NULL,
+                    ingested_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
                     temperature_2m DOUBLE PRECISION,
                     apparent_temperature DOUBLE PRECISION,
                     precipitation DOUBLE PRECISION,
+                    forecast_hour SMALLINT,
                     cloud_cover SMALLINT,
                     source VARCHAR(50) NOT NULL DEFAULT 'open-meteo',
-                    forecast_hour SMALLINT,
-                    ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     CONSTRAINT fk_temperature_reach
                         FOREIGN KEY (nhdplusid)
                         REFERENCES nhd.reach_centroids(nhdplusid)
                         ON DELETE CASCADE,
                     CONSTRAINT unique_temperature_reading
                         UNIQUE (nhdplusid, valid_time, source, forecast_hour)
-                )
+                ) PARTITION BY RANGE (valid_time)
             """))
-            print("  Table created successfully")
+
+            relkind = conn.execute(text("""
+                SELECT relkind FROM pg_class
+                WHERE relname = 'temperature_timeseries'
+            """)).scalar()
+            if relkind == 'p':
+                print("  Table created successfully (partitioned by month)")
+            else:
+                print("  WARNING: existing temperature_timeseries is not partitioned;")
+                print("  recreate it to enable monthly partitions")
+
+            # Monthly partitions for the rolling window, plus a default
+            # partition for readings outside it
+            conn.execute(text(CREATE_PARTITIONS_FUNCTION_SQL))
+            if relkind == 'p':
+                created = conn.execute(text("SELECT create_temperature_partitions()")).scalar()
+                conn.execute(text("""
+                    CREATE TABLE IF NOT EXISTS temperature_timeseries_default
+                        PARTITION OF temperature_timeseries DEFAULT
+                """))
+                print(f"  Created {created} monthly partitions")
+
+                # Keep creating next month's partition ahead of time
+                has_pg_cron = conn.execute(text(
+                    "SELECT 1 FROM pg_extension WHERE extname = 'pg_cron'"
+                )).scalar()
+                if has_pg_cron:
+                    conn.execute(text("""
+                        SELECT cron.schedule(
+                            'create-temperature-partitions',
+                            '0 0 1 * *',
+                            'SELECT create_temperature_partitions()'
+                        )
+                    """))
+                    print("  Scheduled monthly partition creation (pg_cron)")
+                else:
+                    print("  pg_cron not installed: run SELECT create_temperature_partitions(); monthly")
 
             # Create indexes
             print("\n[2/3] Creating indexes...")
@@ -79,34 +213,40 @@ def init_temperature_tables():
                 CREATE INDEX IF NOT EXISTS idx_temp_reach_time
                     ON temperature_timeseries(nhdplusid, valid_time)
             """))
-            conn.execute(text("""
+            # valid_time is append-ordered, so a BRIN index (one summary per
+            # 32 heap pages) serves time-range scans at a fraction of a
+            # btree's size and per-insert cost. Replace an older btree.
+            existing = conn.execute(text("""
+                SELECT indexdef FROM pg_indexes
+                WHERE indexname = 'idx_temp_valid_time'
+            """)).scalar()
+            if existing and 'USING brin' not in existing:
+                conn.execute(text("DROP INDEX idx_temp_valid_time"))
+            # source is always 'open-meteo' today; an index on it never filters
+            conn.exec_driver_sql("""
                 CREATE INDEX IF NOT EXISTS idx_temp_valid_time
-                    ON temperature_timeseries(valid_time)
-            """))
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_temp_source
-                    ON temperature_timeseries(source)
-            """))
+                    ON temperature_timeseries USING BRIN (valid_time)
+                    WITH (pages_per_range = 32);
+                DROP INDEX IF EXISTS idx_temp_source;
+            """)
             print("  Indexes created successfully")
 
+            print("\n  Creating temperature_latest (latest reading per reach)...")
+            conn.exec_driver_sql(TEMPERATURE_LATEST_SQL)
+            print("  temperature_latest created successfully")
+
             # Add comments
             print("\n[3/3] Adding table comments...")
-            conn.execute(text("""
+            conn.exec_driver_sql("""
                 COMMENT ON TABLE temperature_timeseries IS
-                'Air temperature time series from Open-Meteo API for stream reach centroids'
-            """))
-            conn.execute(text("""
+                'Air temperature time series from Open-Meteo API for stream reach centroids';
                 COMMENT ON COLUMN temperature_timeseries.temperature_2m IS
-                'Air temperature at 2 meters above ground (°C)'
-            """))
-            conn.execute(text("""
+                'Air temperature at 2 meters above ground (°C)';
                 COMMENT ON COLUMN temperature_timeseries.apparent_temperature IS
-                'Apparent/"feels like" temperature (°C)'
-            """))
-            conn.execute(text("""
+                'Apparent/"feels like" temperature (°C)';
                 COMMENT ON COLUMN temperature_timeseries.forecast_hour IS
-                'Hours ahead of reference time (0 or NULL = current conditions)'
-            """))
+                'Hours ahead of reference time (0 or NULL = current conditions)';
+            """)
             print("  Comments added successfully")
 
             # Verify
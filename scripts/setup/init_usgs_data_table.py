@@ -1,8 +1,8 @@
 """
 USGS Data Table Initialization Script
 
-Creates the usgs_instantaneous_values table and associated materialized view
-for storing real-time USGS gage data.
+Creates the usgs_instantaneous_values table and the trigger-maintained
+usgs_latest_readings table for storing real-time USGS gage data.
 """
 
 import os
@@ -13,7 +13,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from _db import get_engine, load_sql
 
 # Configure stdout for UTF-8 on Windows
 if sys.platform == 'win32':
@@ -24,16 +25,69 @@ if sys.platform == 'win32':
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
 
-def init_usgs_data_table():
-    """Initialize USGS data table"""
+def verify_usgs_data_table(conn):
+    """Print columns, indexes and the latest-readings table (one round trip)."""
+
+    print("-" * 70)
+    print("Verifying table structure...")
+    print("-" * 70)
+
+    info = conn.execute(text("""
+        SELECT jsonb_build_object(
+            'columns', (
+                SELECT jsonb_agg(
+                    jsonb_build_array(column_name, data_type, is_nullable)
+                    ORDER BY ordinal_position
+                )
+                FROM information_schema.columns
+                WHERE table_name = 'usgs_instantaneous_values'
+            ),
+            'indexes', (
+                SELECT jsonb_agg(indexname ORDER BY indexname)
+                FROM pg_indexes
+                WHERE tablename = 'usgs_instantaneous_values'
+            ),
+            'has_latest', EXISTS (
+                SELECT 1 FROM pg_tables
+                WHERE tablename = 'usgs_latest_readings'
+            )
+        )
+    """)).scalar()
+
+    # Each report is built first and printed with a single write
+    lines = [
+        "\nTable: usgs_instantaneous_values",
+        f"{'Column':<30} {'Type':<20} {'Nullable':<10}",
+        "-" * 60,
+    ]
+    lines += [
+        f"{name:<30} {data_type:<20} {nullable:<10}"
+        for name, data_type, nullable in info['columns'] or []
+    ]
+    lines.append("\nIndexes:")
+    lines += [f"  - {index_name}" for index_name in info['indexes'] or []]
+    print("\n".join(lines))
+
+    if info['has_latest']:
+        print("\nTable: usgs_latest_readings")
+        print("  Status: Created (kept current by trigger)")
+
+
+def init_usgs_data_table(verify=True):
+    """
+    Initialize USGS data table.
+
+    Args:
+        verify: Print the resulting table structure (one catalog query)
+    """
 
     # Load environment variables
     load_dotenv()
 
-    database_url = os.getenv('DATABASE_URL')
+    engine = get_engine()
 
-    if not database_url:
-        print("ERROR: DATABASE_URL not found in .env file")
+    if engine is None:
+        print("ERROR: Database connection not configured (DATABASE_URL or DATABASE_* in .env)")
         return False
 
     print("=" * 70)
@@ -44,68 +98,23 @@ def init_usgs_data_table():
     print()
 
     try:
-        # Create engine
-        engine = create_engine(database_url)
-
         with engine.begin() as conn:
             print("Connected to database")
             print()
 
             # Read SQL file
-            sql_file = Path(__file__).parent / "create_usgs_data_table.sql"
-
-            if not sql_file.exists():
-                raise FileNotFoundError(f"SQL file not found: {sql_file}")
-
-            print(f"Reading SQL file: {sql_file.name}")
-            with open(sql_file, 'r', encoding='utf-8') as f:
-                sql_content = f.read()
+            sql_name = "create_usgs_data_table.sql"
+            print(f"Reading SQL file: {sql_name}")
+            sql_content = load_sql(sql_name)
 
             # Execute SQL
             print("Creating USGS data tables...")
-            conn.execute(text(sql_content))
+            conn.exec_driver_sql(sql_content)
             print("Tables created successfully")
             print()
 
-            # Verify table creation
-            print("-" * 70)
-            print("Verifying table structure...")
-            print("-" * 70)
-
-            result = conn.execute(text("""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns
-                WHERE table_name = 'usgs_instantaneous_values'
-                ORDER BY ordinal_position;
-            """))
-
-            print("\nTable: usgs_instantaneous_values")
-            print(f"{'Column':<30} {'Type':<20} {'Nullable':<10}")
-            print("-" * 60)
-            for row in result:
-                print(f"{row[0]:<30} {row[1]:<20} {row[2]:<10}")
-
-            # Check indexes
-            result = conn.execute(text("""
-                SELECT indexname, indexdef
-                FROM pg_indexes
-                WHERE tablename = 'usgs_instantaneous_values';
-            """))
-
-            print("\nIndexes:")
-            for row in result:
-                print(f"  - {row[0]}")
-
-            # Check materialized view
-            result = conn.execute(text("""
-                SELECT COUNT(*) as exists
-                FROM pg_matviews
-                WHERE matviewname = 'usgs_latest_readings';
-            """))
-
-            if result.fetchone()[0] > 0:
-                print("\nMaterialized View: usgs_latest_readings")
-                print("  Status: Created")
+            if verify:
+                verify_usgs_data_table(conn)
 
             print()
             print("=" * 70)
@@ -115,9 +124,7 @@ def init_usgs_data_table():
             print("Next steps:")
             print("1. Run: python scripts/production/ingest_usgs_data.py")
             print("   to fetch and store current USGS gage data")
-            print()
-            print("2. Refresh materialized view with:")
-            print("   REFRESH MATERIALIZED VIEW CONCURRENTLY usgs_latest_readings;")
+            print("   (usgs_latest_readings updates automatically)")
             print()
 
             return True
@@ -134,5 +141,12 @@ def init_usgs_data_table():
 
 
 if __name__ == "__main__":
-    success = init_usgs_data_table()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Create the USGS data tables")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="Skip printing the table structure afterwards")
+    args = parser.parse_args()
+
+    success = init_usgs_data_table(verify=not args.no_verify)
     sys.exit(0 if success else 1)
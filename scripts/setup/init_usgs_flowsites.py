@@ -10,177 +10,347 @@ Run this script after setting up your database connection.
 
 import os
 import sys
-import json
+from datetime import datetime
 from pathlib import Path
+from uuid import UUID
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import ijson
+import orjson
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from _db import get_engine, load_sql
 
-# Configure stdout for UTF-8 on Windows
+from src.database.bulk_copy import copy_csv
+
+# Configure stdout for UTF-8 on Windows (reconfigure keeps the buffered
+# text stream, unlike wrapping it in a codecs writer)
 if sys.platform == 'win32':
-    import codecs
     if sys.stdout.encoding != 'utf-8':
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+        sys.stdout.reconfigure(encoding='utf-8')
     if sys.stderr.encoding != 'utf-8':
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+        sys.stderr.reconfigure(encoding='utf-8')
+
+# Features between progress updates while streaming (terminal only)
+PROGRESS_INTERVAL = 1000
+
+# Files up to this size are parsed in one go with orjson; larger ones are
+# streamed feature by feature with ijson to bound memory
+ORJSON_MAX_BYTES = 500 * 1024 * 1024
 
 
 def create_usgs_flowsites_table(conn):
-    """Create the USGS_Flowsites table using SQL file"""
+    """
+    Create the USGS_Flowsites table using SQL file.
+
+    A newly created table is switched to UNLOGGED so the initial load skips
+    per-row WAL; the caller sets it back to LOGGED in the same transaction.
 
-    sql_file = Path(__file__).parent / "create_usgs_flowsites_table.sql"
+    Returns:
+        bool: True if the table was created by this call
+    """
 
-    if not sql_file.exists():
-        raise FileNotFoundError(f"SQL file not found: {sql_file}")
+    is_new = conn.execute(text(
+        """SELECT to_regclass('"USGS_Flowsites"') IS NULL"""
+    )).scalar()
 
-    print(f"Reading SQL file: {sql_file.name}")
-    with open(sql_file, 'r', encoding='utf-8') as f:
-        sql_content = f.read()
+    sql_name = "create_usgs_flowsites_table.sql"
+    print(f"Reading SQL file: {sql_name}")
+    sql_content = load_sql(sql_name)
 
     print("Creating USGS_Flowsites table...")
-    conn.execute(text(sql_content))
+    conn.exec_driver_sql(sql_content)
+    if is_new:
+        # Empty table, so this rewrite is free
+        conn.execute(text('ALTER TABLE "USGS_Flowsites" SET UNLOGGED'))
     print("✅ Table created successfully")
 
+    return is_new
+
+
+# GeoJSON properties copied into the staging table, in column order.
+# Typed properties are validated per feature (see feature_to_row) so that a
+# malformed value rejects that one feature instead of failing the COPY.
+PROPERTY_KEYS = (
+    'id', 'name', 'siteId', 'agencyCode', 'network', 'stateCd', 'state',
+    'siteTypeCd', 'noaaId', 'managingOr', 'uuid', 'webcamUrl', 'isEnabled',
+    'createdOn', 'createdBy', 'updatedOn', 'updatedBy'
+)
+
+# Staging table for the COPY; merged into "USGS_Flowsites" with one upsert
+# (geometry is built server-side from the lon/lat columns)
+STAGE_COLUMNS = ['ord'] + [f'"{key}"' for key in PROPERTY_KEYS] + ['longitude', 'latitude']
+
+CREATE_STAGE_SQL = text("""
+    CREATE TEMP TABLE usgs_flowsites_stage (
+        ord INTEGER,
+        "id" BIGINT,
+        "name" VARCHAR(255),
+        "siteId" VARCHAR(50),
+        "agencyCode" VARCHAR(10),
+        "network" VARCHAR(50),
+        "stateCd" SMALLINT,
+        "state" VARCHAR(50),
+        "siteTypeCd" VARCHAR(10),
+        "noaaId" VARCHAR(50),
+        "managingOr" VARCHAR(255),
+        "uuid" UUID,
+        "webcamUrl" TEXT,
+        "isEnabled" TEXT,
+        "createdOn" TIMESTAMPTZ,
+        "createdBy" INTEGER,
+        "updatedOn" TIMESTAMPTZ,
+        "updatedBy" INTEGER,
+        longitude DOUBLE PRECISION,
+        latitude DOUBLE PRECISION
+    ) ON COMMIT DROP
+""")
+
+# DISTINCT ON keeps the last occurrence of a repeated siteId (ON CONFLICT
+# cannot update the same row twice in one statement)
+MERGE_STAGE_SQL = text("""
+    INSERT INTO "USGS_Flowsites" (
+        id, name, "siteId", "agencyCode", network, "stateCd", state,
+        "siteTypeCd", "noaaId", "managingOr", uuid, "webcamUrl",
+        "isEnabled", geom, "createdOn", "createdBy", "updatedOn", "updatedBy"
+    )
+    SELECT DISTINCT ON ("siteId")
+        id, name, "siteId", "agencyCode", network,
+        "stateCd", state,
+        "siteTypeCd", "noaaId", "managingOr", uuid, "webcamUrl",
+        COALESCE("isEnabled", 't') = 't',
+        ST_SetSRID(ST_MakePoint(longitude, latitude), 4326),
+        "createdOn", COALESCE("createdBy", 0), "updatedOn", COALESCE("updatedBy", 0)
+    FROM usgs_flowsites_stage
+    ORDER BY "siteId", ord DESC
+    ON CONFLICT ("siteId") DO UPDATE SET
+        name = EXCLUDED.name,
+        "agencyCode" = EXCLUDED."agencyCode",
+        network = EXCLUDED.network,
+        "stateCd" = EXCLUDED."stateCd",
+        state = EXCLUDED.state,
+        "siteTypeCd" = EXCLUDED."siteTypeCd",
+        "noaaId" = EXCLUDED."noaaId",
+        "managingOr" = EXCLUDED."managingOr",
+        uuid = EXCLUDED.uuid,
+        "webcamUrl" = EXCLUDED."webcamUrl",
+        "isEnabled" = EXCLUDED."isEnabled",
+        geom = EXCLUDED.geom,
+        "updatedOn" = EXCLUDED."updatedOn",
+        "updatedBy" = EXCLUDED."updatedBy"
+""")
+
+# Verification queries
+COUNT_SQL = text('SELECT COUNT(*) FROM "USGS_Flowsites"')
+
+SAMPLE_SQL = text('''
+    SELECT id, name, "siteId", state, ST_AsText(geom) as geom_wkt
+    FROM "USGS_Flowsites"
+    LIMIT 3
+''')
+
+BY_STATE_SQL = text('''
+    SELECT state, COUNT(*) as count
+    FROM "USGS_Flowsites"
+    GROUP BY state
+    ORDER BY count DESC
+''')
+
+
+# Integer properties and the range of their column type
+INTEGER_RANGES = {
+    'id': (-2**63, 2**63 - 1),
+    'stateCd': (-2**15, 2**15 - 1),
+    'createdBy': (-2**31, 2**31 - 1),
+    'updatedBy': (-2**31, 2**31 - 1),
+}
+
+# VARCHAR(n) limits of the staging/target columns
+VARCHAR_LIMITS = {
+    'name': 255, 'siteId': 50, 'agencyCode': 10, 'network': 50,
+    'state': 50, 'siteTypeCd': 10, 'noaaId': 50, 'managingOr': 255,
+}
+
+TIMESTAMP_KEYS = ('createdOn', 'updatedOn')
+
+
+def feature_to_row(position, feature):
+    """
+    Convert a GeoJSON feature to a staging row (in STAGE_COLUMNS order).
+
+    Typed properties (integers, uuid, timestamps, bounded strings) are
+    validated here: a value the staging table would reject raises, so the
+    caller skips and counts that feature instead of the whole COPY failing.
+    Values are otherwise passed through for the server to parse.
+
+    Args:
+        position: Position of the feature in the file (later wins on duplicates)
+        feature: GeoJSON feature dict
+
+    Returns:
+        tuple: Row values
+
+    Raises:
+        KeyError: If a required property (id, name, siteId) or the
+            geometry is missing
+        ValueError: If a property does not fit its column type
+    """
+    props = dict(feature['properties'])
+    # GeoJSON is [lon, lat, elevation]
+    longitude, latitude = map(float, feature['geometry']['coordinates'][:2])
+
+    # Reject here, as a NOT NULL error in the merge would abort the whole load
+    for key in ('id', 'name', 'siteId'):
+        if props.get(key) is None:
+            raise KeyError(key)
+
+    for key, (low, high) in INTEGER_RANGES.items():
+        value = props.get(key)
+        if value is None or value == '':
+            props[key] = None
+            continue
+        value = int(value)
+        if not low <= value <= high:
+            raise ValueError(f"{key} out of range: {value}")
+        props[key] = value
+
+    for key, limit in VARCHAR_LIMITS.items():
+        value = props.get(key)
+        if value is not None and len(str(value)) > limit:
+            raise ValueError(f"{key} longer than {limit} characters")
+
+    if props.get('uuid'):
+        props['uuid'] = str(UUID(str(props['uuid'])))
+    else:
+        props['uuid'] = None
+
+    for key in TIMESTAMP_KEYS:
+        if props.get(key):
+            datetime.fromisoformat(str(props[key]))
+        else:
+            props[key] = None
+
+    return (position, *map(props.get, PROPERTY_KEYS), longitude, latitude)
+
 
 def load_geojson_data(conn, geojson_path):
-    """Load GeoJSON data into observations.usgs_flowsites table"""
+    """
+    Load GeoJSON data into the USGS_Flowsites table.
+
+    Features are parsed with orjson (or streamed one at a time with ijson
+    for files over ORJSON_MAX_BYTES), copied into a temp staging table with
+    COPY and merged with a single INSERT ... ON CONFLICT (one round trip
+    for the data instead of one per feature).
+    """
 
     if not os.path.exists(geojson_path):
         raise FileNotFoundError(f"GeoJSON file not found: {geojson_path}")
 
     print(f"\nReading GeoJSON file: {geojson_path}")
-    with open(geojson_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    features = data.get('features', [])
-    print(f"Found {len(features)} features to load")
+    parsed = 0
+    error_count = 0
+    show_progress = sys.stdout.isatty()
+
+    def rows(features):
+        nonlocal parsed, error_count
+        for i, feature in enumerate(features, 1):
+            try:
+                row = feature_to_row(i, feature)
+            except Exception as e:
+                error_count += 1
+                print(f"\n⚠️  Error parsing feature {i}: {e}")
+                continue
+            parsed += 1
+            if show_progress and parsed % PROGRESS_INTERVAL == 0:
+                print(f"\r  Parsed {parsed} features", end='')
+            yield row
 
-    if len(features) == 0:
+    print("\nLoading features into database...")
+    conn.execute(CREATE_STAGE_SQL)
+
+    if os.path.getsize(geojson_path) <= ORJSON_MAX_BYTES:
+        features = orjson.loads(Path(geojson_path).read_bytes()).get('features', [])
+        copy_csv(conn.connection, 'usgs_flowsites_stage', STAGE_COLUMNS, rows(features))
+    else:
+        # Parsed incrementally and fed straight into the COPY, so the whole
+        # FeatureCollection is never held in memory
+        with open(geojson_path, 'rb') as f:
+            features = ijson.items(f, 'features.item', use_float=True)
+            copy_csv(conn.connection, 'usgs_flowsites_stage', STAGE_COLUMNS, rows(features))
+
+    if parsed == 0 and error_count == 0:
         print("⚠️  No features found in GeoJSON file")
         return 0
 
-    # Prepare insert statement
-    insert_sql = text("""
-        INSERT INTO "USGS_Flowsites" (
-            id, name, "siteId", "agencyCode", network, "stateCd", state,
-            "siteTypeCd", "noaaId", "managingOr", uuid, "webcamUrl",
-            "isEnabled", geom, "createdOn", "createdBy", "updatedOn", "updatedBy"
-        ) VALUES (
-            :id, :name, :site_id, :agency_code, :network, :state_cd, :state,
-            :site_type_cd, :noaa_id, :managing_or, :uuid, :webcam_url,
-            :is_enabled, ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326),
-            :created_on, :created_by, :updated_on, :updated_by
-        )
-        ON CONFLICT ("siteId") DO UPDATE SET
-            name = EXCLUDED.name,
-            "agencyCode" = EXCLUDED."agencyCode",
-            network = EXCLUDED.network,
-            "stateCd" = EXCLUDED."stateCd",
-            state = EXCLUDED.state,
-            "siteTypeCd" = EXCLUDED."siteTypeCd",
-            "noaaId" = EXCLUDED."noaaId",
-            "managingOr" = EXCLUDED."managingOr",
-            uuid = EXCLUDED.uuid,
-            "webcamUrl" = EXCLUDED."webcamUrl",
-            "isEnabled" = EXCLUDED."isEnabled",
-            geom = EXCLUDED.geom,
-            "updatedOn" = EXCLUDED."updatedOn",
-            "updatedBy" = EXCLUDED."updatedBy";
-    """)
-
-    loaded_count = 0
-    error_count = 0
+    print(f"\r  Parsed {parsed} features")
+    loaded_count = conn.execute(MERGE_STAGE_SQL).rowcount
 
-    print("\nLoading features into database...")
-    for i, feature in enumerate(features, 1):
-        try:
-            props = feature['properties']
-            geom = feature['geometry']
-            coords = geom['coordinates']
-
-            # Extract coordinates (GeoJSON is [lon, lat, elevation])
-            longitude = float(coords[0])
-            latitude = float(coords[1])
-
-            # Parse boolean for isEnabled
-            is_enabled = props.get('isEnabled', 't') == 't'
-
-            # Execute insert
-            conn.execute(insert_sql, {
-                'id': int(props['id']),
-                'name': props['name'],
-                'site_id': props['siteId'],
-                'agency_code': props.get('agencyCode'),
-                'network': props.get('network'),
-                'state_cd': int(props['stateCd']) if props.get('stateCd') else None,
-                'state': props.get('state'),
-                'site_type_cd': props.get('siteTypeCd'),
-                'noaa_id': props.get('noaaId'),
-                'managing_or': props.get('managingOr'),
-                'uuid': props.get('uuid'),
-                'webcam_url': props.get('webcamUrl'),
-                'is_enabled': is_enabled,
-                'longitude': longitude,
-                'latitude': latitude,
-                'created_on': props.get('createdOn'),
-                'created_by': int(props.get('createdBy', 0)),
-                'updated_on': props.get('updatedOn'),
-                'updated_by': int(props.get('updatedBy', 0))
-            })
-
-            loaded_count += 1
-
-            if i % 10 == 0 or i == len(features):
-                print(f"  Processed {i}/{len(features)} features...", end='\r')
-
-        except Exception as e:
-            error_count += 1
-            print(f"\n⚠️  Error loading feature {i}: {e}")
-            continue
-
-    print(f"\n✅ Loaded {loaded_count} features successfully")
+    print(f"✅ Loaded {loaded_count} features successfully")
     if error_count > 0:
         print(f"⚠️  {error_count} features had errors")
 
     return loaded_count
 
 
+def drop_secondary_indexes(conn):
+    """
+    Drop the non-unique indexes on "USGS_Flowsites" ahead of the bulk load.
+
+    The primary key and the "siteId" unique constraint stay (the merge's
+    ON CONFLICT needs the latter); the rest are rebuilt once after the load
+    instead of being maintained row by row.
+
+    Returns:
+        list: CREATE INDEX statements to rebuild the dropped indexes
+    """
+    index_defs = conn.execute(text("""
+        SELECT quote_ident(c.relname), pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = '"USGS_Flowsites"'::regclass AND NOT i.indisunique
+    """)).fetchall()
+
+    if index_defs:
+        conn.exec_driver_sql("DROP INDEX " + ", ".join(name for name, _ in index_defs))
+        print(f"Dropped {len(index_defs)} secondary indexes for the load")
+
+    return [index_def for _, index_def in index_defs]
+
+
+def rebuild_indexes(conn, index_defs):
+    """Recreate the indexes dropped by drop_secondary_indexes and analyze."""
+    statements = list(index_defs) + ['ANALYZE "USGS_Flowsites"']
+    conn.exec_driver_sql(";\n".join(statements))
+    print(f"✅ Rebuilt {len(index_defs)} indexes")
+
+
 def verify_data(conn):
     """Verify loaded data"""
 
     print("\nVerifying loaded data...")
 
     # Count rows
-    result = conn.execute(text('SELECT COUNT(*) FROM "USGS_Flowsites";'))
-    count = result.fetchone()[0]
+    count = conn.execute(COUNT_SQL).scalar()
     print(f"  Total records: {count}")
 
     # Sample data
-    result = conn.execute(text('''
-        SELECT id, name, "siteId", state, ST_AsText(geom) as geom_wkt
-        FROM "USGS_Flowsites"
-        LIMIT 3;
-    '''))
+    result = conn.execute(SAMPLE_SQL)
 
-    print("\n  Sample records:")
+    # Rows are formatted first and printed with a single write
+    lines = ["\n  Sample records:"]
     for row in result:
-        print(f"    - {row[1]} ({row[2]}) in {row[3]}")
-        print(f"      Geometry: {row[4]}")
+        lines.append(f"    - {row[1]} ({row[2]}) in {row[3]}")
+        lines.append(f"      Geometry: {row[4]}")
+    print("\n".join(lines))
 
     # Count by state
-    result = conn.execute(text('''
-        SELECT state, COUNT(*) as count
-        FROM "USGS_Flowsites"
-        GROUP BY state
-        ORDER BY count DESC;
-    '''))
-
-    print("\n  Records by state:")
-    for row in result:
-        print(f"    - {row[0]}: {row[1]} sites")
+    result = conn.execute(BY_STATE_SQL)
+
+    lines = ["\n  Records by state:"]
+    lines += [f"    - {row[0]}: {row[1]} sites" for row in result]
+    print("\n".join(lines))
 
 
 def init_usgs_flowsites(geojson_path=None):
@@ -189,10 +359,10 @@ def init_usgs_flowsites(geojson_path=None):
     # Load environment variables
     load_dotenv()
 
-    database_url = os.getenv('DATABASE_URL')
+    engine = get_engine()
 
-    if not database_url:
-        print("❌ ERROR: DATABASE_URL not found in .env file")
+    if engine is None:
+        print("❌ ERROR: Database connection not configured (DATABASE_URL or DATABASE_* in .env)")
         return False
 
     # Default GeoJSON path if not provided
@@ -208,9 +378,6 @@ def init_usgs_flowsites(geojson_path=None):
     print()
 
     try:
-        # Create engine
-        engine = create_engine(database_url)
-
         with engine.begin() as conn:
             print("✅ Connected to database")
             print()
@@ -219,14 +386,21 @@ def init_usgs_flowsites(geojson_path=None):
             print("-" * 70)
             print("STEP 1: Create Table")
             print("-" * 70)
-            create_usgs_flowsites_table(conn)
+            is_new = create_usgs_flowsites_table(conn)
             print()
 
             # Step 2: Load data
             print("-" * 70)
             print("STEP 2: Load GeoJSON Data")
             print("-" * 70)
+            # Same transaction, so readers never see the table without its indexes
+            index_defs = drop_secondary_indexes(conn)
             loaded_count = load_geojson_data(conn, geojson_path)
+            if is_new:
+                # One sequential WAL write of the loaded table. It commits
+                # together with the CREATE, so a crash can't leave it unlogged.
+                conn.execute(text('ALTER TABLE "USGS_Flowsites" SET LOGGED'))
+            rebuild_indexes(conn, index_defs)
             print()
 
             # Step 3: Verify
@@ -0,0 +1,62 @@
+"""
+USGS Tables Initialization (all steps)
+
+Runs the USGS setup scripts in one process, in dependency order:
+1. init_usgs_flowsites.py   - USGS_Flowsites table + GeoJSON load
+2. init_usgs_data_table.py  - usgs_instantaneous_values (FK to USGS_Flowsites)
+3. init_validation_table.py - nwm_usgs_validation (FK to USGS_Flowsites)
+
+All steps share the cached engine from _db.get_engine, so the connection
+(TCP/TLS handshake and auth) is set up once instead of once per script.
+Steps 2 and 3 are not run concurrently: adding their foreign keys takes a
+SHARE ROW EXCLUSIVE lock on USGS_Flowsites, which conflicts with itself,
+so the two would serialize anyway.
+
+The individual scripts remain runnable on their own.
+
+Usage:
+    python scripts/setup/init_usgs_tables.py [path/to/usgs_sites.geojson]
+"""
+
+import sys
+import time
+
+# init_usgs_flowsites first: it switches stdout to UTF-8 on Windows, so the
+# other modules' own stdout setup becomes a no-op
+from init_usgs_flowsites import init_usgs_flowsites
+from init_usgs_data_table import init_usgs_data_table
+from init_validation_table import init_validation_table
+
+
+def init_usgs_tables(geojson_path=None):
+    """
+    Run the USGS setup steps in order, stopping at the first failure.
+
+    Args:
+        geojson_path: GeoJSON file of USGS sites (init_usgs_flowsites default if None)
+
+    Returns:
+        bool: True if every step succeeded
+    """
+    steps = [
+        ('USGS_Flowsites', lambda: init_usgs_flowsites(geojson_path)),
+        ('usgs_instantaneous_values', init_usgs_data_table),
+        ('nwm_usgs_validation', init_validation_table),
+    ]
+
+    start = time.perf_counter()
+
+    for name, step in steps:
+        if not step():
+            print(f"❌ Stopped: {name} initialization failed")
+            return False
+
+    print(f"✅ All USGS tables initialized in {time.perf_counter() - start:.1f}s")
+    return True
+
+
+if __name__ == "__main__":
+    geojson_path = sys.argv[1] if len(sys.argv) > 1 else None
+
+    success = init_usgs_tables(geojson_path)
+    sys.exit(0 if success else 1)
@@ -12,7 +12,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from _db import get_engine, load_sql
 
 # Configure stdout for UTF-8 on Windows
 if sys.platform == 'win32':
@@ -29,10 +30,10 @@ def init_validation_table():
     # Load environment variables
     load_dotenv()
 
-    database_url = os.getenv('DATABASE_URL')
+    engine = get_engine()
 
-    if not database_url:
-        print("ERROR: DATABASE_URL not found in .env file")
+    if engine is None:
+        print("ERROR: Database connection not configured (DATABASE_URL or DATABASE_* in .env)")
         return False
 
     print("=" * 70)
@@ -43,26 +44,18 @@ def init_validation_table():
     print()
 
     try:
-        # Create engine
-        engine = create_engine(database_url)
-
         with engine.begin() as conn:
             print("Connected to database")
             print()
 
             # Read SQL file
-            sql_file = Path(__file__).parent / "create_validation_table.sql"
-
-            if not sql_file.exists():
-                raise FileNotFoundError(f"SQL file not found: {sql_file}")
-
-            print(f"Reading SQL file: {sql_file.name}")
-            with open(sql_file, 'r', encoding='utf-8') as f:
-                sql_content = f.read()
+            sql_name = "create_validation_table.sql"
+            print(f"Reading SQL file: {sql_name}")
+            sql_content = load_sql(sql_name)
 
             # Execute SQL
             print("Creating validation tables...")
-            conn.execute(text(sql_content))
+            conn.exec_driver_sql(sql_content)
             print("Tables created successfully")
             print()
 
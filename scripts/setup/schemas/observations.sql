@@ -68,22 +68,70 @@ CREATE INDEX IF NOT EXISTS idx_usgs_iv_site_time
 CREATE INDEX IF NOT EXISTS idx_usgs_iv_parameter
     ON observations.usgs_instantaneous_values (parameter_cd);
 
--- Materialized view for latest readings
-CREATE MATERIALIZED VIEW IF NOT EXISTS observations.usgs_latest_readings AS
+-- Latest reading per site/parameter, kept current by a trigger on
+-- usgs_instantaneous_values (replaces the earlier materialized view)
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_matviews
+        WHERE schemaname = 'observations' AND matviewname = 'usgs_latest_readings'
+    ) THEN
+        DROP MATERIALIZED VIEW observations.usgs_latest_readings;
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS observations.usgs_latest_readings (
+    site_id VARCHAR(50) NOT NULL,
+    parameter_cd VARCHAR(10) NOT NULL,
+    parameter_name VARCHAR(255),
+    value DOUBLE PRECISION,
+    unit VARCHAR(50),
+    measured_at TIMESTAMPTZ NOT NULL,
+    is_provisional BOOLEAN,
+    fetched_at TIMESTAMPTZ,
+    PRIMARY KEY (site_id, parameter_cd)
+);
+
+CREATE OR REPLACE FUNCTION observations.update_usgs_latest_readings()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO observations.usgs_latest_readings (
+        site_id, parameter_cd, parameter_name, value, unit,
+        measured_at, is_provisional, fetched_at
+    ) VALUES (
+        NEW.site_id, NEW.parameter_cd, NEW.parameter_name, NEW.value, NEW.unit,
+        NEW.datetime, NEW.is_provisional, NEW.fetched_at
+    )
+    ON CONFLICT (site_id, parameter_cd) DO UPDATE
+        SET parameter_name = EXCLUDED.parameter_name,
+            value = EXCLUDED.value,
+            unit = EXCLUDED.unit,
+            measured_at = EXCLUDED.measured_at,
+            is_provisional = EXCLUDED.is_provisional,
+            fetched_at = EXCLUDED.fetched_at
+        WHERE EXCLUDED.measured_at >= observations.usgs_latest_readings.measured_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Ingest upserts (INSERT ... ON CONFLICT DO UPDATE) fire the UPDATE trigger
+DROP TRIGGER IF EXISTS trigger_usgs_latest_readings ON observations.usgs_instantaneous_values;
+CREATE TRIGGER trigger_usgs_latest_readings
+    AFTER INSERT OR UPDATE ON observations.usgs_instantaneous_values
+    FOR EACH ROW
+    EXECUTE FUNCTION observations.update_usgs_latest_readings();
+
+-- Readings stored before the trigger existed
+INSERT INTO observations.usgs_latest_readings (
+    site_id, parameter_cd, parameter_name, value, unit,
+    measured_at, is_provisional, fetched_at
+)
 SELECT DISTINCT ON (site_id, parameter_cd)
-    site_id,
-    parameter_cd,
-    parameter_name,
-    value,
-    unit,
-    datetime as measured_at,
-    is_provisional,
-    fetched_at
+    site_id, parameter_cd, parameter_name, value, unit,
+    datetime, is_provisional, fetched_at
 FROM observations.usgs_instantaneous_values
-ORDER BY site_id, parameter_cd, datetime DESC;
-
-CREATE UNIQUE INDEX IF NOT EXISTS idx_usgs_latest_site_param
-    ON observations.usgs_latest_readings (site_id, parameter_cd);
+ORDER BY site_id, parameter_cd, datetime DESC
+ON CONFLICT (site_id, parameter_cd) DO NOTHING;
 
 -- User Observations table
 CREATE TABLE IF NOT EXISTS observations.user_observations (
@@ -13,7 +13,6 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-import pytz
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -24,21 +23,61 @@ import pandas as pd
 import numpy as np
 
 from src.metrics.rising_limb import (
-    detect_rising_limb,
     RisingLimbConfig,
+    detect_rising_limb_for_reach,
     load_default_config as load_rising_limb_config
 )
 
-from src.metrics.baseflow import (
-    compute_bdi,
-    classify_bdi
-)
+from src.metrics.baseflow import BDI_LABELS, classify_bdi_codes, compute_bdi_for_reach
 
 from src.metrics.velocity import (
-    classify_velocity,
+    VELOCITY_LABELS,
+    classify_velocity_codes,
     load_species_config
 )
 
+# Reaches whose SQL results are re-checked against the library functions
+CROSS_CHECK_REACHES = 5
+BDI_TOLERANCE = 1e-9
+
+
+def cross_check_reaches(metrics, rising_limb_config, conn):
+    """
+    Re-compute rising limb and BDI with the library for a sample of reaches.
+
+    The batched query reimplements both metrics in SQL; this confirms it
+    agrees with detect_rising_limb_for_reach() and compute_bdi_for_reach().
+
+    Returns:
+        List of mismatch descriptions (empty if all sampled reaches agree)
+    """
+    sample = metrics.sample(n=min(CROSS_CHECK_REACHES, len(metrics)), random_state=0)
+    mismatches = []
+
+    for reach in sample.itertuples(index=False):
+        feature_id = int(reach.feature_id)
+        sql_rising = (bool(reach.rising_detected),
+                      reach.rising_intensity if reach.rising_detected else None)
+        lib_rising = detect_rising_limb_for_reach(
+            feature_id=feature_id,
+            start_time=reach.flow_start,
+            end_time=reach.flow_end,
+            config=rising_limb_config,
+            db_connection=conn
+        )
+        if lib_rising != sql_rising:
+            mismatches.append(
+                f"Reach {feature_id}: rising limb SQL={sql_rising}, library={lib_rising}"
+            )
+
+        lib_bdi = compute_bdi_for_reach(feature_id, reach.valid_time, conn)
+        if lib_bdi is None or abs(lib_bdi[0] - reach.bdi) > BDI_TOLERANCE:
+            mismatches.append(
+                f"Reach {feature_id}: BDI SQL={reach.bdi}, library={lib_bdi and lib_bdi[0]}"
+            )
+
+    return mismatches
+
 
 def test_all_metrics_50_reaches():
     """Test all metrics on 50 sample reaches"""
@@ -78,164 +117,190 @@ def test_all_metrics_50_reaches():
             print("CONNECTED to database")
             print()
 
-            # Find 50 reaches with complete data for all metrics
+            # Find the 50 reaches with the most complete timestamps and compute
+            # their metrics in one statement (a single round trip; there is no
+            # per-reach query left to overlap). The rising limb test (dQ/dt >
+            # min_slope for min_duration consecutive steps) is a gaps-and-islands
+            # run count over LAG(); BDI is the component ratio at the latest
+            # timestamp with all five variables. Only one row per reach comes back.
             print("Finding 50 reaches with complete metric data...")
-            query = text("""
+            query_metrics = text("""
                 WITH reach_data AS (
-                    SELECT
-                        feature_id,
-                        valid_time,
-                        SUM(CASE WHEN variable = 'streamflow' THEN 1 ELSE 0 END) as has_flow,
-                        SUM(CASE WHEN variable = 'velocity' THEN 1 ELSE 0 END) as has_velocity,
-                        SUM(CASE WHEN variable = 'qBtmVertRunoff' THEN 1 ELSE 0 END) as has_btm,
-                        SUM(CASE WHEN variable = 'qBucket' THEN 1 ELSE 0 END) as has_bucket,
-                        SUM(CASE WHEN variable = 'qSfcLatRunoff' THEN 1 ELSE 0 END) as has_sfc
+                    -- Timestamps with all five variables; only these rows are
+                    -- read, and the primary key (feature_id, valid_time,
+                    -- variable, source) already covers the grouping
+                    SELECT feature_id, valid_time
                     FROM nwm.hydro_timeseries
+                    WHERE variable IN ('streamflow', 'velocity', 'qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
                     GROUP BY feature_id, valid_time
-                    HAVING
-                        SUM(CASE WHEN variable = 'streamflow' THEN 1 ELSE 0 END) > 0 AND
-                        SUM(CASE WHEN variable = 'velocity' THEN 1 ELSE 0 END) > 0 AND
-                        SUM(CASE WHEN variable = 'qBtmVertRunoff' THEN 1 ELSE 0 END) > 0 AND
-                        SUM(CASE WHEN variable = 'qBucket' THEN 1 ELSE 0 END) > 0 AND
-                        SUM(CASE WHEN variable = 'qSfcLatRunoff' THEN 1 ELSE 0 END) > 0
+                    HAVING COUNT(DISTINCT variable) = 5
                 ),
                 reach_counts AS (
                     SELECT feature_id, COUNT(*) as complete_timestamps
                     FROM reach_data
                     GROUP BY feature_id
                     HAVING COUNT(*) >= 3
+                ),
+                reaches AS (
+                    SELECT feature_id, complete_timestamps
+                    FROM reach_counts
+                    ORDER BY complete_timestamps DESC
+                    LIMIT 50
+                ),
+                series AS (
+                    SELECT h.feature_id, h.variable, h.valid_time, h.value
+                    FROM nwm.hydro_timeseries h
+                    JOIN reaches USING (feature_id)
+                    WHERE h.variable IN ('streamflow', 'velocity', 'qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
+                ),
+                latest AS (
+                    SELECT DISTINCT ON (feature_id)
+                        feature_id,
+                        valid_time,
+                        MAX(value) FILTER (WHERE variable = 'streamflow') AS streamflow,
+                        MAX(value) FILTER (WHERE variable = 'velocity') AS velocity,
+                        GREATEST(MAX(value) FILTER (WHERE variable = 'qBtmVertRunoff'), 0) AS q_btm_vert,
+                        GREATEST(MAX(value) FILTER (WHERE variable = 'qBucket'), 0) AS q_bucket,
+                        GREATEST(MAX(value) FILTER (WHERE variable = 'qSfcLatRunoff'), 0) AS q_sfc_lat
+                    FROM series
+                    GROUP BY feature_id, valid_time
+                    HAVING COUNT(DISTINCT variable) = 5
+                    ORDER BY feature_id, valid_time DESC
+                ),
+                flow_lag AS (
+                    SELECT
+                        feature_id,
+                        valid_time,
+                        value,
+                        (value - LAG(value) OVER w)
+                            / NULLIF(EXTRACT(EPOCH FROM valid_time - LAG(valid_time) OVER w) / 3600, 0) AS dqdt,
+                        ROW_NUMBER() OVER w AS n
+                    FROM series
+                    WHERE variable = 'streamflow'
+                    WINDOW w AS (PARTITION BY feature_id ORDER BY valid_time)
+                ),
+                flow_stats AS (
+                    SELECT feature_id, MIN(value) AS flow_min, MAX(value) AS flow_max, AVG(value) AS flow_mean,
+                           MIN(valid_time) AS flow_start, MAX(valid_time) AS flow_end
+                    FROM flow_lag
+                    GROUP BY feature_id
+                ),
+                rising_runs AS (
+                    -- Consecutive rising steps share n - row_number()
+                    SELECT feature_id, COUNT(*) AS run_length, MAX(dqdt) AS max_slope
+                    FROM (
+                        SELECT feature_id, dqdt,
+                               n - ROW_NUMBER() OVER (PARTITION BY feature_id ORDER BY valid_time) AS run_id
+                        FROM flow_lag
+                        WHERE dqdt > :min_slope
+                    ) rising_steps
+                    GROUP BY feature_id, run_id
+                ),
+                rising AS (
+                    SELECT feature_id,
+                           BOOL_OR(run_length >= :min_duration) AS detected,
+                           MAX(max_slope) AS max_slope
+                    FROM rising_runs
+                    GROUP BY feature_id
                 )
-                SELECT feature_id, complete_timestamps
-                FROM reach_counts
-                ORDER BY complete_timestamps DESC
-                LIMIT 50
+                SELECT
+                    l.feature_id,
+                    c.complete_timestamps,
+                    l.valid_time,
+                    l.streamflow,
+                    l.velocity,
+                    l.q_btm_vert,
+                    l.q_bucket,
+                    l.q_sfc_lat,
+                    f.flow_min,
+                    f.flow_max,
+                    f.flow_mean,
+                    f.flow_start,
+                    f.flow_end,
+                    COALESCE(r.detected, FALSE) AS rising_detected,
+                    CASE
+                        WHEN NOT COALESCE(r.detected, FALSE) THEN NULL
+                        WHEN r.max_slope >= :strong THEN 'strong'
+                        WHEN r.max_slope >= :moderate THEN 'moderate'
+                        ELSE 'weak'
+                    END AS rising_intensity,
+                    COALESCE(
+                        (l.q_btm_vert + l.q_bucket)
+                            / NULLIF(l.q_btm_vert + l.q_bucket + l.q_sfc_lat, 0),
+                        0
+                    ) AS bdi
+                FROM reaches c
+                JOIN latest l USING (feature_id)
+                JOIN flow_stats f USING (feature_id)
+                LEFT JOIN rising r USING (feature_id)
+                ORDER BY c.complete_timestamps DESC, l.feature_id
             """)
-
-            result = conn.execute(query)
-            reaches = [(row[0], row[1]) for row in result]
-
-            if len(reaches) == 0:
+            metrics = pd.read_sql(query_metrics, conn, params={
+                'min_slope': rising_limb_config.min_slope,
+                'min_duration': rising_limb_config.min_duration,
+                'strong': rising_limb_config.intensity_thresholds['strong'],
+                'moderate': rising_limb_config.intensity_thresholds['moderate'],
+            })
+
+            if metrics.empty:
                 print("ERROR: No reaches found with complete data")
                 return False
 
-            print(f"  Found {len(reaches)} reaches with complete data")
-            print(f"  Timestamp range per reach: {min(r[1] for r in reaches)}-{max(r[1] for r in reaches)}")
+            print(f"  Found {len(metrics)} reaches with complete data")
+            print(f"  Timestamp range per reach: {metrics['complete_timestamps'].min()}-{metrics['complete_timestamps'].max()}")
             print()
 
-            # Process each reach
-            results = []
-            print("Processing reaches...")
+            # The SQL above is a fast path, not the library code: confirm it
+            # matches detect_rising_limb / compute_bdi on a sample of reaches
+            print(f"Cross-checking {min(CROSS_CHECK_REACHES, len(metrics))} reaches against the library...")
+            mismatches = cross_check_reaches(metrics, rising_limb_config, conn)
+            if mismatches:
+                print("ERROR: SQL metrics disagree with the library:")
+                for mismatch in mismatches:
+                    print(f"  {mismatch}")
+                return False
+            print("  SQL results match the library")
             print()
 
-            for i, (feature_id, timestamp_count) in enumerate(reaches, 1):
-                print(f"  [{i:2d}/50] Reach {feature_id} ({timestamp_count} timestamps)...", end=" ")
-
-                try:
-                    # Get latest timestamp with complete data
-                    query_time = text("""
-                        SELECT valid_time
-                        FROM nwm.hydro_timeseries
-                        WHERE feature_id = :feature_id
-                          AND variable IN ('streamflow', 'velocity', 'qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
-                        GROUP BY valid_time
-                        HAVING COUNT(DISTINCT variable) = 5
-                        ORDER BY valid_time DESC
-                        LIMIT 1
-                    """)
-
-                    result = conn.execute(query_time, {'feature_id': feature_id})
-                    row = result.fetchone()
-                    if not row:
-                        print("SKIP (no complete timestamp)")
-                        continue
-
-                    latest_time = row[0]
-
-                    # Get all data for this timestamp
-                    query_data = text("""
-                        SELECT variable, value
-                        FROM nwm.hydro_timeseries
-                        WHERE feature_id = :feature_id
-                          AND valid_time = :valid_time
-                          AND variable IN ('streamflow', 'velocity', 'qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
-                    """)
-
-                    result = conn.execute(query_data, {'feature_id': feature_id, 'valid_time': latest_time})
-                    data = {row[0]: row[1] for row in result}
-
-                    # Get streamflow time series for rising limb detection
-                    query_flow_series = text("""
-                        SELECT valid_time, value
-                        FROM nwm.hydro_timeseries
-                        WHERE feature_id = :feature_id
-                          AND variable = 'streamflow'
-                        ORDER BY valid_time ASC
-                    """)
-
-                    result = conn.execute(query_flow_series, {'feature_id': feature_id})
-                    flow_rows = result.fetchall()
-                    flow_times = [row[0] for row in flow_rows]
-                    flow_values = [row[1] for row in flow_rows]
-                    flows = pd.Series(flow_values, index=pd.DatetimeIndex(flow_times))
-
-                    # Compute metrics
-
-                    # 1. Rising Limb Detection
-                    rising_detected, rising_intensity = detect_rising_limb(flows, rising_limb_config)
-
-                    # 2. BDI
-                    bdi = compute_bdi(
-                        q_btm_vert=data['qBtmVertRunoff'],
-                        q_bucket=data['qBucket'],
-                        q_sfc_lat=data['qSfcLatRunoff']
-                    )
-                    bdi_class = classify_bdi(bdi)
-
-                    # 3. Velocity Classification
-                    velocity_suitable, velocity_class, velocity_score = classify_velocity(
-                        data['velocity'],
-                        species_config
-                    )
-
-                    # Store results
-                    results.append({
-                        'feature_id': feature_id,
-                        'timestamp': latest_time,
-                        'timestamps_available': timestamp_count,
-                        # Flow metrics
-                        'streamflow_m3s': data['streamflow'],
-                        'flow_min': flows.min(),
-                        'flow_max': flows.max(),
-                        'flow_mean': flows.mean(),
-                        # Rising Limb
-                        'rising_limb_detected': rising_detected,
-                        'rising_limb_intensity': rising_intensity if rising_detected else None,
-                        # BDI
-                        'bdi': bdi,
-                        'bdi_classification': bdi_class,
-                        'q_btm_vert': data['qBtmVertRunoff'],
-                        'q_bucket': data['qBucket'],
-                        'q_sfc_lat': data['qSfcLatRunoff'],
-                        # Velocity
-                        'velocity_ms': data['velocity'],
-                        'velocity_suitable': velocity_suitable,
-                        'velocity_classification': velocity_class,
-                        'velocity_score': velocity_score
-                    })
-
-                    print("OK")
-
-                except Exception as e:
-                    print(f"ERROR ({str(e)[:50]})")
-                    continue
+            # Classify the whole reach batch at once; rising limb and BDI
+            # were already computed by the query above. Classes are kept as
+            # int8 codes (categoricals) and only rendered as labels on output.
+            print("Classifying reaches...")
+            bdi_codes = classify_bdi_codes(metrics['bdi'].to_numpy())
+            velocity_suitable, velocity_codes, velocity_score = classify_velocity_codes(
+                metrics['velocity'].to_numpy(),
+                species_config
+            )
+
+            df = pd.DataFrame({
+                'feature_id': metrics['feature_id'],
+                'timestamp': metrics['valid_time'],
+                'timestamps_available': metrics['complete_timestamps'],
+                # Flow metrics
+                'streamflow_m3s': metrics['streamflow'],
+                'flow_min': metrics['flow_min'],
+                'flow_max': metrics['flow_max'],
+                'flow_mean': metrics['flow_mean'],
+                # Rising Limb
+                'rising_limb_detected': metrics['rising_detected'].astype(bool),
+                'rising_limb_intensity': metrics['rising_intensity'],
+                # BDI
+                'bdi': metrics['bdi'],
+                'bdi_classification': pd.Categorical.from_codes(bdi_codes, BDI_LABELS),
+                'q_btm_vert': metrics['q_btm_vert'],
+                'q_bucket': metrics['q_bucket'],
+                'q_sfc_lat': metrics['q_sfc_lat'],
+                # Velocity
+                'velocity_ms': metrics['velocity'],
+                'velocity_suitable': velocity_suitable,
+                'velocity_classification': pd.Categorical.from_codes(velocity_codes, VELOCITY_LABELS),
+                'velocity_score': velocity_score
+            })
 
             print()
-            print(f"Successfully processed {len(results)} reaches")
+            print(f"Successfully processed {len(df)} reaches")
             print()
 
-            # Convert to DataFrame
-            df = pd.DataFrame(results)
-
             # Save to CSV
             df.to_csv(output_file, index=False)
             print(f"Results saved to: {output_file}")
@@ -260,6 +325,7 @@ def test_all_metrics_50_reaches():
             print(f"  BDI range: {df['bdi'].min():.3f} - {df['bdi'].max():.3f}")
             print(f"  Classifications:")
             bdi_counts = df['bdi_classification'].value_counts()
+            bdi_counts = bdi_counts[bdi_counts > 0]
             for classification, count in bdi_counts.items():
                 print(f"    {classification}: {count} ({count/len(df)*100:.1f}%)")
             print()
@@ -271,6 +337,7 @@ def test_all_metrics_50_reaches():
             print(f"  Mean suitability score: {df['velocity_score'].mean():.3f}")
             print(f"  Classifications:")
             vel_counts = df['velocity_classification'].value_counts()
+            vel_counts = vel_counts[vel_counts > 0]
             for classification, count in vel_counts.items():
                 print(f"    {classification}: {count} ({count/len(df)*100:.1f}%)")
             print()
@@ -298,10 +365,12 @@ def test_all_metrics_50_reaches():
             print("TEST COMPLETE!")
             print("=" * 80)
             print()
-            print(f"Tested {len(results)} reaches across all EPIC 2 metrics")
+            print(f"Tested {len(df)} reaches across all EPIC 2 metrics")
             print(f"Results saved to: {output_file}")
             print()
-            print("All three metrics are working correctly with real database data!")
+            print("Rising limb and BDI were computed in SQL and matched the library on "
+                  f"{min(CROSS_CHECK_REACHES, len(df))} sampled reaches;")
+            print("velocity was classified with the library's batch classifier.")
             print()
 
             return True
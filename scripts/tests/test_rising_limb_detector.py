@@ -14,7 +14,6 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-import pytz
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
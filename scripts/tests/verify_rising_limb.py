@@ -8,13 +8,13 @@ Run this to verify Ticket 2.1 is complete.
 """
 
 import sys
+from datetime import timezone
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import pandas as pd
-import pytz
 from src.metrics.rising_limb import (
     detect_rising_limb,
     RisingLimbConfig,
@@ -33,7 +33,7 @@ if sys.platform == 'win32':
 
 def create_time_index(hours=24):
     """Create UTC timezone-aware time index"""
-    return pd.date_range('2025-01-01', periods=hours, freq='H', tz=pytz.UTC)
+    return pd.date_range('2025-01-01', periods=hours, freq='H', tz=timezone.utc)
 
 
 def test_scenario(name, flows, config, expected_detected=None, expected_intensity=None):
@@ -0,0 +1,97 @@
+"""
+Bulk COPY Utilities
+
+Streams rows into PostgreSQL with COPY ... FROM STDIN instead of per-row
+INSERT statements. Used by the ingestion steps driven from
+scripts/ingestion/orchestration/reset_and_repopulate_db.py.
+
+Rows are sent as CSV through psycopg2 copy_expert, so the server parses
+each value into its column type (including PostGIS geometry passed as
+EWKT, e.g. 'SRID=4326;LINESTRING(...)').
+
+Usage:
+    from src.database.bulk_copy import copy_csv
+
+    rows = ((r['nhdplusid'], r['gnis_name'], r['lengthkm']) for r in records)
+    copy_csv(conn, 'nhd.flowlines', ['nhdplusid', 'gnis_name', 'lengthkm'], rows)
+    conn.commit()
+"""
+
+import csv
+import io
+from itertools import islice
+from typing import Any, Iterable, Sequence
+
+# Marker written for None in CSV COPY (must match the NULL option below)
+CSV_NULL = r'\N'
+
+# Rows buffered in memory per CSV COPY statement
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def write_csv_rows(rows: Iterable[Sequence[Any]], buffer: io.StringIO) -> int:
+    """
+    Write rows to a buffer in the CSV dialect expected by COPY.
+
+    None is written as the unquoted CSV_NULL marker so that it stays
+    distinguishable from empty strings.
+
+    Args:
+        rows: Iterable of row tuples
+        buffer: Text buffer to write into
+
+    Returns:
+        int: Number of rows written
+    """
+    writer = csv.writer(buffer, lineterminator='\n')
+    count = 0
+    for row in rows:
+        writer.writerow([CSV_NULL if value is None else value for value in row])
+        count += 1
+    return count
+
+
+def copy_csv(
+    conn,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Bulk load rows with text CSV COPY.
+
+    Rows are streamed in batches so unbounded generators are never held
+    in memory in full. The caller owns the transaction and must commit
+    afterwards.
+
+    Args:
+        conn: psycopg2 database connection
+        table: Target table (optionally schema-qualified)
+        columns: Target column names, in row order
+        rows: Iterable of row tuples
+        batch_size: Rows per COPY statement
+
+    Returns:
+        int: Number of rows copied
+    """
+    sql = (
+        f"COPY {table} ({', '.join(columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{CSV_NULL}')"
+    )
+    cursor = conn.cursor()
+    iterator = iter(rows)
+    total = 0
+
+    while True:
+        buffer = io.StringIO()
+        count = write_csv_rows(islice(iterator, batch_size), buffer)
+        if count == 0:
+            break
+
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+        total += count
+
+    return total
+
@@ -59,6 +59,7 @@ def clear_all_tables(conn, skip_confirmation: bool = False, verbose: bool = True
 
     Tables cleared (in dependency order):
         - temperature_timeseries (FK to nhd_reach_centroids)
+        - temperature_latest (latest reading per reach)
         - nhd_reach_centroids (FK to nhd_flowlines)
         - computed_scores (FK to reach_metadata)
         - user_observations (standalone)
@@ -74,6 +75,7 @@ def clear_all_tables(conn, skip_confirmation: bool = False, verbose: bool = True
     # Tables in dependency order (children before parents)
     table_names = [
         'temperature_timeseries',
+        'temperature_latest',
         'nhd_reach_centroids',
         'computed_scores',
         'user_observations',
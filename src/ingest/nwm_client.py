@@ -14,7 +14,7 @@ import logging
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
 from urllib.parse import urljoin
 
 import pandas as pd
@@ -102,30 +102,20 @@ class NWMClient:
 
         logger.info(f"NWM Client initialized with base_url={self.base_url}")
 
-    def download_product(
+    def _product_url(
         self,
         product: NWMProduct,
         reference_time: datetime,
-        forecast_hour: Optional[int] = None,
-        domain: Domain = "conus",
-        force_download: bool = False
-    ) -> Path:
+        forecast_hour: Optional[int] = None
+    ) -> tuple[str, int]:
         """
-        Download a specific NWM product.
-
-        Args:
-            product: NWM product name
-            reference_time: Model cycle reference time (UTC)
-            forecast_hour: Forecast hour (for forecast products)
-            domain: Geographic domain
-            force_download: Re-download even if cached
+        Validate product parameters and build the product URL.
 
         Returns:
-            Path to downloaded NetCDF file
+            Tuple of (url, forecast_hour), with forecast_hour defaulted
 
         Raises:
             ValueError: Invalid product or parameters
-            requests.HTTPError: Download failed
         """
         # Validate product
         if product not in self.PRODUCT_PATHS:
@@ -165,6 +155,73 @@ class NWMClient:
 
         url = urljoin(self.base_url, product_path)
 
+        return url, forecast_hour
+
+    def url_exists(
+        self,
+        product: NWMProduct,
+        reference_time: datetime,
+        forecast_hour: Optional[int] = None
+    ) -> bool:
+        """
+        Check whether a product is published, without downloading it.
+
+        Sends a HEAD request, so probing several cycles costs a round trip
+        each instead of a full download attempt.
+
+        Args:
+            product: NWM product name
+            reference_time: Model cycle reference time (UTC)
+            forecast_hour: Forecast hour (for forecast products)
+
+        Returns:
+            True if the server reports the file as available
+
+        Raises:
+            ValueError: Invalid product or parameters
+        """
+        url, _ = self._product_url(product, reference_time, forecast_hour)
+
+        try:
+            response = requests.head(url, timeout=5, allow_redirects=True)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"HEAD {url} failed: {e!r}")
+            return False
+
+        if not response.ok:
+            logger.debug(f"HEAD {url} returned {response.status_code}")
+
+        return response.ok
+
+    def download_product(
+        self,
+        product: NWMProduct,
+        reference_time: datetime,
+        forecast_hour: Optional[int] = None,
+        domain: Domain = "conus",
+        force_download: bool = False
+    ) -> Path:
+        """
+        Download a specific NWM product.
+
+        Args:
+            product: NWM product name
+            reference_time: Model cycle reference time (UTC)
+            forecast_hour: Forecast hour (for forecast products)
+            domain: Geographic domain
+            force_download: Re-download even if cached
+
+        Returns:
+            Path to downloaded NetCDF file
+
+        Raises:
+            ValueError: Invalid product or parameters
+            requests.HTTPError: Download failed
+        """
+        url, forecast_hour = self._product_url(product, reference_time, forecast_hour)
+        date_str = reference_time.strftime("%Y%m%d")
+        hour = reference_time.hour
+
         # Determine cache file path
         cache_filename = f"{product}_{date_str}_t{hour:02d}z_f{forecast_hour:03d}_{domain}.nc"
         cache_path = self.cache_dir / cache_filename
@@ -201,6 +258,62 @@ class NWMClient:
             logger.error(f"Unexpected error downloading {url}: {e}")
             raise
 
+    # Optional channel_rt variables -> DataFrame column names
+    OPTIONAL_VARIABLES = {
+        'qSfcLatRunoff': 'qSfcLatRunoff_m3s',
+        'qBucket': 'qBucket_m3s',
+        'qBtmVertRunoff': 'qBtmVertRunoff_m3s',
+        # Only in analysis_assim
+        'nudge': 'nudge_m3s',
+    }
+
+    # Reaches per DataFrame yielded by iter_channel_rt
+    DEFAULT_CHUNK_SIZE = 100_000
+
+    @staticmethod
+    def _reference_time(ds: xr.Dataset) -> Optional[pd.Timestamp]:
+        """Return the file's reference time (scalar variable), if present."""
+        if 'reference_time' not in ds:
+            return None
+
+        # Convert numpy scalar to Python datetime
+        ref_time_np = ds['reference_time'].values
+        if hasattr(ref_time_np, 'item'):
+            return pd.to_datetime(ref_time_np.item())
+        return pd.to_datetime(ref_time_np)
+
+    @classmethod
+    def _channel_rt_frame(
+        cls,
+        ds: xr.Dataset,
+        reference_time: Optional[pd.Timestamp],
+        feature_ids: Optional[list[int]] = None
+    ) -> pd.DataFrame:
+        """Build the hydrology DataFrame for the reaches in ds."""
+        # Extract core variables (always present)
+        data = {
+            'feature_id': ds['feature_id'].values,
+            'streamflow_m3s': ds['streamflow'].values,
+            'velocity_ms': ds['velocity'].values,
+        }
+
+        # Add optional flow component variables and nudge (if available)
+        for variable, column in cls.OPTIONAL_VARIABLES.items():
+            if variable in ds:
+                data[column] = ds[variable].values
+
+        df = pd.DataFrame(data)
+
+        # Scalar value, broadcast to all rows automatically
+        if reference_time is not None:
+            df['reference_time'] = reference_time
+
+        # Filter by feature IDs if specified
+        if feature_ids is not None:
+            df = df[df['feature_id'].isin(feature_ids)]
+
+        return df
+
     def parse_channel_rt(
         self,
         filepath: Path,
@@ -215,6 +328,8 @@ class NWMClient:
         - Component flows (qSfcLatRunoff, qBucket, qBtmVertRunoff)
         - nudge (for gauge-corrected products)
 
+        Loads every reach at once; use iter_channel_rt to bound memory.
+
         Args:
             filepath: Path to NetCDF file
             feature_ids: Optional list of feature IDs to filter (for testing)
@@ -227,42 +342,7 @@ class NWMClient:
         try:
             ds = xr.open_dataset(filepath)
 
-            # Extract core variables (always present)
-            data = {
-                'feature_id': ds['feature_id'].values,
-                'streamflow_m3s': ds['streamflow'].values,
-                'velocity_ms': ds['velocity'].values,
-            }
-
-            # Add optional flow component variables (if available)
-            if 'qSfcLatRunoff' in ds:
-                data['qSfcLatRunoff_m3s'] = ds['qSfcLatRunoff'].values
-            if 'qBucket' in ds:
-                data['qBucket_m3s'] = ds['qBucket'].values
-            if 'qBtmVertRunoff' in ds:
-                data['qBtmVertRunoff_m3s'] = ds['qBtmVertRunoff'].values
-
-            # Add nudge if available (only in analysis_assim)
-            if 'nudge' in ds:
-                data['nudge_m3s'] = ds['nudge'].values
-
-            # Create DataFrame
-            df = pd.DataFrame(data)
-
-            # Extract reference time if available (scalar value, broadcast to all rows)
-            if 'reference_time' in ds:
-                # Convert numpy scalar to Python datetime
-                ref_time_np = ds['reference_time'].values
-                if hasattr(ref_time_np, 'item'):
-                    ref_time_scalar = pd.to_datetime(ref_time_np.item())
-                else:
-                    ref_time_scalar = pd.to_datetime(ref_time_np)
-                # This will broadcast the scalar to all rows automatically
-                df['reference_time'] = ref_time_scalar
-
-            # Filter by feature IDs if specified
-            if feature_ids is not None:
-                df = df[df['feature_id'].isin(feature_ids)]
+            df = self._channel_rt_frame(ds, self._reference_time(ds), feature_ids)
 
             logger.info(f"Parsed {len(df):,} reaches with {len(df.columns)} variables")
 
@@ -274,6 +354,41 @@ class NWMClient:
             logger.error(f"Error parsing NetCDF {filepath}: {e}")
             raise
 
+    def iter_channel_rt(
+        self,
+        filepath: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        feature_ids: Optional[list[int]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse NWM channel routing NetCDF file in chunks of reaches.
+
+        Same columns as parse_channel_rt, but only chunk_size reaches are
+        read from the (lazily opened) file and held in memory at a time.
+
+        Args:
+            filepath: Path to NetCDF file
+            chunk_size: Reaches per yielded DataFrame
+            feature_ids: Optional list of feature IDs to filter (for testing)
+
+        Yields:
+            DataFrame with hydrology variables for the next chunk of reaches
+        """
+        logger.info(f"Parsing NetCDF in chunks of {chunk_size:,} reaches: {filepath}")
+
+        try:
+            with xr.open_dataset(filepath) as ds:
+                reference_time = self._reference_time(ds)
+                total = ds.sizes['feature_id']
+
+                for start in range(0, total, chunk_size):
+                    chunk = ds.isel(feature_id=slice(start, start + chunk_size))
+                    yield self._channel_rt_frame(chunk, reference_time, feature_ids)
+
+        except Exception as e:
+            logger.error(f"Error parsing NetCDF {filepath}: {e}")
+            raise
+
     def download_latest_analysis(
         self,
         domain: Domain = "conus"
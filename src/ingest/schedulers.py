@@ -12,18 +12,13 @@ Design Principles:
 
 import logging
 import os
-import sys
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from ingest.nwm_client import NWMClient, NWMProduct, Domain
 from ingest.validators import validate_all
 from normalize.schemas import HydroRecord, NWMSource
@@ -247,28 +242,25 @@ class IngestionScheduler:
         Returns:
             Number of records inserted
         """
-        # Normalize the data using TimeNormalizer
+        # Normalize the data using TimeNormalizer (straight to long format)
         logger.info("Normalizing data to canonical time abstraction")
-        records = TimeNormalizer.normalize_product(
+        records_df = TimeNormalizer.normalize_product_df(
             df=df,
             product=product,
             reference_time=reference_time,
             forecast_hour=forecast_hour
         )
 
-        if len(records) == 0:
+        if records_df.empty:
             logger.warning("No records to insert")
             return 0
 
-        # Convert records to DataFrame for bulk insertion
-        records_df = TimeNormalizer.records_to_dataframe(records)
-
         # Use PostgreSQL COPY for fast bulk insert
-        logger.info(f"Inserting {len(records):,} records using PostgreSQL COPY")
+        logger.info(f"Inserting {len(records_df):,} records using PostgreSQL COPY")
         self._bulk_insert_with_copy(records_df)
 
-        logger.info(f"Inserted {len(records):,} variable records")
-        return len(records)
+        logger.info(f"Inserted {len(records_df):,} variable records")
+        return len(records_df)
 
     def _bulk_insert_with_copy(self, df: pd.DataFrame):
         """
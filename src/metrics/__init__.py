@@ -13,8 +13,10 @@ Available metrics:
 
 from .rising_limb import (
     detect_rising_limb,
+    detect_rising_limb_values,
     detect_rising_limb_for_reach,
     RisingLimbConfig,
+    RisingLimbState,
     load_default_config,
     explain_detection
 )
@@ -22,6 +24,9 @@ from .rising_limb import (
 from .baseflow import (
     compute_bdi,
     classify_bdi,
+    classify_bdi_batch,
+    classify_bdi_codes,
+    BDI_LABELS,
     compute_bdi_with_classification,
     explain_bdi as explain_bdi_result,
     compute_bdi_for_reach,
@@ -32,6 +37,9 @@ from .baseflow import (
 from .velocity import (
     SpeciesVelocityConfig,
     classify_velocity,
+    classify_velocity_batch,
+    classify_velocity_codes,
+    VELOCITY_LABELS,
     explain_velocity_suitability,
     classify_velocity_for_reach,
     classify_velocity_timeseries_for_reach,
@@ -58,13 +66,18 @@ from .thermal_suitability import (
 __all__ = [
     # Rising Limb Detection
     'detect_rising_limb',
+    'detect_rising_limb_values',
     'detect_rising_limb_for_reach',
     'RisingLimbConfig',
+    'RisingLimbState',
     'load_default_config',
     'explain_detection',
     # Baseflow Dominance Index
     'compute_bdi',
     'classify_bdi',
+    'classify_bdi_batch',
+    'classify_bdi_codes',
+    'BDI_LABELS',
     'compute_bdi_with_classification',
     'explain_bdi_result',
     'compute_bdi_for_reach',
@@ -73,6 +86,9 @@ __all__ = [
     # Velocity Suitability
     'SpeciesVelocityConfig',
     'classify_velocity',
+    'classify_velocity_batch',
+    'classify_velocity_codes',
+    'VELOCITY_LABELS',
     'explain_velocity_suitability',
     'classify_velocity_for_reach',
     'classify_velocity_timeseries_for_reach',
@@ -20,12 +20,35 @@ from typing import Literal, Optional, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from sqlalchemy import text
 
 
 # Type aliases
 BDIClass = Literal["groundwater_fed", "mixed", "storm_dominated"]
 BDIResult = Tuple[float, BDIClass]
 
+# Batch classification: codes index into BDI_LABELS, split at BDI_THRESHOLDS
+BDI_THRESHOLDS = np.array([0.35, 0.65])
+BDI_LABELS = np.array(["storm_dominated", "mixed", "groundwater_fed"], dtype=object)
+
+# Per-reach queries, built once at import and reused on every call
+REACH_COMPONENTS_SQL = text("""
+    SELECT variable, value
+    FROM nwm.hydro_timeseries
+    WHERE feature_id = :feature_id
+      AND valid_time = :valid_time
+      AND variable IN ('qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
+""")
+
+REACH_COMPONENTS_SERIES_SQL = text("""
+    SELECT valid_time, variable, value
+    FROM nwm.hydro_timeseries
+    WHERE feature_id = :feature_id
+      AND valid_time BETWEEN :start_time AND :end_time
+      AND variable IN ('qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
+    ORDER BY valid_time ASC
+""")
+
 
 def compute_bdi(
     q_btm_vert: float,
@@ -120,6 +143,39 @@ def classify_bdi(bdi: float) -> BDIClass:
         return "storm_dominated"
 
 
+def classify_bdi_codes(bdi: np.ndarray) -> np.ndarray:
+    """
+    Classify an array of BDI values into int8 class codes.
+
+    Same thresholds as classify_bdi(), evaluated over a whole reach batch
+    with one searchsorted. Codes index into BDI_LABELS; NaN maps to
+    "storm_dominated", as it does in the scalar version.
+
+    Args:
+        bdi: Array of BDI values (0.0 to 1.0)
+
+    Returns:
+        int8 array of codes into BDI_LABELS, same shape as bdi
+    """
+    bdi = np.asarray(bdi, dtype=float)
+    codes = np.searchsorted(BDI_THRESHOLDS, bdi, side='right').astype(np.int8)
+    codes[np.isnan(bdi)] = 0
+    return codes
+
+
+def classify_bdi_batch(bdi: np.ndarray) -> np.ndarray:
+    """
+    Classify an array of BDI values in one vectorized pass.
+
+    Args:
+        bdi: Array of BDI values (0.0 to 1.0)
+
+    Returns:
+        Object array of classification labels, same shape as bdi
+    """
+    return BDI_LABELS[classify_bdi_codes(bdi)]
+
+
 def compute_bdi_with_classification(
     q_btm_vert: float,
     q_bucket: float,
@@ -249,17 +305,19 @@ def compute_bdi_statistics(bdi_series: pd.Series) -> dict:
             'stability': None
         }
 
+    # Each reduction walks the series once; std feeds both 'std' and the CV
     mean_bdi = bdi_series.mean()
+    std_bdi = bdi_series.std()
     dominant_class = classify_bdi(mean_bdi)
 
     # Coefficient of variation (measure of stability)
     # Lower CV = more stable BDI over time
-    cv = bdi_series.std() / mean_bdi if mean_bdi > 0 else None
+    cv = std_bdi / mean_bdi if mean_bdi > 0 else None
 
     return {
         'mean': mean_bdi,
         'median': bdi_series.median(),
-        'std': bdi_series.std(),
+        'std': std_bdi,
         'min': bdi_series.min(),
         'max': bdi_series.max(),
         'dominant_class': dominant_class,
@@ -294,19 +352,9 @@ def compute_bdi_for_reach(
         ...         db_connection=conn
         ...     )
     """
-    from sqlalchemy import text
-
     # Query flow components for the reach at the specified time
-    query = text("""
-        SELECT variable, value
-        FROM nwm.hydro_timeseries
-        WHERE feature_id = :feature_id
-          AND valid_time = :valid_time
-          AND variable IN ('qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
-    """)
-
     result = db_connection.execute(
-        query,
+        REACH_COMPONENTS_SQL,
         {
             'feature_id': feature_id,
             'valid_time': valid_time
@@ -355,20 +403,9 @@ def compute_bdi_timeseries_for_reach(
         - classification: BDI classification
         - q_btm_vert, q_bucket, q_sfc_lat: Flow components
     """
-    from sqlalchemy import text
-
     # Query flow components
-    query = text("""
-        SELECT valid_time, variable, value
-        FROM nwm.hydro_timeseries
-        WHERE feature_id = :feature_id
-          AND valid_time BETWEEN :start_time AND :end_time
-          AND variable IN ('qBtmVertRunoff', 'qBucket', 'qSfcLatRunoff')
-        ORDER BY valid_time ASC
-    """)
-
     result = db_connection.execute(
-        query,
+        REACH_COMPONENTS_SERIES_SQL,
         {
             'feature_id': feature_id,
             'start_time': start_time,
@@ -15,8 +15,10 @@ Design Principles:
 - Handles missing data gracefully
 """
 
+from functools import lru_cache
 from typing import Literal, Optional, Tuple
 import yaml
+from sqlalchemy import text
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -26,6 +28,20 @@ import numpy as np
 IntensityLevel = Optional[Literal["weak", "moderate", "strong"]]
 RisingLimbResult = Tuple[bool, IntensityLevel]
 
+# Per-reach queries, built once at import and reused on every call.
+# Streamflow times come back as epoch seconds and missing values as NaN,
+# so rows map straight onto float arrays.
+REACH_STREAMFLOW_SQL = text("""
+    SELECT
+        CAST(EXTRACT(EPOCH FROM valid_time) AS DOUBLE PRECISION) AS epoch,
+        COALESCE(value, 'NaN') AS value
+    FROM nwm.hydro_timeseries
+    WHERE feature_id = :feature_id
+      AND variable = 'streamflow'
+      AND valid_time BETWEEN :start_time AND :end_time
+    ORDER BY valid_time ASC
+""")
+
 
 class RisingLimbConfig:
     """
@@ -120,44 +136,144 @@ def detect_rising_limb(
     if not isinstance(flows.index, pd.DatetimeIndex):
         raise ValueError("flows must have a DatetimeIndex")
 
-    # Sort by time to ensure proper derivative calculation
-    flows = flows.sort_index()
+    return detect_rising_limb_values(
+        flows.to_numpy(dtype=np.float64),
+        # asi8 is in the index's own unit; the detector expects nanoseconds
+        flows.index.as_unit('ns').asi8,
+        config
+    )
 
-    # Compute time differences in hours
-    time_diff_hours = flows.index.to_series().diff().dt.total_seconds() / 3600
 
-    # Compute dQ/dt (flow change per hour)
-    flow_diff = flows.diff()
-    dQdt = flow_diff / time_diff_hours
+class RisingLimbState:
+    """
+    Incremental rising limb detection over time-ordered chunks.
+
+    Carries the last sample, the current run of rising steps and the
+    largest rising slope between update() calls, so a long series can be
+    processed chunk by chunk (e.g. as rows stream from the database)
+    without holding it in memory. Gives the same result as
+    detect_rising_limb_values on the concatenated, time-sorted series.
+
+    Example:
+        >>> state = RisingLimbState(config)
+        >>> for values, times in chunks:
+        ...     state.update(values, times)
+        >>> detected, intensity = state.result()
+    """
 
-    # Identify rising periods (where dQ/dt exceeds minimum slope)
-    is_rising = dQdt > config.min_slope
+    def __init__(self, config: RisingLimbConfig):
+        self.config = config
+        self.count = 0              # Samples seen
+        self.has_values = False     # Any non-NaN sample seen
+        self.last_time = None       # Epoch ns of the last sample
+        self.last_value = np.nan
+        self.run = 0                # Consecutive rising steps ending at the last sample
+        self.detected = False
+        self.max_slope = -np.inf    # Largest dQ/dt among rising steps
+
+    def update(self, values: np.ndarray, times: np.ndarray) -> None:
+        """
+        Feed the next chunk of samples.
 
-    # Check for consecutive rising periods
-    # Use rolling window to count consecutive True values
-    consecutive_rising = is_rising.rolling(window=config.min_duration, min_periods=config.min_duration).sum()
+        Args:
+            values: Streamflow values (m³/s); None/NaN treated as missing
+            times: Valid times as datetime64 or int64 nanoseconds since
+                   epoch, ascending and later than the previous chunk
+        """
+        values = np.asarray(values, dtype=np.float64)
+        times_ns = np.asarray(times).astype('datetime64[ns]').astype(np.int64)
 
-    # Detected if any window has all hours rising
-    detected = (consecutive_rising >= config.min_duration).any()
+        if len(values) == 0:
+            return
 
-    if not detected:
-        return False, None
+        self.count += len(values)
+        self.has_values = self.has_values or not np.isnan(values).all()
 
-    # Classify intensity based on maximum slope during rising periods
-    max_slope = dQdt[is_rising].max()
+        # Prepend the previous chunk's last sample so the first step is counted
+        if self.last_time is not None:
+            values = np.concatenate(([self.last_value], values))
+            times_ns = np.concatenate(([self.last_time], times_ns))
 
-    if pd.isna(max_slope):
-        return False, None
+        self.last_time = times_ns[-1]
+        self.last_value = values[-1]
 
-    # Apply intensity thresholds
-    if max_slope >= config.intensity_thresholds['strong']:
-        intensity = "strong"
-    elif max_slope >= config.intensity_thresholds['moderate']:
-        intensity = "moderate"
-    else:
-        intensity = "weak"
+        # Compute dQ/dt (flow change per hour)
+        time_diff_hours = np.diff(times_ns) / 3.6e12
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dQdt = np.diff(values) / time_diff_hours
 
-    return True, intensity
+        # Identify rising periods (where dQ/dt exceeds minimum slope)
+        is_rising = dQdt > self.config.min_slope
+        if len(is_rising) == 0:
+            return
+
+        # Length of the rising run ending at each step: cumulative rising
+        # count (continuing the carried run) minus its value at the last
+        # non-rising step
+        rising_count = self.run + np.cumsum(is_rising)
+        run = rising_count - np.maximum.accumulate(np.where(is_rising, 0, rising_count))
+
+        self.detected = self.detected or bool((run >= self.config.min_duration).any())
+        self.run = int(run[-1])
+
+        if is_rising.any():
+            self.max_slope = max(self.max_slope, dQdt[is_rising].max())
+
+    def result(self) -> RisingLimbResult:
+        """
+        Detection result for all samples fed so far.
+
+        Returns:
+            Tuple of (detected: bool, intensity: "weak"|"moderate"|"strong"|None)
+        """
+        # Handle edge cases
+        if self.count < self.config.min_duration or not self.has_values:
+            return False, None
+
+        if not self.detected or np.isnan(self.max_slope):
+            return False, None
+
+        # Apply intensity thresholds to the maximum slope during rising periods
+        if self.max_slope >= self.config.intensity_thresholds['strong']:
+            intensity = "strong"
+        elif self.max_slope >= self.config.intensity_thresholds['moderate']:
+            intensity = "moderate"
+        else:
+            intensity = "weak"
+
+        return True, intensity
+
+
+def detect_rising_limb_values(
+    values: np.ndarray,
+    times: np.ndarray,
+    config: RisingLimbConfig
+) -> RisingLimbResult:
+    """
+    Detect sustained rising limb from plain flow and time arrays.
+
+    Same algorithm as detect_rising_limb, without building a pandas
+    Series/DatetimeIndex, for callers that already hold raw arrays
+    (e.g. rows fetched from the database).
+
+    Args:
+        values: Streamflow values (m³/s); None/NaN treated as missing
+        times: Valid times as datetime64 or int64 nanoseconds since epoch,
+               same length as values (any order)
+        config: RisingLimbConfig with detection thresholds
+
+    Returns:
+        Tuple of (detected: bool, intensity: "weak"|"moderate"|"strong"|None)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    times_ns = np.asarray(times).astype('datetime64[ns]').astype(np.int64)
+
+    # Sort by time to ensure proper derivative calculation
+    order = np.argsort(times_ns, kind='stable')
+
+    state = RisingLimbState(config)
+    state.update(values[order], times_ns[order])
+    return state.result()
 
 
 def detect_rising_limb_for_reach(
@@ -180,46 +296,38 @@ def detect_rising_limb_for_reach(
     Returns:
         Tuple of (detected: bool, intensity: "weak"|"moderate"|"strong"|None)
     """
-    from sqlalchemy import text
-
-    # Query streamflow data for the reach
-    query = text("""
-        SELECT valid_time, value
-        FROM nwm.hydro_timeseries
-        WHERE feature_id = :feature_id
-          AND variable = 'streamflow'
-          AND valid_time BETWEEN :start_time AND :end_time
-        ORDER BY valid_time ASC
-    """)
-
+    # Query streamflow data for the reach, streamed in batches and consumed
+    # in one pass: no full fetchall() list of Row objects alongside
+    # per-column Python lists. yield_per is set on this statement only;
+    # Connection.execution_options() would change the caller's connection
     result = db_connection.execute(
-        query,
+        REACH_STREAMFLOW_SQL,
         {
             'feature_id': feature_id,
             'start_time': start_time,
             'end_time': end_time
-        }
+        },
+        execution_options={'yield_per': 4096}
     )
 
-    # Convert to pandas Series
-    rows = result.fetchall()
+    # Rows arrive in valid_time order; each fetched batch is fed to the
+    # detector and dropped, so the full series is never materialized
+    state = RisingLimbState(config)
+    for rows in result.partitions():
+        batch = np.array(rows, dtype=np.float64)
+        state.update(values=batch[:, 1], times=(batch[:, 0] * 1e9).astype(np.int64))
 
-    if not rows:
-        return False, None
-
-    times = [row[0] for row in rows]
-    values = [row[1] for row in rows]
-
-    flows = pd.Series(values, index=pd.DatetimeIndex(times))
-
-    # Detect rising limb
-    return detect_rising_limb(flows, config)
+    return state.result()
 
 
+@lru_cache(maxsize=None)
 def load_default_config() -> RisingLimbConfig:
     """
     Load default rising limb configuration.
 
+    The YAML file is read once per process; later calls return the same
+    (shared, not to be modified) instance.
+
     Returns:
         RisingLimbConfig with default thresholds
     """
@@ -278,13 +386,13 @@ def explain_detection(
 # Example usage
 if __name__ == "__main__":
     # Example: Synthetic hydrograph with rising limb
-    import pytz
+    from datetime import timezone
 
     print("Rising Limb Detector - Example Usage")
     print("=" * 60)
 
     # Create synthetic data
-    times = pd.date_range('2025-01-01', periods=24, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-01-01', periods=24, freq='H', tz=timezone.utc)
 
     # Scenario 1: Moderate rising limb
     flows_moderate = pd.Series(
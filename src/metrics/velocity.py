@@ -17,18 +17,43 @@ Design Principles:
 - Gradient scoring for sub-optimal velocities
 """
 
+from functools import lru_cache
 from typing import Literal, Optional, Tuple
 from enum import Enum
 from pathlib import Path
 import yaml
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from sqlalchemy import text
 
 
 # Type aliases
 VelocityClass = Literal["too_slow", "optimal", "fast", "too_fast"]
 VelocityResult = Tuple[bool, VelocityClass, float]
 
+# Batch classification: codes index into VELOCITY_LABELS
+VELOCITY_LABELS = np.array(["too_slow", "optimal", "fast", "too_fast"], dtype=object)
+VELOCITY_TOO_SLOW, VELOCITY_OPTIMAL, VELOCITY_FAST, VELOCITY_TOO_FAST = range(4)
+
+# Per-reach queries, built once at import and reused on every call
+REACH_VELOCITY_SQL = text("""
+    SELECT value
+    FROM nwm.hydro_timeseries
+    WHERE feature_id = :feature_id
+      AND valid_time = :valid_time
+      AND variable = 'velocity'
+""")
+
+REACH_VELOCITY_SERIES_SQL = text("""
+    SELECT valid_time, value
+    FROM nwm.hydro_timeseries
+    WHERE feature_id = :feature_id
+      AND valid_time BETWEEN :start_time AND :end_time
+      AND variable = 'velocity'
+    ORDER BY valid_time ASC
+""")
+
 
 class SpeciesVelocityConfig:
     """
@@ -181,6 +206,69 @@ def classify_velocity(
     return True, "optimal", 1.0
 
 
+def classify_velocity_codes(
+    velocity_ms: np.ndarray,
+    config: SpeciesVelocityConfig
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Classify an array of stream velocities into int8 class codes.
+
+    Mirrors classify_velocity() branch for branch, but evaluates the whole
+    reach batch with array comparisons instead of one Python call per reach.
+    Codes index into VELOCITY_LABELS.
+
+    Args:
+        velocity_ms: Array of stream velocities (m/s)
+        config: Species velocity configuration
+
+    Returns:
+        Tuple of (suitable, codes, score) arrays, same shape as velocity_ms
+    """
+    v = np.maximum(np.asarray(velocity_ms, dtype=float), 0.0)
+
+    too_slow = v < config.min_tolerable
+    too_fast = v > config.max_tolerable
+    optimal = (v >= config.min_optimal) & (v <= config.max_optimal)
+    slow = v < config.min_optimal
+    fast = v > config.max_optimal
+
+    # Gradient branches are computed for every element and masked by
+    # np.select; a zero-width range is never selected, so ignore its warning
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slow_score = (v - config.min_tolerable) / (config.min_optimal - config.min_tolerable)
+        fast_score = (config.max_tolerable - v) / (config.max_tolerable - config.max_optimal)
+
+    conditions = [too_slow, too_fast, optimal, slow, fast]
+    suitable = np.select(conditions, [False, False, True, True, True], default=True)
+    codes = np.select(
+        conditions,
+        [VELOCITY_TOO_SLOW, VELOCITY_TOO_FAST, VELOCITY_OPTIMAL, VELOCITY_TOO_SLOW, VELOCITY_FAST],
+        default=VELOCITY_OPTIMAL
+    ).astype(np.int8)
+    score = np.select(conditions, [0.0, 0.0, 1.0, slow_score, fast_score], default=1.0)
+
+    return suitable.astype(bool), codes, score
+
+
+def classify_velocity_batch(
+    velocity_ms: np.ndarray,
+    config: SpeciesVelocityConfig
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Classify an array of stream velocities in one vectorized pass.
+
+    Args:
+        velocity_ms: Array of stream velocities (m/s)
+        config: Species velocity configuration
+
+    Returns:
+        Tuple of (suitable, classification, score) arrays, same shape as
+        velocity_ms
+    """
+    suitable, codes, score = classify_velocity_codes(velocity_ms, config)
+    return suitable, VELOCITY_LABELS[codes], score
+
+
 def explain_velocity_suitability(
     velocity_ms: float,
     suitable: bool,
@@ -242,19 +330,9 @@ def classify_velocity_for_reach(
     Returns:
         Tuple of (suitable, classification, score) or None if data not available
     """
-    from sqlalchemy import text
-
     # Query velocity for the reach at the specified time
-    query = text("""
-        SELECT value
-        FROM nwm.hydro_timeseries
-        WHERE feature_id = :feature_id
-          AND valid_time = :valid_time
-          AND variable = 'velocity'
-    """)
-
     result = db_connection.execute(
-        query,
+        REACH_VELOCITY_SQL,
         {
             'feature_id': feature_id,
             'valid_time': valid_time
@@ -299,20 +377,9 @@ def classify_velocity_timeseries_for_reach(
         - classification: Velocity class
         - score: Suitability score (0-1)
     """
-    from sqlalchemy import text
-
     # Query velocity data
-    query = text("""
-        SELECT valid_time, value
-        FROM nwm.hydro_timeseries
-        WHERE feature_id = :feature_id
-          AND valid_time BETWEEN :start_time AND :end_time
-          AND variable = 'velocity'
-        ORDER BY valid_time ASC
-    """)
-
     result = db_connection.execute(
-        query,
+        REACH_VELOCITY_SERIES_SQL,
         {
             'feature_id': feature_id,
             'start_time': start_time,
@@ -372,10 +439,14 @@ def compute_velocity_statistics(df: pd.DataFrame) -> dict:
     }
 
 
+@lru_cache(maxsize=None)
 def load_species_config(species: str = "trout") -> SpeciesVelocityConfig:
     """
     Load species velocity configuration from YAML file.
 
+    Each species file is read once per process; later calls return the
+    same (shared, not to be modified) instance.
+
     Args:
         species: Species name (default: "trout")
 
@@ -14,6 +14,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
@@ -41,6 +42,19 @@ class TimeNormalizer:
         "analysis_assim_no_da": NWMSource.NO_DA,
     }
 
+    # Map parsed DataFrame columns to HydroVariable enum
+    VARIABLE_COLUMNS = {
+        'streamflow_m3s': HydroVariable.STREAMFLOW,
+        'velocity_ms': HydroVariable.VELOCITY,
+        'qSfcLatRunoff_m3s': HydroVariable.QSFC_LAT_RUNOFF,
+        'qBucket_m3s': HydroVariable.QBUCKET,
+        'qBtmVertRunoff_m3s': HydroVariable.QBTM_VERT_RUNOFF,
+        'nudge_m3s': HydroVariable.NUDGE,
+    }
+
+    # Column order of normalized long-format DataFrames
+    RECORD_COLUMNS = ['feature_id', 'valid_time', 'variable', 'value', 'source', 'forecast_hour']
+
     @staticmethod
     def normalize_analysis_assim(
         df: pd.DataFrame,
@@ -216,22 +230,12 @@ class TimeNormalizer:
         """
         records = []
 
-        # Define variable mappings (DataFrame column -> HydroVariable enum)
-        variable_mapping = {
-            'streamflow_m3s': HydroVariable.STREAMFLOW,
-            'velocity_ms': HydroVariable.VELOCITY,
-            'qSfcLatRunoff_m3s': HydroVariable.QSFC_LAT_RUNOFF,
-            'qBucket_m3s': HydroVariable.QBUCKET,
-            'qBtmVertRunoff_m3s': HydroVariable.QBTM_VERT_RUNOFF,
-            'nudge_m3s': HydroVariable.NUDGE,
-        }
-
         # Iterate through each reach
         for _, row in df.iterrows():
             feature_id = int(row['feature_id'])
 
             # Create record for each variable
-            for df_col, hydro_var in variable_mapping.items():
+            for df_col, hydro_var in TimeNormalizer.VARIABLE_COLUMNS.items():
                 if df_col in row and pd.notna(row[df_col]):
                     try:
                         record = HydroRecord(
@@ -302,6 +306,124 @@ class TimeNormalizer:
         else:
             raise ValueError(f"Unhandled product: {product}")
 
+    @staticmethod
+    def _dataframe_to_long(
+        df: pd.DataFrame,
+        valid_time: datetime,
+        source: NWMSource,
+        forecast_hour: Optional[int]
+    ) -> pd.DataFrame:
+        """
+        Convert wide DataFrame straight to long format.
+
+        Vectorized equivalent of _dataframe_to_records followed by
+        records_to_dataframe: one melt, with valid_time, source and
+        forecast_hour broadcast as scalar columns.
+
+        Args:
+            df: DataFrame with columns like streamflow_m3s, velocity_ms, etc.
+            valid_time: Valid time for these records
+            source: NWM product source
+            forecast_hour: Forecast hour (None for analysis)
+
+        Returns:
+            DataFrame with RECORD_COLUMNS (rows with missing values dropped)
+        """
+        value_columns = [col for col in TimeNormalizer.VARIABLE_COLUMNS if col in df.columns]
+
+        long_df = df.melt(
+            id_vars='feature_id',
+            value_vars=value_columns,
+            var_name='variable',
+            value_name='value'
+        ).dropna(subset=['value'])
+
+        long_df['feature_id'] = long_df['feature_id'].astype('int64')
+        long_df['variable'] = long_df['variable'].map(
+            {col: var.value for col, var in TimeNormalizer.VARIABLE_COLUMNS.items()}
+        )
+        long_df['value'] = long_df['value'].astype('float64')
+        # One UTC timestamp broadcast to a datetime64[ns, UTC] column,
+        # rather than a tz-aware datetime per row
+        long_df['valid_time'] = pd.Timestamp(valid_time).tz_convert('UTC').as_unit('ns')
+        long_df['source'] = source.value
+        long_df['forecast_hour'] = forecast_hour
+
+        return long_df[TimeNormalizer.RECORD_COLUMNS].reset_index(drop=True)
+
+    @staticmethod
+    def normalize_product_df(
+        df: pd.DataFrame,
+        product: str,
+        reference_time: datetime,
+        forecast_hour: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Normalize any NWM product straight to a long-format DataFrame.
+
+        Same result as normalize_product followed by records_to_dataframe
+        (up to row order), without building a HydroRecord per value.
+
+        Args:
+            df: Parsed NWM data
+            product: Product name ('analysis_assim', 'short_range', etc.)
+            reference_time: Model cycle time
+            forecast_hour: Forecast hour (required for forecast products)
+
+        Returns:
+            DataFrame with RECORD_COLUMNS, ready for database insertion
+
+        Raises:
+            ValueError: If product is invalid or forecast_hour is missing
+        """
+        if product not in TimeNormalizer.PRODUCT_TO_SOURCE:
+            raise ValueError(
+                f"Invalid product '{product}'. "
+                f"Must be one of: {list(TimeNormalizer.PRODUCT_TO_SOURCE.keys())}"
+            )
+
+        # Ensure reference_time is UTC timezone-aware
+        if reference_time.tzinfo is None:
+            reference_time = reference_time.replace(tzinfo=timezone.utc)
+
+        if product in ("analysis_assim", "analysis_assim_no_da"):
+            # Analysis (tm00): valid_time = reference_time, no forecast
+            forecast_hour = None
+            valid_time = reference_time
+        else:
+            if forecast_hour is None:
+                raise ValueError(f"forecast_hour required for {product} product")
+            valid_time = reference_time + timedelta(hours=forecast_hour)
+
+        long_df = TimeNormalizer._dataframe_to_long(
+            df=df,
+            valid_time=valid_time,
+            source=TimeNormalizer.PRODUCT_TO_SOURCE[product],
+            forecast_hour=forecast_hour
+        )
+
+        logger.info(f"Normalized {len(long_df)} records for {product}")
+        return long_df
+
+    @staticmethod
+    def normalize_analysis_assim_df(
+        df: pd.DataFrame,
+        reference_time: datetime
+    ) -> pd.DataFrame:
+        """
+        Normalize analysis_assim product to a long-format DataFrame.
+
+        DataFrame counterpart of normalize_analysis_assim.
+
+        Args:
+            df: Parsed NWM data with wide format
+            reference_time: Model cycle time
+
+        Returns:
+            DataFrame with RECORD_COLUMNS
+        """
+        return TimeNormalizer.normalize_product_df(df, "analysis_assim", reference_time)
+
     @staticmethod
     def records_to_dataframe(records: list[HydroRecord]) -> pd.DataFrame:
         """
@@ -375,6 +497,30 @@ class TimeAbstraction:
         else:
             return "outlook"
 
+    # Labels indexed by classify_timeframe_vec's category codes
+    TIMEFRAME_LABELS = np.array(["now", "today", "outlook"])
+
+    @staticmethod
+    def classify_timeframe_vec(forecast_hours) -> np.ndarray:
+        """
+        Classify an array of forecast hours into timeframe abstractions.
+
+        Vectorized classify_timeframe: one call labels a whole column of
+        forecast hours (e.g. DataFrame['forecast_hour']).
+
+        Args:
+            forecast_hours: Array-like of forecast hours (None/NaN for analysis)
+
+        Returns:
+            Array of 'now', 'today', or 'outlook', same length as input
+        """
+        hours = np.asarray(forecast_hours, dtype=np.float64)
+        is_now = np.isnan(hours) | (hours == 0)
+        is_today = (hours >= 1) & (hours <= 18)
+
+        codes = np.select([is_now, is_today], [0, 1], default=2)
+        return TimeAbstraction.TIMEFRAME_LABELS[codes]
+
     @staticmethod
     def get_valid_time_range_for_now(reference_time: datetime) -> tuple[datetime, datetime]:
         """
@@ -13,11 +13,6 @@ import logging
 import os
 import sys
 from datetime import datetime, timezone
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent.parent / 'src'
-sys.path.insert(0, str(src_path))
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
@@ -76,30 +71,24 @@ def test_end_to_end():
 
         logger.info(f"[OK] Inserted {records_inserted:,} records")
 
-        # Verify in database
+        # Verify in database (count and sample in one scan: the window
+        # total is computed before LIMIT applies)
         with scheduler.engine.begin() as conn:
-            result = conn.execute(text("""
-                SELECT COUNT(*) as count
-                FROM hydro_timeseries
-                WHERE source = 'analysis_assim'
-                AND valid_time = :valid_time
-            """), {'valid_time': test_time})
-
-            count = result.fetchone()[0]
-            logger.info(f"[OK] Database confirms {count:,} records")
-
-            # Show sample data
-            result = conn.execute(text("""
-                SELECT feature_id, variable, value, source, forecast_hour
+            rows = conn.execute(text("""
+                SELECT feature_id, variable, value, source, forecast_hour,
+                       COUNT(*) OVER () AS total
                 FROM hydro_timeseries
                 WHERE source = 'analysis_assim'
                 AND valid_time = :valid_time
                 ORDER BY feature_id, variable
                 LIMIT 10
-            """), {'valid_time': test_time})
+            """), {'valid_time': test_time}).fetchall()
+
+            count = rows[0].total if rows else 0
+            logger.info(f"[OK] Database confirms {count:,} records")
 
             logger.info("\nSample records from database:")
-            for row in result:
+            for row in rows:
                 logger.info(
                     f"  feature={row.feature_id}, var={row.variable}, "
                     f"val={row.value:.2f}, source={row.source}"
@@ -153,19 +142,18 @@ def test_end_to_end():
 
     try:
         with scheduler.engine.begin() as conn:
-            # Check variables
-            result = conn.execute(text("""
-                SELECT DISTINCT variable
+            # Check variables; raw NWM names (f###) are matched server-side
+            variables, invalid_vars = conn.execute(text("""
+                SELECT
+                    array_agg(DISTINCT variable ORDER BY variable),
+                    array_agg(DISTINCT variable) FILTER (WHERE variable ~ '^f[0-9]+$')
                 FROM hydro_timeseries
-                ORDER BY variable
-            """))
+            """)).one()
 
-            variables = [row[0] for row in result]
-            logger.info(f"Variables in database: {', '.join(variables)}")
+            logger.info(f"Variables in database: {', '.join(variables or [])}")
 
             # Verify no raw NWM names
-            invalid_vars = [v for v in variables if v.startswith('f') and len(v) > 1 and v[1:].isdigit()]
-            assert len(invalid_vars) == 0, f"Found f### references: {invalid_vars}"
+            assert not invalid_vars, f"Found f### references: {invalid_vars}"
 
             logger.info("[OK] No f### references - canonical abstraction verified")
 
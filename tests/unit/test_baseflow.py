@@ -13,10 +13,9 @@ Tests verify:
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 import sys
-import pytz
 
 # Add src to path
 src_path = Path(__file__).parent.parent.parent / 'src'
@@ -25,6 +24,9 @@ sys.path.insert(0, str(src_path))
 from metrics.baseflow import (
     compute_bdi,
     classify_bdi,
+    classify_bdi_batch,
+    classify_bdi_codes,
+    BDI_LABELS,
     compute_bdi_with_classification,
     explain_bdi,
     compute_bdi_timeseries,
@@ -135,6 +137,23 @@ def test_classify_storm_dominated():
     assert classify_bdi(0.0) == "storm_dominated"
 
 
+def test_classify_batch_matches_scalar():
+    """Batch classification should match classify_bdi element-wise"""
+    values = np.array([0.0, 0.2, 0.34, 0.35, 0.5, 0.64, 0.65, 0.85, 1.0, np.nan])
+
+    labels = classify_bdi_batch(values)
+
+    assert list(labels) == [classify_bdi(v) for v in values]
+
+
+def test_classify_codes_are_int8():
+    """Batch codes should be int8 indices into BDI_LABELS"""
+    codes = classify_bdi_codes(np.array([0.2, 0.5, 0.85]))
+
+    assert codes.dtype == np.int8
+    assert list(BDI_LABELS[codes]) == ["storm_dominated", "mixed", "groundwater_fed"]
+
+
 # Test Cases: BDI with Classification
 
 def test_bdi_with_classification_groundwater():
@@ -193,7 +212,7 @@ def test_explain_bdi_auto_classify():
 
 def test_bdi_timeseries_basic():
     """Test BDI time series computation"""
-    times = pd.date_range('2025-01-01', periods=5, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-01-01', periods=5, freq='H', tz=timezone.utc)
 
     q_btm = pd.Series([5.0, 5.5, 6.0, 5.5, 5.0], index=times)
     q_bucket = pd.Series([3.0, 3.2, 3.5, 3.2, 3.0], index=times)
@@ -208,7 +227,7 @@ def test_bdi_timeseries_basic():
 
 def test_bdi_timeseries_with_missing_data():
     """Test BDI time series with missing data (NaN)"""
-    times = pd.date_range('2025-01-01', periods=5, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-01-01', periods=5, freq='H', tz=timezone.utc)
 
     q_btm = pd.Series([5.0, np.nan, 6.0, 5.5, 5.0], index=times)
     q_bucket = pd.Series([3.0, 3.2, 3.5, 3.2, 3.0], index=times)
@@ -222,7 +241,7 @@ def test_bdi_timeseries_with_missing_data():
 
 def test_bdi_timeseries_variable_conditions():
     """Test BDI time series with changing conditions"""
-    times = pd.date_range('2025-01-01', periods=10, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-01-01', periods=10, freq='H', tz=timezone.utc)
 
     # Simulate storm event: baseflow stable, surface runoff increases then decreases
     q_btm = pd.Series([5.0]*10, index=times)
@@ -241,7 +260,7 @@ def test_bdi_timeseries_variable_conditions():
 
 def test_bdi_statistics_stable_stream():
     """Test BDI statistics for stable groundwater-fed stream"""
-    times = pd.date_range('2025-01-01', periods=24, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-01-01', periods=24, freq='H', tz=timezone.utc)
 
     # Very stable BDI (spring creek)
     bdi_series = pd.Series([0.92, 0.93, 0.91, 0.92, 0.93, 0.92]*4, index=times)
@@ -256,7 +275,7 @@ def test_bdi_statistics_stable_stream():
 
 def test_bdi_statistics_variable_stream():
     """Test BDI statistics for variable stream"""
-    times = pd.date_range('2025-01-01', periods=24, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-01-01', periods=24, freq='H', tz=timezone.utc)
 
     # Variable BDI (flashy stream)
     bdi_values = [0.8]*6 + [0.4]*6 + [0.2]*6 + [0.6]*6
@@ -0,0 +1,93 @@
+"""
+Unit Tests for Bulk COPY Utilities
+
+Tests verify:
+1. CSV encoding of rows (NULL marker, quoting)
+2. COPY statement construction
+3. Batching of large row streams
+"""
+
+import io
+from pathlib import Path
+import sys
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from database.bulk_copy import (
+    CSV_NULL,
+    copy_csv,
+    write_csv_rows
+)
+
+
+class FakeCursor:
+    """Records copy_expert calls"""
+
+    def __init__(self):
+        self.copies = []
+
+    def copy_expert(self, sql, file):
+        self.copies.append((sql, file.read()))
+
+
+class FakeConnection:
+    """Minimal psycopg2 connection stand-in"""
+
+    def __init__(self):
+        self.cursor_obj = FakeCursor()
+
+    def cursor(self):
+        return self.cursor_obj
+
+
+# Test Cases: CSV encoding
+
+def test_write_csv_rows_null_marker():
+    """Test that None is written as the NULL marker, not an empty string"""
+    buffer = io.StringIO()
+    count = write_csv_rows([(1, None, ''), (2, 'a,b', 3.5)], buffer)
+
+    assert count == 2
+    assert buffer.getvalue() == f'1,{CSV_NULL},\n2,"a,b",3.5\n'
+
+
+def test_write_csv_rows_empty():
+    """Test that no rows produce no output"""
+    buffer = io.StringIO()
+    assert write_csv_rows([], buffer) == 0
+    assert buffer.getvalue() == ''
+
+
+# Test Cases: COPY
+
+def test_copy_csv_statement():
+    """Test COPY statement targets the given table and columns"""
+    conn = FakeConnection()
+    count = copy_csv(conn, 'nhd.flowlines', ['nhdplusid', 'gnis_name'],
+                     [(1, 'Creek')])
+
+    assert count == 1
+    sql, data = conn.cursor_obj.copies[0]
+    assert sql.startswith('COPY nhd.flowlines (nhdplusid, gnis_name) FROM STDIN')
+    assert 'FORMAT csv' in sql
+    assert data == '1,Creek\n'
+
+
+def test_copy_csv_batches_generator():
+    """Test that a generator is split into one COPY per batch"""
+    conn = FakeConnection()
+    rows = ((i, i * 2) for i in range(25))
+    count = copy_csv(conn, 't', ['a', 'b'], rows, batch_size=10)
+
+    assert count == 25
+    assert len(conn.cursor_obj.copies) == 3
+    assert conn.cursor_obj.copies[-1][1].count('\n') == 5
+
+
+def test_copy_csv_no_rows():
+    """Test that an empty stream issues no COPY"""
+    conn = FakeConnection()
+    assert copy_csv(conn, 't', ['a'], []) == 0
+    assert conn.cursor_obj.copies == []
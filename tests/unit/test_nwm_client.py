@@ -10,12 +10,15 @@ Tests the NWM client without full ingestion to verify it can:
 import logging
 import sys
 from datetime import datetime, timedelta
-from pathlib import Path
+from unittest import mock
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+import xarray as xr
 
-from src.ingest.nwm_client import NWMClient
+from ingest.nwm_client import NWMClient
 
 # Configure logging
 logging.basicConfig(
@@ -50,19 +53,38 @@ def test_nwm_client():
         logger.info(f"[OK] Downloaded: {filepath.name}")
         logger.info(f"     Reference time: {test_time}")
 
-        # Parse the file
+        # Parse the file in chunks, keeping only running statistics
+        # (memory stays bounded by the chunk size, not the reach count)
         logger.info(f"\nParsing NetCDF file...")
-        df = client.parse_channel_rt(filepath)
-        logger.info(f"[OK] Parsed {len(df):,} stream reaches")
-        logger.info(f"\nSample data (first 5 reaches):")
-        print(df.head())
+        reaches = 0
+        count = 0
+        total = 0.0
+        flow_min = float('inf')
+        flow_max = float('-inf')
+        for i, chunk in enumerate(client.iter_channel_rt(filepath)):
+            if i == 0:
+                logger.info(f"\nSample data (first 5 reaches):")
+                print(chunk.head())
+
+            reaches += len(chunk)
+            flows = chunk['streamflow_m3s'].dropna()
+            if flows.empty:
+                continue
+            count += len(flows)
+            total += flows.sum()
+            flow_min = min(flow_min, flows.min())
+            flow_max = max(flow_max, flows.max())
+
+        logger.info(f"[OK] Parsed {reaches:,} stream reaches")
 
         # Show statistics
         logger.info(f"\nStreamflow statistics:")
-        logger.info(f"  Min:    {df['streamflow_m3s'].min():.2f} m³/s")
-        logger.info(f"  Mean:   {df['streamflow_m3s'].mean():.2f} m³/s")
-        logger.info(f"  Median: {df['streamflow_m3s'].median():.2f} m³/s")
-        logger.info(f"  Max:    {df['streamflow_m3s'].max():.2f} m³/s")
+        if count:
+            logger.info(f"  Min:    {flow_min:.2f} m³/s")
+            logger.info(f"  Mean:   {total / count:.2f} m³/s")
+            logger.info(f"  Max:    {flow_max:.2f} m³/s")
+        else:
+            logger.info("  (no non-missing streamflow values)")
 
         logger.info(f"\n[OK] Test 1 PASSED")
 
@@ -80,31 +102,32 @@ def test_nwm_client():
         # This may fail if the file isn't available yet
         today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # Try recent cycles if today's isn't available
+        # Probe recent cycles with HEAD requests; download only the first
+        # one that is published
+        ref_time = None
         for days_ago in range(0, 3):
-            ref_time = today - timedelta(days=days_ago)
-            try:
-                filepath = client.download_product(
-                    product="short_range",
-                    reference_time=ref_time,
-                    forecast_hour=1
-                )
-                logger.info(f"[OK] Downloaded: {filepath.name}")
-                logger.info(f"     Reference time: {ref_time}")
-
-                # Parse it
-                df = client.parse_channel_rt(filepath)
-                logger.info(f"[OK] Parsed {len(df):,} stream reaches")
-
-                logger.info(f"\n[OK] Test 2 PASSED")
+            candidate = today - timedelta(days=days_ago)
+            if client.url_exists("short_range", candidate, forecast_hour=1):
+                ref_time = candidate
                 break
+            logger.debug(f"Cycle {candidate} not available, trying earlier...")
+
+        if ref_time is None:
+            raise RuntimeError("No short_range f001 found in the last 3 days")
+
+        filepath = client.download_product(
+            product="short_range",
+            reference_time=ref_time,
+            forecast_hour=1
+        )
+        logger.info(f"[OK] Downloaded: {filepath.name}")
+        logger.info(f"     Reference time: {ref_time}")
+
+        # Parse it
+        df = client.parse_channel_rt(filepath)
+        logger.info(f"[OK] Parsed {len(df):,} stream reaches")
 
-            except Exception as e:
-                if days_ago < 2:
-                    logger.debug(f"Cycle {ref_time} not available, trying earlier...")
-                    continue
-                else:
-                    raise
+        logger.info(f"\n[OK] Test 2 PASSED")
 
     except Exception as e:
         logger.warning(f"[SKIPPED] Test 2: {e}")
@@ -119,6 +142,103 @@ def test_nwm_client():
     return True
 
 
+# Chunked parsing (local NetCDF, no network)
+
+N_REACHES = 10
+
+
+@pytest.fixture
+def channel_rt_file(tmp_path):
+    """Small channel_rt-style NetCDF file with a scalar reference_time"""
+    rng = np.random.default_rng(0)
+    ds = xr.Dataset(
+        {
+            'streamflow': ('feature_id', rng.random(N_REACHES)),
+            'velocity': ('feature_id', rng.random(N_REACHES)),
+            'qSfcLatRunoff': ('feature_id', rng.random(N_REACHES)),
+            'qBucket': ('feature_id', rng.random(N_REACHES)),
+            'qBtmVertRunoff': ('feature_id', rng.random(N_REACHES)),
+            'reference_time': ((), np.datetime64('2026-01-02T21:00:00', 'ns')),
+        },
+        coords={'feature_id': np.arange(101, 101 + N_REACHES, dtype=np.int32)},
+    )
+    path = tmp_path / 'nwm.t21z.analysis_assim.channel_rt.tm00.conus.nc'
+    ds.to_netcdf(path)
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 4, N_REACHES, N_REACHES + 5])
+def test_iter_channel_rt_matches_full_read(tmp_path, channel_rt_file, chunk_size):
+    """Concatenated chunks should equal parse_channel_rt, including a partial last chunk"""
+    client = NWMClient(cache_dir=tmp_path)
+
+    full = client.parse_channel_rt(channel_rt_file)
+    chunks = list(client.iter_channel_rt(channel_rt_file, chunk_size=chunk_size))
+
+    assert len(chunks) == -(-N_REACHES // chunk_size)
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True),
+        full.reset_index(drop=True),
+    )
+
+
+def test_iter_channel_rt_feature_filter(tmp_path, channel_rt_file):
+    """feature_ids should filter each chunk the same way as the full read"""
+    client = NWMClient(cache_dir=tmp_path)
+    wanted = [102, 105, 106, 110]
+
+    full = client.parse_channel_rt(channel_rt_file, feature_ids=wanted)
+    chunked = pd.concat(
+        client.iter_channel_rt(channel_rt_file, chunk_size=3, feature_ids=wanted),
+        ignore_index=True,
+    )
+
+    assert list(chunked['feature_id']) == wanted
+    pd.testing.assert_frame_equal(chunked, full.reset_index(drop=True))
+
+
+# Availability probe (mocked HEAD, no network)
+
+PROBE_TIME = datetime(2026, 1, 2, 21, 0, 0)
+
+
+@pytest.mark.parametrize('status_code, expected', [(200, True), (404, False)])
+def test_url_exists_status(tmp_path, status_code, expected):
+    """url_exists should reflect the HEAD status of the product URL"""
+    client = NWMClient(cache_dir=tmp_path)
+    response = mock.Mock(status_code=status_code, ok=status_code < 400)
+
+    with mock.patch('ingest.nwm_client.requests.head', return_value=response) as head:
+        assert client.url_exists("short_range", PROBE_TIME, forecast_hour=1) is expected
+
+    url, _ = client._product_url("short_range", PROBE_TIME, 1)
+    head.assert_called_once_with(url, timeout=5, allow_redirects=True)
+
+
+def test_url_exists_timeout(tmp_path, caplog):
+    """A timed-out HEAD should report the file as unavailable and be logged"""
+    client = NWMClient(cache_dir=tmp_path)
+
+    with mock.patch('ingest.nwm_client.requests.head',
+                    side_effect=requests.exceptions.Timeout("timed out")):
+        with caplog.at_level(logging.DEBUG, logger='ingest.nwm_client'):
+            assert client.url_exists("short_range", PROBE_TIME, forecast_hour=1) is False
+
+    assert "timed out" in caplog.text
+
+
+def test_url_exists_invalid_product(tmp_path):
+    """Invalid parameters should raise before any request is sent"""
+    client = NWMClient(cache_dir=tmp_path)
+
+    with mock.patch('ingest.nwm_client.requests.head') as head:
+        with pytest.raises(ValueError):
+            client.url_exists("short_range", PROBE_TIME, forecast_hour=99)
+
+    head.assert_not_called()
+
+
 if __name__ == "__main__":
     success = test_nwm_client()
     sys.exit(0 if success else 1)
@@ -12,10 +12,9 @@ Tests verify:
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
-import pytz
 
 # Add src to path
 src_path = Path(__file__).parent.parent.parent / 'src'
@@ -23,7 +22,9 @@ sys.path.insert(0, str(src_path))
 
 from metrics.rising_limb import (
     detect_rising_limb,
+    detect_rising_limb_values,
     RisingLimbConfig,
+    RisingLimbState,
     explain_detection,
     load_default_config
 )
@@ -61,7 +62,7 @@ def strict_config():
 @pytest.fixture
 def time_index():
     """24-hour time series index (UTC)"""
-    return pd.date_range('2025-01-01', periods=24, freq='H', tz=pytz.UTC)
+    return pd.date_range('2025-01-01', periods=24, freq='H', tz=timezone.utc)
 
 
 # Test Cases: Basic Detection
@@ -201,7 +202,7 @@ def test_all_nan_values(default_config, time_index):
 
 def test_series_shorter_than_min_duration(default_config):
     """Test handling of series shorter than min_duration"""
-    times = pd.date_range('2025-01-01', periods=2, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-01-01', periods=2, freq='H', tz=timezone.utc)
     flows = pd.Series([10, 20], index=times)
 
     detected, intensity = detect_rising_limb(flows, default_config)
@@ -214,7 +215,7 @@ def test_missing_data_gaps(default_config):
     """Test handling of gaps in time series"""
     # Create irregular time series with gaps
     times = pd.DatetimeIndex([
-        datetime(2025, 1, 1, i, 0, 0, tzinfo=pytz.UTC)
+        datetime(2025, 1, 1, i, 0, 0, tzinfo=timezone.utc)
         for i in [0, 1, 2, 6, 7, 8, 9, 10, 11, 12]  # Gap between hour 2 and 6
     ])
     flows = pd.Series([10, 11, 13, 20, 25, 30, 32, 33, 33, 33], index=times)
@@ -242,7 +243,7 @@ def test_single_spike_not_sustained(default_config, time_index):
 def test_snowmelt_hydrograph(default_config):
     """Test detection in typical snowmelt hydrograph pattern"""
     # Gradual morning rise, afternoon peak, evening decline
-    times = pd.date_range('2025-05-15 00:00', periods=24, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-05-15 00:00', periods=24, freq='H', tz=timezone.utc)
 
     # Baseflow at night, gradual rise during day, peak afternoon, decline evening
     flows = pd.Series([
@@ -260,7 +261,7 @@ def test_snowmelt_hydrograph(default_config):
 
 def test_stormflow_hydrograph(default_config):
     """Test detection in typical stormflow hydrograph"""
-    times = pd.date_range('2025-06-10 00:00', periods=24, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-06-10 00:00', periods=24, freq='H', tz=timezone.utc)
 
     # Baseflow → rapid storm rise → peak → recession
     flows = pd.Series([
@@ -279,7 +280,7 @@ def test_stormflow_hydrograph(default_config):
 
 def test_baseflow_recession_no_detection(default_config):
     """Test that baseflow recession does not trigger detection"""
-    times = pd.date_range('2025-07-20 00:00', periods=24, freq='H', tz=pytz.UTC)
+    times = pd.date_range('2025-07-20 00:00', periods=24, freq='H', tz=timezone.utc)
 
     # Smooth exponential decay (typical baseflow recession)
     flows = pd.Series([
@@ -367,7 +368,7 @@ def test_explain_detection_not_detected():
 def test_unsorted_time_index(default_config):
     """Test that function handles unsorted time index"""
     times = pd.DatetimeIndex([
-        datetime(2025, 1, 1, i, 0, 0, tzinfo=pytz.UTC)
+        datetime(2025, 1, 1, i, 0, 0, tzinfo=timezone.utc)
         for i in [0, 2, 1, 3, 4, 5, 6, 7]  # Unsorted: 0,2,1,3,4,5,6,7
     ])
     flows = pd.Series([10, 13, 11, 16, 20, 25, 30, 32], index=times)
@@ -415,6 +416,87 @@ def test_just_below_threshold(default_config, time_index):
     assert detected is False, "Should not detect below threshold"
 
 
+# Test Cases: Array Input
+
+def test_values_matches_series(default_config, time_index):
+    """Test that the array entry point agrees with the Series one"""
+    patterns = [
+        [10, 10, 11, 13, 16, 20, 25, 30, 32, 33] + [33]*14,
+        [10]*24,
+        [10, 10, 15, 25, 40, 60, 85, 100] + [100]*16,
+        [10, 10, 10.4, 10.8, 11.2] + [11.2]*19,
+    ]
+
+    for values in patterns:
+        flows = pd.Series(values, index=time_index)
+        expected = detect_rising_limb(flows, default_config)
+
+        result = detect_rising_limb_values(
+            np.array(values, dtype=float),
+            time_index.asi8,
+            default_config
+        )
+
+        assert result == expected, f"Mismatch for {values[:8]}"
+
+
+@pytest.mark.parametrize('unit', ['s', 'ms', 'us'])
+def test_non_ns_index_matches_ns(default_config, time_index, unit):
+    """Test that a non-nanosecond DatetimeIndex gives the same result"""
+    flows = pd.Series(
+        [10, 10, 11, 13, 16, 20, 25, 30, 32, 33] + [33]*14,
+        index=time_index
+    )
+
+    expected = detect_rising_limb(flows, default_config)
+    result = detect_rising_limb(flows.set_axis(time_index.as_unit(unit)), default_config)
+
+    assert expected == (True, "moderate")
+    assert result == expected, f"Mismatch for unit={unit}"
+
+
+def test_values_unsorted_and_missing(default_config, time_index):
+    """Test that arrays are sorted by time and NaN values are skipped"""
+    values = np.array([10, 10, 11, 13, 16, 20, 25, 30] + [30]*16, dtype=float)
+    order = np.random.default_rng(0).permutation(len(values))
+
+    shuffled = detect_rising_limb_values(
+        values[order], time_index.asi8[order], default_config
+    )
+    assert shuffled == detect_rising_limb_values(values, time_index.asi8, default_config)
+    assert shuffled[0] is True
+
+    detected, intensity = detect_rising_limb_values(
+        np.full(24, np.nan), time_index.asi8, default_config
+    )
+    assert detected is False
+    assert intensity is None
+
+
+def test_state_chunked_matches_values(default_config, time_index):
+    """Test that chunked updates give the same result as one call"""
+    patterns = [
+        [10, 10, 11, 13, 16, 20, 25, 30, 32, 33] + [33]*14,
+        [10]*24,
+        [10, 10, 15, 25, 40, 60, 85, 100] + [100]*16,
+        [10, 10, 10.4, 10.8, 11.2] + [11.2]*19,
+    ]
+
+    for values in patterns:
+        values = np.array(values, dtype=float)
+        expected = detect_rising_limb_values(values, time_index.asi8, default_config)
+
+        # Chunk boundaries that split rising runs
+        for chunk_size in (1, 2, 5):
+            state = RisingLimbState(default_config)
+            for start in range(0, len(values), chunk_size):
+                state.update(
+                    values[start:start + chunk_size],
+                    time_index.asi8[start:start + chunk_size]
+                )
+            assert state.result() == expected, f"Chunk size {chunk_size} mismatch for {values[:8]}"
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "--tb=short"])
@@ -90,6 +90,14 @@ def test_time_normalizer():
     assert all(r.valid_time.tzinfo is not None for r in records), \
         "valid_time must be timezone-aware"
 
+    # DataFrame variant: one broadcast UTC column
+    direct_df = TimeNormalizer.normalize_product_df(
+        sample_df, "short_range", reference_time, forecast_hour
+    )
+    assert str(direct_df['valid_time'].dtype) == 'datetime64[ns, UTC]', \
+        "valid_time column must be datetime64[ns, UTC]"
+    assert (direct_df['valid_time'] == expected_valid_time).all()
+
     logger.info(f"[OK] Created {len(records)} records")
     logger.info(f"     Valid time: {records[0].valid_time}")
     logger.info(f"     Expected: {expected_valid_time}")
@@ -111,6 +119,13 @@ def test_time_normalizer():
     assert all(r.source == "medium_range_blend" for r in records), \
         "All records should have correct source"
 
+    direct_df = TimeNormalizer.normalize_product_df(
+        sample_df, "medium_range_blend", reference_time, forecast_hour
+    )
+    assert str(direct_df['valid_time'].dtype) == 'datetime64[ns, UTC]', \
+        "valid_time column must be datetime64[ns, UTC]"
+    assert (direct_df['valid_time'] == expected_valid_time).all()
+
     logger.info(f"[OK] Created {len(records)} records")
     logger.info(f"     Valid time: {records[0].valid_time}")
     logger.info(f"     Expected: {expected_valid_time}")
@@ -133,6 +148,29 @@ def test_time_normalizer():
     logger.info(f"\nSample rows:")
     print(df.head(10))
 
+    # DataFrame variants must match the record path (up to row order)
+    sort_keys = ['feature_id', 'variable']
+    direct_df = TimeNormalizer.normalize_product_df(
+        sample_df, "medium_range_blend", reference_time, 72
+    )
+    pd.testing.assert_frame_equal(
+        direct_df.sort_values(sort_keys).reset_index(drop=True),
+        df.sort_values(sort_keys).reset_index(drop=True),
+        check_dtype=False
+    )
+
+    analysis_df = TimeNormalizer.normalize_analysis_assim_df(sample_df, reference_time)
+    expected_df = TimeNormalizer.records_to_dataframe(
+        TimeNormalizer.normalize_analysis_assim(sample_df, reference_time)
+    )
+    pd.testing.assert_frame_equal(
+        analysis_df.sort_values(sort_keys).reset_index(drop=True),
+        expected_df.sort_values(sort_keys).reset_index(drop=True),
+        check_dtype=False
+    )
+
+    logger.info(f"[OK] normalize_*_df matches records_to_dataframe ({len(direct_df)} rows)")
+
     # Test 5: Time abstractions
     logger.info("\nTest 5: Time abstractions")
     logger.info("-" * 60)
@@ -147,6 +185,11 @@ def test_time_normalizer():
     assert TimeAbstraction.classify_timeframe(18) == "today"
     assert TimeAbstraction.classify_timeframe(72) == "outlook"
 
+    # Vectorized classification matches the scalar version
+    hours = [None, 0, 1, 18, 19, 72]
+    labels = TimeAbstraction.classify_timeframe_vec(hours)
+    assert list(labels) == [TimeAbstraction.classify_timeframe(h) for h in hours]
+
     logger.info(f"[OK] Time abstraction mappings:")
     logger.info(f"     'now' -> {TimeAbstraction.get_now_source()}")
     logger.info(f"     'today' -> {TimeAbstraction.get_today_source()}")
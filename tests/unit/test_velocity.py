@@ -10,6 +10,7 @@ Tests verify:
 """
 
 import pytest
+import numpy as np
 from pathlib import Path
 import sys
 
@@ -20,6 +21,9 @@ sys.path.insert(0, str(src_path))
 from metrics.velocity import (
     SpeciesVelocityConfig,
     classify_velocity,
+    classify_velocity_batch,
+    classify_velocity_codes,
+    VELOCITY_LABELS,
     compute_gradient_score,
     explain_velocity_suitability,
     load_species_config
@@ -411,6 +415,41 @@ def test_score_decreases_away_from_optimal_above():
         assert scores[i] >= scores[i+1], f"Score should decrease: {scores}"
 
 
+# Test Cases: Batch Classification
+
+def test_batch_matches_scalar(trout_config):
+    """Batch classification should match classify_velocity element-wise"""
+    velocities = np.array([-0.2, 0.0, 0.05, 0.1, 0.2, 0.3, 0.5, 0.8, 1.0, 1.5, 2.0, np.nan])
+
+    suitable, classification, score = classify_velocity_batch(velocities, trout_config)
+
+    for i, v in enumerate(velocities):
+        expected = classify_velocity(v, trout_config)
+        assert suitable[i] == expected[0], f"suitable mismatch at {v}"
+        assert classification[i] == expected[1], f"classification mismatch at {v}"
+        assert abs(score[i] - expected[2]) < 1e-12, f"score mismatch at {v}"
+
+
+def test_batch_zero_width_ranges():
+    """Batch classification should handle min_optimal == min_tolerable"""
+    config = SpeciesVelocityConfig("Test", 0.3, 0.8, 0.3, 0.8)
+    velocities = np.array([0.1, 0.3, 0.5, 0.8, 1.0])
+
+    suitable, classification, score = classify_velocity_batch(velocities, config)
+
+    assert list(classification) == ["too_slow", "optimal", "optimal", "optimal", "too_fast"]
+    assert list(suitable) == [False, True, True, True, False]
+    assert list(score) == [0.0, 1.0, 1.0, 1.0, 0.0]
+
+
+def test_batch_codes_are_int8(trout_config):
+    """Batch codes should be int8 indices into VELOCITY_LABELS"""
+    _, codes, _ = classify_velocity_codes(np.array([0.05, 0.5, 1.0, 2.0]), trout_config)
+
+    assert codes.dtype == np.int8
+    assert list(VELOCITY_LABELS[codes]) == ["too_slow", "optimal", "fast", "too_fast"]
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "--tb=short"])